@@ -0,0 +1,89 @@
+"""
+Benchmark building, rendering and traversing boards from 10x10 up to 2000x2000.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_board_scale
+"""
+import time
+import tracemalloc
+from board import Board
+from character import Character
+from renderer import Renderer
+
+
+def build(size: int) -> Board:
+    """
+    Build a square board with its bosses scaled to its size.
+
+    :param size: a positive integer
+    :precondition: size must be a positive integer greater than 3
+    :postcondition: returns a new size x size board with seed 0
+    :return: a Board object
+    """
+    return Board(size, size, Board.scaled_coords(size, size, 0.4), Board.scaled_coords(size, size, 0.7), seed=0)
+
+
+def traverse(board: Board) -> int:
+    """
+    Walk a character east along the bottom row and north up the last column to the final boss.
+
+    Every room on the way is entered, described and marked as solved, as Game.play would do.
+
+    :param board: a Board object with the final boss in its default position
+    :precondition: board must be a Board object with the final boss in its default position
+    :postcondition: marks every room on the path as solved
+    :return: the number of moves made
+    """
+    character = Character("Benchmark")
+    moves = 0
+
+    for direction in ("east", "north"):
+        while board.is_valid_move(direction, character):
+            character.move(direction, board)
+            room = board.get_board()[character.get_position()]
+            room["description"]
+            room["solved"] = True
+            moves += 1
+
+    return moves
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{'size':<12}{'build ms':>10}{'full ms':>10}{'full MB':>10}{'view ms':>10}{'walk ms':>10}"
+          f"{'moves':>8}{'peak MB':>10}")
+
+    for size in (10, 100, 500, 1000, 2000):
+        start = time.perf_counter()
+        board = build(size)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        frame = Renderer.encode(board.map_rows((1, 1)))
+        full_time = time.perf_counter() - start
+        frame_size = len(frame.encode("utf-8"))
+        del frame
+
+        start = time.perf_counter()
+        Renderer.encode(board.frame_rows((1, 1), (21, 11), (40, 10)))
+        view_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        moves = traverse(board)
+        walk_time = time.perf_counter() - start
+
+        tracemalloc.start()
+        traverse(build(size))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{f'{size}x{size}':<12}{build_time * 1000:>10.1f}{full_time * 1000:>10.1f}"
+              f"{frame_size / 2 ** 20:>10.2f}{view_time * 1000:>10.2f}{walk_time * 1000:>10.1f}{moves:>8}"
+              f"{peak / 2 ** 20:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark loading large content packs from json, from their compiled cache, and streamed from line-delimited json.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_content
+"""
+import json
+import os
+import tempfile
+import time
+from content import ContentRegistry, StreamingPack
+
+
+def write_pack(directory: str, size: int) -> None:
+    """
+    Write a riddles pack of size synthetic riddles into directory.
+
+    :param directory: a path as a string
+    :param size: a positive integer
+    :precondition: directory must be an existing directory
+    :precondition: size must be a positive non-zero integer
+    :postcondition: writes riddles.json into directory
+    """
+    riddles = [{
+        "question": f"Riddle number {index}.\n\nOf what do I speak?",
+        "options": ["Lake", "River", "Eye"],
+        "answer": "River",
+        "ability": "Dark Aether"
+    } for index in range(size)]
+
+    with open(os.path.join(directory, "riddles.json"), "w") as file_object:
+        json.dump(riddles, file_object)
+
+
+def measure(directory: str, cache_directory: str) -> tuple:
+    """
+    Load the riddles pack with a fresh registry, read the records a board uses, and return how long it took.
+
+    :param directory: a path as a string
+    :param cache_directory: a path as a string
+    :precondition: directory must hold a riddles.json or riddles.jsonl file
+    :postcondition: loads the riddles pack, compiling or indexing it if needed
+    :return: a tuple of the source of the pack as a string and the elapsed seconds
+    """
+    registry = ContentRegistry(directory, cache_directory)
+    start = time.perf_counter()
+    registry.pack("riddles")[:27]
+    elapsed = time.perf_counter() - start
+
+    if registry.sources["riddles"] == "jsonl":
+        registry.pack("riddles").close()
+
+    return registry.sources["riddles"], elapsed
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{'records':>10}{'json ms':>12}{'compiled ms':>14}{'jsonl ms':>12}{'indexed ms':>12}")
+
+    for size in (26, 10_000, 100_000, 1_000_000):
+        with tempfile.TemporaryDirectory() as directory:
+            write_pack(directory, size)
+            cache_directory = os.path.join(directory, "cache")
+
+            _, json_time = measure(directory, cache_directory)
+            _, compiled_time = measure(directory, cache_directory)
+
+            StreamingPack.convert(os.path.join(directory, "riddles.json"), os.path.join(directory, "riddles.jsonl"))
+            _, lines_time = measure(directory, cache_directory)
+            _, indexed_time = measure(directory, cache_directory)
+
+            print(f"{size:>10}{json_time * 1000:>12.1f}{compiled_time * 1000:>14.1f}{lines_time * 1000:>12.1f}"
+                  f"{indexed_time * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
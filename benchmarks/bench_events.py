@@ -0,0 +1,58 @@
+"""
+Benchmark fights with no event subscriber, with an aggregator and with a ring buffer.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_events
+"""
+import contextlib
+import io
+import time
+from character import Character
+from enemies import Enemy
+from events import EventAggregator, EventBus, EventRing
+
+FIGHTS = 20_000
+ENEMY = {"name": "Knight", "max_hp": 125, "current_hp": 125, "level": 2, "item": None}
+
+
+def fight(count: int) -> float:
+    """
+    Auto-resolve count fights and return the time they took.
+
+    :param count: a positive integer
+    :precondition: count must be a positive integer
+    :postcondition: fights the same enemy count times with new characters, discarding the printed dialog
+    :return: the number of seconds the fights took, as a float
+    """
+    enemy = Enemy(ENEMY)
+    characters = [Character("Bench") for _ in range(count)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for character in characters:
+            enemy.auto_resolve(character)
+
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    bus = EventBus.shared()
+    baseline = fight(FIGHTS)
+    print(f"{'subscriber':<12}{'us/fight':>10}{'overhead':>10}")
+    print(f"{'none':<12}{baseline / FIGHTS * 1e6:>10.2f}{'':>10}")
+
+    for name, subscriber in (("aggregator", EventAggregator()), ("ring", EventRing())):
+        bus.subscribe(subscriber)
+        try:
+            elapsed = fight(FIGHTS)
+        finally:
+            bus.unsubscribe(subscriber)
+        print(f"{name:<12}{elapsed / FIGHTS * 1e6:>10.2f}{(elapsed / baseline - 1) * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
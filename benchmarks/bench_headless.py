@@ -0,0 +1,61 @@
+"""
+Benchmark headless games played on in-memory consoles.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_headless
+"""
+import random
+import time
+from console import MemoryConsole, ScriptedConsole
+from game import Game
+from pacing import HeadlessPacer
+
+GAMES = 2000
+TURNS = 50
+
+
+def random_script(seed: int, turns: int):
+    """
+    Return a script that answers every prompt with a random command, then stops.
+
+    :param seed: an integer
+    :param turns: a positive integer
+    :precondition: turns must be a positive integer
+    :postcondition: returns a script that names the character, then answers turns prompts before ending the input
+    :return: a callable accepted by ScriptedConsole
+    """
+    rng = random.Random(seed)
+    answers = iter(["Bench"] + [rng.choice("1234") for _ in range(turns)])
+
+    return lambda prompt: next(answers, None)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    pacer = HeadlessPacer()
+    print(f"{'game':<36}{'games':>8}{'seconds':>10}{'games/s':>10}")
+
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        Game.play(seed=seed, pacer=pacer, console=MemoryConsole(["Bench", "s", "q"], record=False))
+    elapsed = time.perf_counter() - start
+    print(f"{'story, stats and quit':<36}{GAMES:>8}{elapsed:>10.3f}{GAMES / elapsed:>10.0f}")
+
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        Game.play(seed=seed, pacer=pacer, console=ScriptedConsole(random_script(seed, TURNS)))
+    elapsed = time.perf_counter() - start
+    print(f"{f'{TURNS} random answers':<36}{GAMES:>8}{elapsed:>10.3f}{GAMES / elapsed:>10.0f}")
+
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        Game.play(seed=seed, pacer=pacer, console=ScriptedConsole(random_script(seed, TURNS), silent=True))
+    elapsed = time.perf_counter() - start
+    print(f"{f'{TURNS} random answers, silent':<36}{GAMES:>8}{elapsed:>10.3f}{GAMES / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
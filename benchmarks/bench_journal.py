@@ -0,0 +1,118 @@
+"""
+Benchmark what saving a game costs every turn, and how long resuming it takes as the game grows longer.
+
+The games are played by a bot on seeded boards. Resuming is measured after a crash, so the journal still holds every
+entry appended since the last snapshot.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_journal
+"""
+import os
+import tempfile
+import time
+from bot import Bot, GreedyExplorer
+from console import MemoryConsole
+from game import Game
+from journal import Journal
+from pacing import HeadlessPacer
+
+GAMES = 10
+TURNS = 2000
+LENGTHS = (1000, 10000, 50000)
+
+
+class CrashingJournal(Journal):
+    """
+    A journal whose game is ended by a crash instead of being closed.
+    """
+
+    def close(self, delete: bool = False) -> None:
+        """
+        Leave the journal as a crash would.
+
+        :param delete: ignored
+        :postcondition: hands the entries of the last committed turn to the operating system, without a last snapshot
+        """
+        self.file.flush()
+
+
+def play(inputs: list, seed: int, journal: Journal = None) -> float:
+    """
+    Play inputs on the board with seed.
+
+    :param inputs: a list of strings
+    :param seed: an integer
+    :param journal: a Journal object, or None to save nothing. Default is None
+    :precondition: inputs must be the inputs of a game on the board with seed
+    :postcondition: plays the game without pauses or output
+    :return: the seconds the game took, as a float
+    """
+    start = time.perf_counter()
+    Game.play(seed=seed, pacer=HeadlessPacer(), console=MemoryConsole(inputs, record=False), journal=journal)
+    return time.perf_counter() - start
+
+
+def clear(directory: str) -> None:
+    """
+    Delete every file in directory.
+
+    :param directory: the path of a directory
+    :precondition: directory must only hold files
+    :postcondition: directory is empty
+    """
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "save")
+
+    games = []
+    for seed in range(GAMES):
+        bot = Bot(GreedyExplorer(), max_turns=TURNS)
+        bot.play(seed)
+        games.append((bot.inputs, seed))
+
+    print(f"{'journal':<16}{'turns':>8}{'seconds':>10}{'us/turn':>10}{'entries':>10}{'snapshots':>11}"
+          f"{'overhead':>12}")
+    baseline = None
+    for label, snapshot_every in (("none", None), ("every 64", 64), ("every 256", 256), ("every 1024", 1024)):
+        seconds, entries, snapshots = 0.0, 0, 0
+        for inputs, seed in games:
+            clear(directory)
+            journal = Journal(path, snapshot_every) if snapshot_every else None
+            seconds += play(inputs, seed, journal)
+            if journal is not None:
+                entries += journal.sequence
+                snapshots += journal.snapshots
+        turns = sum(len(inputs) for inputs, seed in games)
+        baseline = baseline or seconds
+        print(f"{label:<16}{turns:>8}{seconds:>10.3f}{seconds / turns * 1e6:>10.1f}{entries:>10}{snapshots:>11}"
+              f"{f'+{(seconds - baseline) / turns * 1e6:.1f} us' if snapshot_every else '':>12}")
+
+    print()
+    print(f"{'turns played':<16}{'entries':>10}{'tail':>8}{'resume ms':>11}")
+    for length in LENGTHS:
+        bot = Bot(GreedyExplorer(), max_turns=length)
+        bot.play(0)
+        clear(directory)
+
+        crashed = CrashingJournal(path)
+        play(bot.inputs, 0, crashed)
+
+        journal = Journal(path)
+        tail = sum(1 for entry in journal.tail() if entry[0] > crashed.sequence - crashed.since_snapshot)
+        start = time.perf_counter()
+        journal.resume()
+        elapsed = time.perf_counter() - start
+        journal.close()
+        print(f"{length:<16}{crashed.sequence:>10}{tail:>8}{elapsed * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark printing the map, the character stats and ascii art, with and without colors.
+
+Every path is written to a line-buffered os.devnull, like a terminal, through a terminal console that buffers its
+output until it is flushed. It is compared with printing every line as it comes, building the colors on every call
+and every map cell on its own, as the game used to.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_output
+"""
+import contextlib
+import os
+import time
+from unittest.mock import patch
+from board import Board
+from character import Character
+from console import Console, TerminalConsole
+from helpers import Helpers
+from renderer import Renderer
+from story import Story
+
+REPEATS = 300
+
+
+def print_in_color_unbuffered(value, color: str, end: str = "\n") -> None:
+    """
+    Print value in color the way the game used to.
+
+    :param value: a python object of any type that will be printed to stdout
+    :param color: one of the colors of Renderer.COLORS
+    :param end: a string representing the last characters to be printed. Default value is "\n".
+    :postcondition: prints value to stdout in color, rebuilding the escape sequences on every call
+    """
+    colors = {
+        "purple": '\033[95m',
+        "blue": '\033[94m',
+        "cyan": '\033[96m',
+        "green": '\033[92m',
+        "yellow": '\033[93m',
+        "red": '\033[91m',
+        "end_color": '\033[0m',
+    }
+
+    print(colors[color.lower()] + str(value) + colors["end_color"], end=end)
+
+
+def print_plain_unbuffered(value="", end: str = "\n") -> None:
+    """
+    Print value the way the game used to.
+
+    :param value: a python object of any type that will be printed to stdout. Default is an empty string
+    :param end: a string representing the last characters to be printed. Default value is "\n".
+    :postcondition: prints value to stdout
+    """
+    print(value, end=end)
+
+
+def map_row_per_cell(board: Board, y_coord: int, x_coords: range, player_coords: tuple) -> list:
+    """
+    Return one row of the map by looking up every cell on its own, as the game used to.
+
+    :param board: a Board object
+    :param y_coord: an integer between 0 and rows + 1 inclusive
+    :param x_coords: a range of x coordinates on the map
+    :param player_coords: a tuple of positive non-zero integers
+    :postcondition: returns the same row as board.map_row
+    :return: a list of cells
+    """
+    return [board.map_cell((x_coord, y_coord), player_coords) for x_coord in x_coords]
+
+
+def paths() -> tuple:
+    """
+    Return the printing paths to benchmark.
+
+    :postcondition: returns the name of every path along with a callable that prints it once
+    :return: a tuple of (name, callable) tuples
+    """
+    small = Board(10, 10, (4, 4), (7, 7), seed=0)
+    large = Board(1000, 1000, Board.scaled_coords(1000, 1000, 0.4), Board.scaled_coords(1000, 1000, 0.7), seed=0)
+    character = Character("Bench")
+    art = tuple(beat for beat in Story.OPENING if len(beat.text) > 1000)
+
+    return (
+        ("map 10x10", lambda: small.print_board((1, 1))),
+        ("map 1000x1000, 41x21 view", lambda: large.print_board((500, 500), (41, 21), (40, 10))),
+        ("stats", lambda: character.show_stats(small)),
+        ("ascii art", lambda: [Helpers.print_in_color(beat.text, beat.color) for beat in art]),
+    )
+
+
+def measure(function, repeats: int) -> float:
+    """
+    Call function repeats times and return the calls per second, including a final flush.
+
+    :param function: a callable without parameters
+    :param repeats: a positive integer
+    :precondition: repeats must be a positive integer
+    :postcondition: calls function repeats times on the current console and flushes it
+    :return: the number of calls per second as a float
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    Console.current().flush()
+
+    return repeats / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{'path':<28}{'before/s':>14}{'color/s':>12}{'plain/s':>12}")
+
+    with open(os.devnull, "w", buffering=1) as devnull, contextlib.redirect_stdout(devnull):
+        rows = []
+        for name, function in paths():
+            with contextlib.ExitStack() as before:
+                before.enter_context(patch("helpers.Helpers.print_in_color", print_in_color_unbuffered))
+                before.enter_context(patch("helpers.Helpers.print_plain", print_plain_unbuffered))
+                before.enter_context(patch("renderer.Renderer.write_frame",
+                                           lambda frame: print("\n" + Renderer.encode(frame), end="")))
+                before.enter_context(patch.object(Board, "map_row", map_row_per_cell))
+                unbuffered = measure(function, REPEATS)
+
+            with patch.object(TerminalConsole, "wants_color", staticmethod(lambda stream: True)):
+                with Console.use(TerminalConsole()):
+                    color = measure(function, REPEATS)
+
+            with patch.object(TerminalConsole, "wants_color", staticmethod(lambda stream: False)):
+                with Console.use(TerminalConsole()):
+                    plain = measure(function, REPEATS)
+
+            rows.append(f"{name:<28}{unbuffered:>14.0f}{color:>12.0f}{plain:>12.0f}")
+
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
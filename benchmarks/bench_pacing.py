@@ -0,0 +1,95 @@
+"""
+Benchmark many sessions playing the story scenes at once, either each in its own thread or all on one event loop.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_pacing
+"""
+import asyncio
+import concurrent.futures
+import time
+from pacing import HeadlessPacer, Pacer, RealTimePacer
+from story import Story
+
+SCENES = (Story.OPENING, Story.CELL, Story.COMPLETED)
+
+
+def session(pacer: Pacer) -> None:
+    """
+    Play every story scene with pacer, discarding the text.
+
+    :param pacer: a Pacer object
+    :precondition: pacer must be a Pacer object
+    :postcondition: plays the story scenes one after the other, blocking the calling thread during the pauses
+    """
+    for scene in SCENES:
+        pacer.play(scene, lambda beat: None)
+
+
+async def awaited_session(pacer: Pacer) -> None:
+    """
+    Play every story scene with pacer, discarding the text.
+
+    :param pacer: a Pacer object
+    :precondition: pacer must be a Pacer object
+    :postcondition: plays the story scenes one after the other, letting the event loop run during the pauses
+    """
+    for scene in SCENES:
+        await pacer.perform(scene, lambda beat: None)
+
+
+def threaded_sessions(pacer: Pacer, count: int) -> float:
+    """
+    Play count sessions at once, one thread each, and return the time they took.
+
+    :param pacer: a Pacer object
+    :param count: a positive integer
+    :precondition: pacer must be a Pacer object
+    :precondition: count must be a positive integer
+    :postcondition: plays count sessions concurrently, one thread each
+    :return: the number of seconds the sessions took, as a float
+    """
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(count) as executor:
+        for _ in range(count):
+            executor.submit(session, pacer)
+    return time.perf_counter() - start
+
+
+def awaited_sessions(pacer: Pacer, count: int) -> float:
+    """
+    Play count sessions at once on one event loop, and return the time they took.
+
+    :param pacer: a Pacer object
+    :param count: a positive integer
+    :precondition: pacer must be a Pacer object
+    :precondition: count must be a positive integer
+    :postcondition: plays count sessions concurrently on a new event loop
+    :return: the number of seconds the sessions took, as a float
+    """
+    async def run() -> None:
+        await asyncio.gather(*(awaited_session(pacer) for _ in range(count)))
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    story_seconds = sum(beat.delay for scene in SCENES for beat in scene)
+    print(f"the story pauses for {story_seconds} seconds in real time")
+    print(f"{'pacer':<18}{'sessions on':<13}{'sessions':>10}{'seconds':>10}{'sessions/s':>12}")
+
+    for name, pacer in (("headless", HeadlessPacer()), ("real-time x0.01", RealTimePacer(0.01))):
+        for mode, sessions, counts in (("threads", threaded_sessions, (1, 100, 1000)),
+                                       ("event loop", awaited_sessions, (1, 100, 1000, 10_000))):
+            for count in counts:
+                elapsed = sessions(pacer, count)
+                print(f"{name:<18}{mode:<13}{count:>10}{elapsed:>10.3f}{count / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark comparing the per-segment board printer with the buffered frame renderer.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_print_board
+"""
+import contextlib
+import time
+from board import Board
+from helpers import Helpers
+
+
+class CountingStream:
+    """
+    A text stream that discards output while counting write calls and encoded bytes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Instantiate a new CountingStream with zeroed counters.
+
+        :postcondition: instantiates a new CountingStream with zeroed counters
+        """
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        """
+        Count a write call and the number of bytes it would have written.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: increments the write and byte counters
+        :return: the number of characters written
+        """
+        self.writes += 1
+        self.bytes += len(text.encode("utf-8"))
+        return len(text)
+
+    def flush(self) -> None:
+        """
+        Do nothing, the stream has no buffer.
+        """
+
+
+def legacy_print_board(board: Board, player_coords: tuple) -> None:
+    """
+    Print the board one colored segment at a time, the way Board.print_board did before the frame renderer.
+
+    :param board: a Board object
+    :param player_coords: a tuple of positive non-zero integers
+    :precondition: board must be a Board object
+    :precondition: player_coords must be a tuple of positive non-zero integers
+    :postcondition: prints the board to stdout with one print call per segment
+    """
+    for row in board.map_rows(player_coords):
+        for cell in row:
+            for text, color in cell:
+                Helpers.print_in_color(text, color, end="")
+        print()
+
+
+def measure(printer, board: Board) -> tuple:
+    """
+    Print one frame with printer and return the write calls, bytes and seconds it took.
+
+    :param printer: a function accepting a board and player coordinates
+    :param board: a Board object
+    :precondition: printer must print one frame of board to stdout
+    :precondition: board must be a Board object
+    :postcondition: prints one frame into a CountingStream
+    :return: a tuple of write calls, bytes written and elapsed seconds
+    """
+    stream = CountingStream()
+    with contextlib.redirect_stdout(stream):
+        start = time.perf_counter()
+        printer(board, (1, 1))
+        elapsed = time.perf_counter() - start
+
+    return stream.writes, stream.bytes, elapsed
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{'size':<12}{'renderer':<10}{'writes':>10}{'bytes':>12}{'ms':>10}")
+
+    for size in (10, 100, 1000):
+        board = Board(size, size, (4, 4), (7, 7), seed=0)
+
+        for name, printer in (("legacy", legacy_print_board), ("buffered", Board.print_board)):
+            writes, written, elapsed = measure(printer, board)
+            print(f"{f'{size}x{size}':<12}{name:<10}{writes:>10}{written:>12}{elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
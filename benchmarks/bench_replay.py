@@ -0,0 +1,31 @@
+"""
+Benchmark the game loop by playing the stored replays at machine speed.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_replay
+"""
+import glob
+import os
+from replay import Replay
+
+PLAYS = 200
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{'replay':<28}{'turns':>8}{'plays':>8}{'seconds':>10}{'turns/s':>10}{'games/s':>10}")
+
+    for path in sorted(glob.glob(os.path.join("replays", "*.json"))):
+        replay = Replay.load(path)
+        results = [replay.run() for _ in range(PLAYS)]
+        turns = sum(result.turns for result in results)
+        seconds = sum(result.seconds for result in results)
+        print(f"{os.path.basename(path):<28}{results[0].turns:>8}{PLAYS:>8}{seconds:>10.3f}{turns / seconds:>10.0f}"
+              f"{PLAYS / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Load test the game server with thousands of idle sessions on the local machine.
+
+The clients run on the same event loop as the server. Every idle client connects and then waits at the name prompt,
+like a player who walked away, while a few active clients play short games to show how the idle sessions affect them.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_server
+"""
+import asyncio
+import statistics
+import threading
+import time
+from server import GameServer
+
+IDLE_SESSIONS = 2000
+ACTIVE_GAMES = 200
+CONCURRENCY = 20
+
+
+def memory() -> int:
+    """
+    Return the resident memory of the process.
+
+    :postcondition: returns the resident set size of the process, or 0 if the platform does not report it
+    :return: a number of kibibytes as an integer
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    return 0
+
+
+async def idle_client(host: str, port: int) -> tuple:
+    """
+    Connect to the server and wait at the name prompt.
+
+    :param host: the host of the server
+    :param port: the port of the server
+    :precondition: a server must be listening on host and port
+    :postcondition: returns once the server has asked for a name
+    :return: the reader and writer of the connection
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readuntil(b"character..\r\n")
+
+    return reader, writer
+
+
+async def active_games(host: str, port: int) -> list:
+    """
+    Play ACTIVE_GAMES short games, CONCURRENCY at a time.
+
+    :param host: the host of the server
+    :param port: the port of the server
+    :precondition: a server must be listening on host and port
+    :postcondition: names a character, shows its stats and quits in every game
+    :return: a list of the seconds every game took
+    """
+    limit = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def game():
+        async with limit:
+            start = time.perf_counter()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"Bench\r\ns\r\nq\r\n")
+            await reader.read()
+            writer.close()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(game() for _ in range(ACTIVE_GAMES)))
+
+    return latencies
+
+
+def report(label: str, latencies: list, elapsed: float) -> None:
+    """
+    Print the throughput and latencies of a batch of games.
+
+    :param label: a string
+    :param latencies: a non-empty list of the seconds every game took
+    :param elapsed: the seconds the whole batch took
+    :precondition: latencies must be a non-empty list of numbers
+    :postcondition: prints the games per second and the median and 99th percentile latency
+    """
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<36}{len(latencies) / elapsed:>10.0f}{statistics.median(latencies) * 1000:>12.1f}"
+          f"{p99 * 1000:>12.1f}")
+
+
+async def run() -> None:
+    """
+    Run the load test.
+    """
+    server = GameServer(port=0, max_sessions=IDLE_SESSIONS + CONCURRENCY, pacing="headless", color=False)
+    await server.start()
+    host, port = server.address()
+
+    print(f"{'active games':<36}{'games/s':>10}{'median ms':>12}{'p99 ms':>12}")
+    start = time.perf_counter()
+    latencies = await active_games(host, port)
+    report("without idle sessions", latencies, time.perf_counter() - start)
+
+    base_memory, base_threads = memory(), threading.active_count()
+    start = time.perf_counter()
+    clients = await asyncio.gather(*(idle_client(host, port) for _ in range(IDLE_SESSIONS)))
+    ramp = time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await active_games(host, port)
+    report(f"with {IDLE_SESSIONS} idle sessions", latencies, time.perf_counter() - start)
+
+    print()
+    print(f"{'idle sessions':<36}{IDLE_SESSIONS:>10}")
+    print(f"{'sessions connected per second':<36}{IDLE_SESSIONS / ramp:>10.0f}")
+    print(f"{'threads per idle session':<36}{(threading.active_count() - base_threads) / IDLE_SESSIONS:>10.2f}")
+    print(f"{'memory per idle session (KiB)':<36}{(memory() - base_memory) / IDLE_SESSIONS:>10.1f}")
+
+    start = time.perf_counter()
+    await server.shutdown()
+    print(f"{'graceful shutdown (ms)':<36}{(time.perf_counter() - start) * 1000:>10.1f}")
+
+    for reader, writer in clients:
+        writer.close()
+    print(f"{'peak sessions':<36}{server.peak:>10}")
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
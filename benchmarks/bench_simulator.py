@@ -0,0 +1,39 @@
+"""
+Benchmark the balance simulator and print its summary of the enemies pack.
+
+Run from the repository root, with numpy installed, with:
+
+    python -m benchmarks.bench_simulator
+"""
+import time
+from content import ContentRegistry
+from simulator import Simulator
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    enemies = ContentRegistry.shared().pack("enemies")
+
+    start = time.perf_counter()
+    table = Simulator.fight_table(enemies, fights=100_000, seed=0)
+    elapsed = time.perf_counter() - start
+    print(f"{len(enemies) * 100_000} fights in {elapsed * 1000:.0f} ms")
+    print(f"{'level':>6}{'fights':>10}{'win rate':>10}{'hp loss':>10}{'xp':>8}{'loot':>8}")
+    for row in table:
+        print(f"{row.enemy_level:>6}{row.fights:>10}{row.win_rate:>10.3f}{row.hp_loss:>10.1f}{row.xp:>8.1f}"
+              f"{row.loot_rate:>8.3f}")
+
+    start = time.perf_counter()
+    run = Simulator.progression(enemies, runs=100_000, rooms=100, seed=0)
+    elapsed = time.perf_counter() - start
+    print(f"\n{run.runs} runs of {run.rooms} rooms in {elapsed * 1000:.0f} ms")
+    print(f"{'room':>6}{'level':>8}{'xp':>8}{'hp':>8}{'deaths':>8}{'staff':>8}")
+    for room in range(9, run.rooms, 10):
+        print(f"{room + 1:>6}{run.level[room]:>8.2f}{run.xp[room]:>8.1f}{run.hp[room]:>8.1f}{run.deaths[room]:>8.2f}"
+              f"{run.staff_rarity[room]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark how the throughput of the supervisor scales with the number of worker processes.
+
+Short games are played by a pool of client processes, so the clients do not compete with the supervisor for a single
+event loop. Throughput can only scale up to the number of cores the machine has, which are shared by the clients.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_supervisor
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from supervisor import Supervisor
+
+GAMES = 2000
+CONCURRENCY = 16
+WARM_UP_GAMES = 50
+
+
+def client_games(address: tuple, games: int) -> int:
+    """
+    Play games short games against the server at address, CONCURRENCY at a time.
+
+    :param address: a tuple of the host and port of the server
+    :param games: a non-negative integer
+    :precondition: a server must be listening on address
+    :postcondition: names a character, shows its stats and quits in every game
+    :return: the number of games that ended normally
+    """
+    async def run() -> int:
+        limit = asyncio.Semaphore(CONCURRENCY)
+
+        async def game() -> bool:
+            async with limit:
+                reader, writer = await asyncio.open_connection(*address)
+                writer.write(b"Bench\r\ns\r\nq\r\n")
+                output = await reader.read()
+                writer.close()
+                return output.endswith(b"sometime :)\r\n")
+
+        return sum(await asyncio.gather(*(game() for _ in range(games))))
+
+    return asyncio.run(run())
+
+
+def worker_counts() -> list:
+    """
+    Return the numbers of workers to benchmark.
+
+    :postcondition: returns 1, 2 and every power of 2 up to the number of cores, followed by the number of cores
+    :return: a sorted list of positive integers
+    """
+    cores = os.cpu_count() or 1
+    counts = {1, 2, cores}
+    count = 4
+    while count < cores:
+        counts.add(count)
+        count *= 2
+
+    return sorted(counts)
+
+
+async def measure(workers: int, clients, processes: int) -> tuple:
+    """
+    Play GAMES games against a supervisor with workers worker processes.
+
+    :param workers: a positive integer
+    :param clients: a multiprocessing pool of client processes
+    :param processes: the number of processes in clients
+    :precondition: workers and processes must be positive integers
+    :postcondition: plays WARM_UP_GAMES games before the timed games, and shuts the supervisor down
+    :return: a tuple of the number of games that ended normally and the seconds they took
+    """
+    supervisor = Supervisor(workers, port=0, pacing="headless", color=False, max_sessions=CONCURRENCY * 64)
+    task = asyncio.create_task(supervisor.serve())
+    while supervisor.listener is None:
+        await asyncio.sleep(0.01)
+
+    loop = asyncio.get_running_loop()
+    address = supervisor.address()
+    try:
+        await loop.run_in_executor(None, clients.starmap, client_games, [(address, WARM_UP_GAMES)] * processes)
+        start = time.perf_counter()
+        ended = await loop.run_in_executor(None, clients.starmap, client_games,
+                                           [(address, GAMES // processes)] * processes)
+        return sum(ended), time.perf_counter() - start
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print(f"{os.cpu_count()} cores")
+    print(f"{'workers':<10}{'games':>8}{'seconds':>10}{'games/s':>10}{'speedup':>10}")
+
+    processes = os.cpu_count() or 1
+    with multiprocessing.get_context("spawn").Pool(processes) as clients:
+        baseline = None
+        for workers in worker_counts():
+            games, elapsed = asyncio.run(measure(workers, clients, processes))
+            baseline = baseline or games / elapsed
+            print(f"{workers:<10}{games:>8}{elapsed:>10.3f}{games / elapsed:>10.0f}"
+                  f"{games / elapsed / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
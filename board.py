@@ -1,9 +1,16 @@
 """
 Module containing the Board class.
 """
-import itertools
+import random
+from grid import Chunk, Grid, BoardView
+from pathfinding import DistanceField
 from helpers import Helpers
+from console import Console
+from renderer import Renderer
+from sampler import RoomSampler
+from templates import BoardTemplates
 from actions import ActionGenerator
+from content import ContentRegistry
 from enemies import RoyalMageAngelozzi, LordCommanderYmir, GodKingThompson
 
 
@@ -12,19 +19,53 @@ class Board:
     A class to represent the game board.
     """
 
-    def __init__(self, rows: int, columns: int, boss_1_coords: tuple, boss_2_coords: tuple) -> None:
+    PLAYER_CELL = (('|', "green"), ("#", "purple"), ('|', "green"))
+    VISITED_CELL = (('| |', "green"),)
+    BOSS_CELL = (('|', "green"), ("X", "red"), ('|', "green"))
+    FINAL_BOSS_CELL = (('|', "green"), ("\U0001F451", "red"), ('|', "green"))
+    BORDER_CELL = (('---', "green"),)
+    UNVISITED_CELL = (('|?|', "green"),)
+
+    MINIMAP_PLAYER_CELL = (("#", "purple"),)
+    MINIMAP_BOSS_CELL = (("X", "red"),)
+    MINIMAP_FINAL_BOSS_CELL = (("^", "red"),)
+    MINIMAP_EXPLORED_CELL = ((".", "green"),)
+    MINIMAP_UNEXPLORED_CELL = (("?", "blue"),)
+    MINIMAP_CORNER_CELL = (("+", "green"),)
+    MINIMAP_EDGE_CELL = (("-", "green"),)
+    MINIMAP_SIDE_CELL = (("|", "green"),)
+
+    TEMPLATES = BoardTemplates()
+
+    def __init__(self, rows: int, columns: int, boss_1_coords: tuple, boss_2_coords: tuple,
+                 final_boss_coords: tuple = None, seed: int = None, templates: BoardTemplates = None,
+                 room_sampler: RoomSampler = None) -> None:
         """
         Instantiate a board object of size rows * columns.
 
+        Rooms have an x coordinate between 1 and columns and a y coordinate between 1 and rows. The final boss room
+        sits either inside the board or just outside it, in the border row above or below the board.
+
         :param rows: a positive integer
         :param columns: a positive integer
-        :param boss_1_coords: a tuple of positive non-zero integers both between 1 and rows
-        :param boss_2_coords: a tuple of positive non-zero integers both between 1 and rows
+        :param boss_1_coords: a tuple of an x coordinate between 1 and columns and a y coordinate between 1 and rows
+        :param boss_2_coords: a tuple of an x coordinate between 1 and columns and a y coordinate between 1 and rows
+        :param final_boss_coords: a tuple of an x coordinate between 1 and columns and a y coordinate between 0 and
+                                  rows + 1. Default is None, which places the final boss above the top right room
+        :param seed: an integer that determines the generated rooms. Default is None, which picks a random seed
+        :param templates: a BoardTemplates object used to cache the layout of seeded boards. Default is None, which
+                          uses Board.TEMPLATES, a cache that only keeps templates in memory unless it is replaced
+        :param room_sampler: a RoomSampler object that draws the type of every generic room. Default is None, which
+                             uses the default weights of RoomSampler
         :precondition: rows must be a positive non-zero integer
         :precondition: columns must be a positive non-zero integer
-        :precondition: boss_1_coords must be a tuple of positive integers both between 1 and rows
-        :precondition: boss_1_coords must be a tuple of positive integers both between 1 and rows
+        :precondition: boss_1_coords, boss_2_coords and final_boss_coords must be different from each other and
+                       from the starting room (1, 1)
         :postcondition: instantiate a board object of size rows * columns
+        :postcondition: rooms are generated lazily, a chunk at a time, the first time they are touched
+        :postcondition: when seed is given, the board is loaded from its cached template, or its template is stored
+        :raise TypeError: if rows or columns is not an integer
+        :raise ValueError: if rows or columns is not positive, or if a boss is placed somewhere it cannot be
         """
         if (type(rows) is not int) or (type(columns) is not int):
             raise TypeError("Rows and columns must be integers!")
@@ -33,142 +74,550 @@ class Board:
 
         self.rows = rows
         self.columns = columns
-        self.boss_1_coords = boss_1_coords # (4, 4)
-        self.boss_2_coords = boss_2_coords # (7, 7)
+        self.boss_1_coords = tuple(boss_1_coords)
+        self.boss_2_coords = tuple(boss_2_coords)
+        self.final_boss_coords = tuple(final_boss_coords) if final_boss_coords is not None else (columns, rows + 1)
+
+        for coords in (self.boss_1_coords, self.boss_2_coords):
+            if not (1 <= coords[0] <= columns and 1 <= coords[1] <= rows):
+                raise ValueError(f"Boss coordinates {coords} must be inside the {columns}x{rows} board!")
+        if not (1 <= self.final_boss_coords[0] <= columns and 0 <= self.final_boss_coords[1] <= rows + 1):
+            raise ValueError(f"Final boss coordinates {self.final_boss_coords} must be inside the board or in the "
+                             f"border row directly above or below it!")
+        if len({(1, 1), (1, 0), self.boss_1_coords, self.boss_2_coords, self.final_boss_coords}) != 5:
+            raise ValueError("Bosses must be in different rooms, away from the start!")
 
         self.boss_1 = RoyalMageAngelozzi()
         self.boss_2 = LordCommanderYmir()
         self.final_boss = GodKingThompson()
 
-        self.board = {
-            (1, 1): {
-                "description": "\nLooks like you have come back to the start, try the opposite direction of the cell",
-                "action": None,
-                "solved": True,
-                "directions": {
-                    "north": (1, 2),
-                    "east": (2, 1),
-                    "south": None,
-                    "west": None
-                }
-            },
-            self.boss_1_coords: {
-                "description": "\nRoyal Mage Angelozzi, Left Wing of Alyndelle",
-                "action": self.boss_1.battle,
-                "solved": False,
-                "directions": {
-                    "north": (4, 5),
-                    "east": (5, 4),
-                    "south": (4, 3),
-                    "west": (3, 4)
-                }
-            },
-            self.boss_2_coords: {
-                "description": "\nLord-Commander Ymir, Right Wing of Alyndelle",
-                "action": self.boss_2.battle,
-                "solved": False,
-                "directions": {
-                    "north": (7, 8),
-                    "east": (8, 7),
-                    "south": (7, 6),
-                    "west": (6, 7)
-                }
-            },
-            (10, 11): {
-                "description": "\nGod-King Thompson, the God Slayer",
-                "action": self.final_boss.battle,
-                "solved": False,
-                "directions": {
-                    "north": None,
-                    "east": None,
-                    "south": (10, 10),
-                    "west": None
-                }
-            }
+        self.room_descriptions = list(ActionGenerator.ROOM_DESCRIPTIONS) + [
+            "\nLooks like you have come back to the start, try the opposite direction of the cell",
+            "\nRoyal Mage Angelozzi, Left Wing of Alyndelle",
+            "\nLord-Commander Ymir, Right Wing of Alyndelle",
+            "\nGod-King Thompson, the God Slayer"
+        ]
+
+        self.special_description = len(ActionGenerator.ROOM_DESCRIPTIONS)
+        self.special_rooms = {
+            (1, 1): Grid.START,
+            self.boss_1_coords: Grid.BOSS_1,
+            self.boss_2_coords: Grid.BOSS_2,
+            self.final_boss_coords: Grid.FINAL_BOSS
+        }
+
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.room_sampler = room_sampler if room_sampler is not None else RoomSampler()
+        self.room_actions = [None, self.boss_1.battle, self.boss_2.battle, self.final_boss.battle]
+        self.first_generic_action = len(self.room_actions)
+        self.generic_actions = {}
+
+        registry = ContentRegistry.shared()
+        self.record_counts = tuple(
+            len(registry.pack("enemies")) if room_type == RoomSampler.ENEMY_ROOM else
+            len(registry.pack("riddles")) if room_type == RoomSampler.RIDDLE_ROOM else 1
+            for room_type in RoomSampler.ROOM_TYPES
+        )
+        self.action_offsets = tuple(self.first_generic_action + sum(self.record_counts[:type_index])
+                                    for type_index in range(len(RoomSampler.ROOM_TYPES)))
+
+        extra_cells = () if self.final_boss_coords[1] in range(1, rows + 1) else (self.final_boss_coords,)
+        self.grid = Grid(self.columns, self.rows, extra_cells, self.generate_chunk)
+
+        if seed is not None:
+            self.load_template(templates if templates is not None else Board.TEMPLATES)
+
+        self.grid.chunk((1, 1))
+        self.grid.set_solved((1, 1), True)
+        self.grid.set_visited((1, 1))
+
+        self.distance_fields = {}
+        self.board = BoardView(self)
+
+    @staticmethod
+    def scaled_coords(rows: int, columns: int, fraction: float) -> tuple:
+        """
+        Return the coordinates of the room a fraction of the way across and up a board.
+
+        :param rows: a positive integer
+        :param columns: a positive integer
+        :param fraction: a float between 0 and 1
+        :precondition: rows and columns must be positive non-zero integers
+        :precondition: fraction must be a float between 0 and 1
+        :postcondition: returns the coordinates of the room a fraction of the way across and up the board
+        :return: the coordinates as a tuple of two integers
+
+        >>> Board.scaled_coords(10, 10, 0.4)
+        (4, 4)
+        >>> Board.scaled_coords(10, 10, 0.7)
+        (7, 7)
+        >>> Board.scaled_coords(1000, 200, 0.4)
+        (80, 400)
+        """
+        return max(1, round(columns * fraction)), max(1, round(rows * fraction))
+
+    @staticmethod
+    def default_boss_coords(rows: int, columns: int) -> tuple:
+        """
+        Return the rooms of the two mini bosses on a board that does not place them itself.
+
+        The bosses are placed 40% and 70% of the way across and up the board. On a board too small for those rooms to
+        be different from each other and from the start, a boss is moved to the next free room, row by row.
+
+        :param rows: a positive integer
+        :param columns: a positive integer
+        :precondition: rows and columns must be positive non-zero integers
+        :postcondition: returns two different rooms of the board, away from the starting room (1, 1)
+        :return: a tuple of two coordinate tuples
+        :raise ValueError: if the board has fewer than 3 rooms, so there is no room for both bosses
+
+        >>> Board.default_boss_coords(10, 10)
+        ((4, 4), (7, 7))
+        >>> Board.default_boss_coords(3, 3)
+        ((2, 1), (2, 2))
+        >>> Board.default_boss_coords(1, 3)
+        ((2, 1), (3, 1))
+        """
+        if rows * columns < 3:
+            raise ValueError("The board must have at least 3 rooms, one to start in and one for each boss!")
+
+        taken = [(1, 1)]
+        for fraction in (0.4, 0.7):
+            x_coord, y_coord = Board.scaled_coords(rows, columns, fraction)
+            while (x_coord, y_coord) in taken:
+                x_coord, y_coord = (x_coord + 1, y_coord) if x_coord < columns else (1, y_coord % rows + 1)
+            taken.append((x_coord, y_coord))
+
+        return taken[1], taken[2]
+
+    def load_template(self, templates: BoardTemplates) -> None:
+        """
+        Fill in the starting chunk from the board's template, creating the template if needed.
+
+        :param templates: a BoardTemplates object
+        :precondition: templates must be a BoardTemplates object
+        :precondition: no chunk may be materialized yet
+        :postcondition: materializes the starting chunk
+        :postcondition: stores the board's template in templates if it was not there already
+        """
+        key = BoardTemplates.key(self.seed, self.columns, self.rows, self.special_rooms, BoardTemplates.content_hash(),
+                                 self.room_sampler.key())
+        template = templates.load(key)
+
+        if template is not None:
+            try:
+                start_chunk = Chunk.load(Grid.CHUNK_SIZE, template["start_chunk"])
+            except (KeyError, IndexError, TypeError, ValueError):
+                pass
+            else:
+                self.grid.chunks[Grid.chunk_key((1, 1))] = start_chunk
+                return
+
+        templates.store(key, {
+            "format": BoardTemplates.FORMAT,
+            "start_chunk": self.grid.chunk((1, 1)).dump()
+        })
+
+    def boss_distance(self, coords: tuple) -> int:
+        """
+        Return the number of moves between coords and the nearest boss, ignoring the board edges.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be a tuple of two integers
+        :postcondition: returns the smallest manhattan distance between coords and a boss room
+        :return: a non-negative integer
+        """
+        x_coord, y_coord = coords
+        return min(abs(x_coord - boss_x) + abs(y_coord - boss_y)
+                   for boss_x, boss_y in (self.boss_1_coords, self.boss_2_coords, self.final_boss_coords))
+
+    def room_action(self, index: int):
+        """
+        Return the action of a room from the action index stored in its chunk.
+
+        Generic actions are only created the first time a room that uses them is entered, so a content pack with
+        millions of records costs nothing until its records are needed.
+
+        :param index: a non-negative integer
+        :precondition: index must be an action index stored by generate_chunk
+        :postcondition: returns the action function, creating and remembering it if needed
+        :return: a function accepting a Character object, or None for the starting room
+        """
+        if index < self.first_generic_action:
+            return self.room_actions[index]
+
+        action = self.generic_actions.get(index)
+        if action is None:
+            type_index = len(RoomSampler.ROOM_TYPES) - 1
+            while self.action_offsets[type_index] > index:
+                type_index -= 1
+
+            room_type = RoomSampler.ROOM_TYPES[type_index]
+            record_id = index - self.action_offsets[type_index]
+            record = None
+            if room_type == RoomSampler.ENEMY_ROOM:
+                record = ContentRegistry.shared().enemy_template(record_id)
+            elif room_type == RoomSampler.RIDDLE_ROOM:
+                record = ContentRegistry.shared().riddle(record_id)
+
+            action = self.generic_actions[index] = ActionGenerator.build_action(room_type, record)
+
+        return action
+
+    def generate_chunk(self, key: tuple, chunk, rooms: list) -> None:
+        """
+        Fill in the rooms of a chunk the first time it is touched.
+
+        Each chunk draws its rooms from its own random generator seeded by the board seed and the chunk key, so the
+        same board seed always produces the same rooms no matter in which order chunks are visited. The type of each
+        generic room is drawn from the room sampler, and the enemy or riddle it uses is drawn uniformly from its
+        content pack.
+
+        :param key: a chunk key as a tuple of two integers
+        :param chunk: the Chunk object to fill in
+        :param rooms: a list of the coordinates of every room in the chunk
+        :precondition: key, chunk and rooms must describe the same chunk of self.grid
+        :postcondition: sets the kind, action and description of every room in the chunk
+        """
+        rng = random.Random(f"{self.seed}:{key[0]}:{key[1]}")
+        description_count = len(ActionGenerator.ROOM_DESCRIPTIONS)
+
+        for coords in rooms:
+            offset = Grid.chunk_offset(coords)
+            kind = self.special_rooms.get(coords, Grid.GENERIC)
+
+            if kind == Grid.GENERIC:
+                room_type = self.room_sampler.sample(rng, self.boss_distance(coords))
+                type_index = RoomSampler.ROOM_TYPES.index(room_type)
+                record_count = self.record_counts[type_index]
+                if record_count == 0:
+                    type_index = RoomSampler.ROOM_TYPES.index(RoomSampler.EMPTY_ROOM)
+                    record_count = 1
+
+                chunk.actions[offset] = self.action_offsets[type_index] + rng.randrange(record_count)
+                chunk.descriptions[offset] = rng.randrange(description_count)
+            else:
+                chunk.kinds[offset] = kind
+                chunk.actions[offset] = kind - Grid.START
+                chunk.descriptions[offset] = self.special_description + kind - Grid.START
+
+    def set_solved(self, coords: tuple, solved: bool) -> None:
+        """
+        Set the solved state of the room at coords and update any distance field that depends on it.
+
+        :param coords: a tuple of positive integers
+        :param solved: a boolean
+        :precondition: coords must be the coordinates of a room on the board
+        :postcondition: sets the solved state of the room at coords
+        """
+        solved = bool(solved)
+        if self.grid.is_solved(coords) == solved:
+            return
+
+        self.grid.set_solved(coords, solved)
+
+        unsolved_field = self.distance_fields.get("unsolved")
+        if unsolved_field is not None:
+            if solved:
+                unsolved_field.remove_target(coords)
+            else:
+                unsolved_field.add_targets((coords,))
+
+    def load_progress(self, data: tuple) -> None:
+        """
+        Replace the solved and visited state of every room with the raw flags returned by Grid.dump_progress.
+
+        :param data: a tuple of two bytes objects returned by Grid.dump_progress
+        :precondition: data must be returned by Grid.dump_progress of a board of the same size
+        :postcondition: sets the solved and visited state of every room, and rebuilds distance fields when next needed
+        :raise ValueError: if data does not fit the board
+        """
+        self.grid.load_progress(data)
+        self.distance_fields = {}
+
+    def progress(self) -> tuple:
+        """
+        Return how many rooms are solved, out of how many rooms there are.
+
+        :postcondition: returns the progress of the whole board in constant time
+        :return: a tuple of the number of solved rooms and the number of rooms
+        """
+        return self.grid.solved.count, len(self.grid)
+
+    def region_progress(self, first_corner: tuple, last_corner: tuple) -> tuple:
+        """
+        Return how many rooms are solved inside a rectangle of the board, out of how many rooms it holds.
+
+        :param first_corner: a tuple of two integers
+        :param last_corner: a tuple of two integers
+        :precondition: both corners must be tuples of two integers
+        :postcondition: returns the progress of the rooms inside both the rectangle and the board
+        :return: a tuple of the number of solved rooms and the number of rooms
+        """
+        width = min(self.columns, max(first_corner[0], last_corner[0])) - max(1, min(first_corner[0], last_corner[0]))
+        height = min(self.rows, max(first_corner[1], last_corner[1])) - max(1, min(first_corner[1], last_corner[1]))
+
+        return self.grid.count_solved(first_corner, last_corner), max(0, width + 1) * max(0, height + 1)
+
+    def distance_field(self, destination: str) -> DistanceField:
+        """
+        Return the distance field towards destination, computing it the first time it is asked for.
+
+        :param destination: one of the following strings: "unsolved", "boss_1", "boss_2", "final_boss"
+        :precondition: destination must be one of the following strings: "unsolved", "boss_1", "boss_2",
+                       "final_boss"
+        :postcondition: returns the distance field towards destination, which is kept up to date as rooms are solved
+        :return: a DistanceField object
+        """
+        field = self.distance_fields.get(destination)
+
+        if field is None:
+            if destination == "unsolved":
+                targets = (self.grid.coords(index) for index in range(len(self.grid)) if not self.grid.solved[index])
+            else:
+                targets = (getattr(self, f"{destination}_coords"),)
+
+            field = DistanceField(self.grid, targets)
+            self.distance_fields[destination] = field
+
+        return field
+
+    def choose_destination(self) -> str:
+        """
+        Print the places the character can travel to and return the user's choice.
+
+        :postcondition: prints the possible destinations and returns the selected one
+        :return: one of the following strings: "unsolved", "boss_1", "boss_2", "final_boss"
+        """
+        destinations = {
+            "Nearest unsolved room": "unsolved",
+            "Royal Mage Angelozzi": "boss_1",
+            "Lord-Commander Ymir": "boss_2",
+            "God-King Thompson": "final_boss"
         }
+        options = list(enumerate(destinations, start=1))
+
+        Helpers.print_user_options(options, "Destination")
 
-        actions = itertools.cycle(ActionGenerator.get_generic_actions())
-
-        for x_coord in range(1, self.columns + 1):
-            for y_coord in range(1, self.rows + 1):
-                if (x_coord == 1 and y_coord == 1) or \
-                        (x_coord == 10 and y_coord == 11) or \
-                        (x_coord == 4 and y_coord == 4) or \
-                        (x_coord == 7 and y_coord == 7):
-                    continue
-
-                self.board[(x_coord, y_coord)] = {
-                    "description": ActionGenerator.get_generic_room_description(),
-                    "action": next(actions),
-                    "solved": False,
-                    "directions": {
-                        "north": (x_coord, y_coord + 1),
-                        "east": (x_coord + 1, y_coord),
-                        "south": (x_coord, y_coord - 1),
-                        "west": (x_coord - 1, y_coord)
-                    }
-                }
-
-                if x_coord == 1:
-                    self.board[(x_coord, y_coord)]["directions"]["west"] = None
-                if x_coord == self.rows:
-                    self.board[(x_coord, y_coord)]["directions"]["east"] = None
-                if y_coord == 1 and x_coord != 1:
-                    self.board[(x_coord, y_coord)]["directions"]["south"] = None
-                if y_coord == self.columns and x_coord != self.rows:
-                    self.board[(x_coord, y_coord)]["directions"]["north"] = None
+        return destinations[Helpers.get_user_choice(options)]
+
+    def travel_route(self, start: tuple, destination: str) -> list:
+        """
+        Return the directions of a shortest path from start to destination.
+
+        :param start: a tuple of positive integers
+        :param destination: one of the following strings: "unsolved", "boss_1", "boss_2", "final_boss"
+        :precondition: start must be the coordinates of a room on the board
+        :precondition: destination must be one of the following strings: "unsolved", "boss_1", "boss_2",
+                       "final_boss"
+        :postcondition: returns the directions of a shortest path, in time proportional to its length
+        :return: a list of direction strings, empty if start is already the destination
+        """
+        return self.distance_field(destination).route(start)
 
     def get_board(self):
         """
         Get value of board.
 
+        The board is a read-only view over self.grid that behaves like a dictionary of room dictionaries keyed by
+        coordinates. Only the "solved" key of a room can be assigned.
+
         :postcondition: returns the value of board
         :return: value of board
         """
         return self.board
 
-    def print_board(self, player_coords: tuple):
+    def map_cell(self, coords: tuple, player_coords: tuple) -> tuple:
         """
-        Print the board to stdout.
+        Return the colored cell that represents coords on the map.
 
+        :param coords: a tuple of two integers on the map, including the border rows
         :param player_coords: a tuple of positive non-zero integers
+        :precondition: coords must be a tuple of two integers
         :precondition: player_coords must be a tuple of positive non-zero integers
-        :postcondition: print a game board indicating the map border, uncleared rooms, sub-bosses and a final boss
+        :postcondition: returns the cell for coords in the format accepted by Renderer.encode
+        :return: a tuple of (text, color) segments
         """
-        x_pos, y_pos = player_coords
-        boss_1_x, boss_1_y = self.boss_1_coords
-        boss_2_x, boss_2_y = self.boss_2_coords
-        final_boss_x, final_boss_y = (10, 11)
+        x_coord, y_coord = coords
 
-        print()
-        for y_coord in range(self.columns + 1, -1, -1):
-            for x_coord in range(1, self.rows + 1, 1):
-                if y_coord == y_pos and x_coord == x_pos:
-                    Helpers.print_in_color('|', "green", end="")
-                    Helpers.print_in_color("#", "purple", end="")
-                    Helpers.print_in_color('|', "green", end="")
+        if coords == player_coords:
+            return Board.PLAYER_CELL
 
-                elif (y_coord == 0 and x_coord == 1) or ((x_coord, y_coord) in self.board.keys()) and \
-                        (self.board[(x_coord, y_coord)]["solved"]):
-                    Helpers.print_in_color('| |', "green", end="")
+        if (y_coord == 0 and x_coord == 1) or (coords in self.grid) and (self.grid.is_solved(coords)):
+            return Board.VISITED_CELL
 
-                elif (y_coord == boss_1_y and x_coord == boss_1_x) or (y_coord == boss_2_y and x_coord == boss_2_x):
-                    Helpers.print_in_color('|', "green", end="")
-                    Helpers.print_in_color("X", "red", end="")
-                    Helpers.print_in_color('|', "green", end="")
+        if coords == self.boss_1_coords or coords == self.boss_2_coords:
+            return Board.BOSS_CELL
 
-                elif (y_coord == final_boss_y) and (x_coord == final_boss_x):
-                    Helpers.print_in_color('|', "green", end="")
-                    Helpers.print_in_color("\U0001F451", "red", end="")
-                    Helpers.print_in_color('|', "green", end="")
+        if coords == self.final_boss_coords:
+            return Board.FINAL_BOSS_CELL
+
+        if y_coord == 0 or y_coord == self.rows + 1:
+            return Board.BORDER_CELL
+
+        return Board.UNVISITED_CELL
+
+    def map_rows(self, player_coords: tuple, viewport: tuple = None) -> list:
+        """
+        Return the map as rows of colored cells, from the top border down to the bottom border.
 
-                elif (y_coord == 11 and x_coord != 10) or (y_coord == 0 and x_coord != 1):
-                    Helpers.print_in_color('---', "green", end="")
+        With a viewport only a window of the map centered on the player is returned, shifted as needed to stay on the
+        map, so the work done depends on the size of the window rather than the size of the board.
+
+        :param player_coords: a tuple of positive non-zero integers
+        :param viewport: a tuple of the width and height of the window in rooms. Default is None, which returns the
+                         whole map
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :precondition: viewport must be a tuple of two positive non-zero integers or None
+        :postcondition: returns the map as a list of rows in the format accepted by Renderer.encode
+        :return: a list of rows, where each row is a list of cells and each cell is a tuple of (text, color) segments
+        """
+        last_x = self.columns
+        top_y = self.rows + 1
+
+        if viewport is None:
+            x_coords = range(1, last_x + 1)
+            y_coords = range(top_y, -1, -1)
+        else:
+            width, height = viewport
+            x_pos, y_pos = player_coords
+
+            first_x = min(max(1, x_pos - width // 2), max(1, last_x - width + 1))
+            first_y = min(max(0, y_pos - height // 2), max(0, top_y - height + 1))
+            x_coords = range(first_x, min(last_x, first_x + width - 1) + 1)
+            y_coords = range(min(top_y, first_y + height - 1), first_y - 1, -1)
+
+        return [self.map_row(y_coord, x_coords, player_coords) for y_coord in y_coords]
+
+    def map_row(self, y_coord: int, x_coords: range, player_coords: tuple) -> list:
+        """
+        Return one row of the map as colored cells.
+
+        The solved rooms of the row are read from the solved bitset in one go, and only the few rooms that can look
+        different from their neighbours, such as the player and the bosses, go through map_cell.
+
+        :param y_coord: an integer between 0 and rows + 1 inclusive
+        :param x_coords: a range of x coordinates between 1 and columns inclusive, with a step of 1
+        :param player_coords: a tuple of positive non-zero integers
+        :precondition: y_coord and x_coords must be on the map
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :postcondition: returns the same cells as calling map_cell for every x coordinate of the row
+        :return: a list of cells in the format accepted by Renderer.encode
+        """
+        first_x = x_coords.start
+        width = len(x_coords)
+
+        if 1 <= y_coord <= self.rows:
+            start = self.grid.index((first_x, y_coord))
+            solved = self.grid.solved.window(start, start + width)
+            cells = (Board.UNVISITED_CELL, Board.VISITED_CELL)
+            row = [cells[solved >> offset & 1] for offset in range(width)] if solved else [cells[0]] * width
+        else:
+            row = [Board.BORDER_CELL] * width
 
-                else:
-                    Helpers.print_in_color('|?|', "green", end="")
+        for coords in (player_coords, self.boss_1_coords, self.boss_2_coords, self.final_boss_coords, (1, 0)):
+            if coords[1] == y_coord and coords[0] in x_coords:
+                row[coords[0] - first_x] = self.map_cell(coords, player_coords)
 
-            print()
+        return row
+
+    def minimap_rows(self, player_coords: tuple, size: tuple) -> list:
+        """
+        Return a framed overview of the whole board, shrunk to size.
+
+        Each minimap cell stands for a block of rooms. Blocks that overlap a generated chunk are shown as explored, so
+        the work done depends on the size of the minimap and how far the player has explored, not on the board size.
+
+        :param player_coords: a tuple of positive non-zero integers
+        :param size: a tuple of the width and height of the minimap in cells
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :precondition: size must be a tuple of two positive non-zero integers
+        :postcondition: returns the minimap as a list of rows in the format accepted by Renderer.encode
+        :return: a list of rows, where each row is a list of cells and each cell is a tuple of (text, color) segments
+        """
+        width = min(size[0], self.columns)
+        height = min(size[1], self.rows)
+        block_width = -(-self.columns // width)
+        block_height = -(-self.rows // height)
+
+        def block(coords: tuple) -> tuple:
+            x_coord, y_coord = coords
+            column = min(max(x_coord, 1), self.columns)
+            row = min(max(y_coord, 1), self.rows)
+            return (column - 1) // block_width, height - 1 - (row - 1) // block_height
+
+        cells = [[Board.MINIMAP_UNEXPLORED_CELL] * width for _ in range(height)]
+
+        for chunk_x, chunk_y in self.grid.chunks:
+            first_column, first_row = block((chunk_x * Grid.CHUNK_SIZE + 1, (chunk_y + 1) * Grid.CHUNK_SIZE))
+            last_column, last_row = block(((chunk_x + 1) * Grid.CHUNK_SIZE, chunk_y * Grid.CHUNK_SIZE + 1))
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, last_column + 1):
+                    cells[row][column] = Board.MINIMAP_EXPLORED_CELL
+
+        for coords, cell in ((self.boss_1_coords, Board.MINIMAP_BOSS_CELL),
+                             (self.boss_2_coords, Board.MINIMAP_BOSS_CELL),
+                             (self.final_boss_coords, Board.MINIMAP_FINAL_BOSS_CELL),
+                             (player_coords, Board.MINIMAP_PLAYER_CELL)):
+            column, row = block(coords)
+            cells[row][column] = cell
+
+        edge = [Board.MINIMAP_CORNER_CELL] + [Board.MINIMAP_EDGE_CELL] * width + [Board.MINIMAP_CORNER_CELL]
+        return [edge] + [[Board.MINIMAP_SIDE_CELL] + row + [Board.MINIMAP_SIDE_CELL] for row in cells] + [edge]
+
+    def frame_rows(self, player_coords: tuple, viewport: tuple = None, minimap: tuple = None) -> list:
+        """
+        Return every row of a frame: the map, optionally windowed, followed by an optional minimap.
+
+        :param player_coords: a tuple of positive non-zero integers
+        :param viewport: a tuple of the width and height of the map window in rooms, or None for the whole map
+        :param minimap: a tuple of the width and height of the minimap in cells, or None for no minimap
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :postcondition: returns the frame as a list of rows in the format accepted by Renderer.encode
+        :return: a list of rows, where each row is a list of cells and each cell is a tuple of (text, color) segments
+        """
+        rows = self.map_rows(player_coords, viewport)
+
+        if minimap is not None:
+            rows += [[]] + self.minimap_rows(player_coords, minimap)
+
+        return rows
+
+    def print_board(self, player_coords: tuple, viewport: tuple = None, minimap: tuple = None):
+        """
+        Print the board to stdout.
+
+        The whole frame is built in one buffer and written with a single call.
+
+        :param player_coords: a tuple of positive non-zero integers
+        :param viewport: a tuple of the width and height of the map window in rooms. Default is None, which prints
+                         the whole map
+        :param minimap: a tuple of the width and height of the minimap in cells. Default is None, which prints no
+                        minimap
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :postcondition: print a game board indicating the map border, uncleared rooms, sub-bosses and a final boss
+        """
+        Renderer.write_frame(self.frame_rows(player_coords, viewport, minimap))
+
+    def show(self, player_coords: tuple, screen=None, viewport: tuple = None, minimap: tuple = None) -> None:
+        """
+        Show the board, either as a new frame or as an update to a full-screen map.
+
+        :param player_coords: a tuple of positive non-zero integers
+        :param screen: a Screen object or None. Default is None, which prints the whole frame with print_board
+        :param viewport: a tuple of the width and height of the map window in rooms, or None for the whole map
+        :param minimap: a tuple of the width and height of the minimap in cells, or None for no minimap
+        :precondition: player_coords must be a tuple of positive non-zero integers
+        :postcondition: prints the board, or redraws only the cells of screen that changed since its last frame
+        :postcondition: draws nothing if the current console is silent
+        """
+        if Console.current().silent:
+            return
+
+        if screen is None:
+            self.print_board(player_coords, viewport, minimap)
+        else:
+            screen.draw(self.frame_rows(player_coords, viewport, minimap))
 
     def describe_current_location(self, character) -> None:
         """
@@ -208,15 +657,10 @@ class Board:
         """
         Determine if the final boss is defeated.
 
-        :postcondition: return True if a value tied to the 'solved' key in board is
-                        True; else False
-        :return: True if a value tied to the 'solved' key in board[(10,11)] is True; else False
-
-        >>> test_board = { (10, 11): {"description": "God-King Thompson, the God Slayer", "action": self.final_boss.battle(), "solved": False, "directions": {"north": None, "east": None, "south": (10, 10), "west": None} } }
-        >>> self.boss_defeated(test_board)
-        False
+        :postcondition: return True if the final boss room is solved; else False
+        :return: True if the final boss room is solved; else False
         """
-        return True if self.board[(10, 11)]['solved'] else False
+        return self.grid.is_solved(self.final_boss_coords)
 
 
 def main():
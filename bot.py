@@ -0,0 +1,640 @@
+"""
+Module containing the Bot class and its strategies, which play whole games through the same menus as a player.
+"""
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import re
+import time
+import tracemalloc
+from collections import namedtuple
+from character import Character
+from console import ScriptedConsole
+from enemies import GodKingThompson, LordCommanderYmir, RoyalMageAngelozzi
+from game import Game
+from pacing import HeadlessPacer
+from replay import Replay
+
+Menu = namedtuple("Menu", ("title", "options", "text"))
+BotResult = namedtuple("BotResult", ("strategy", "seed", "turns", "seconds", "achieved_goal", "dead_end", "stats"))
+
+
+class Strategy:
+    """
+    The decisions of a bot, made one menu at a time.
+
+    Every kind of menu the game shows has its own method, which returns the option to choose. The options of a menu
+    are the (command, option) pairs printed under its title, and text is everything the game printed since the bot
+    last answered. The level and hp of the character are followed from the level ups, deaths and changes of hp the
+    game prints. Every decision is random unless a strategy decides otherwise.
+    """
+
+    name = "random"
+    CHANGES = r"(?P<level_up>Congrats you leveled up)|(?P<died>Rip, you died)|" \
+              r"\[{name} \| hp: (?:(?P<hp>\d+)/(?P<max_hp>\d+)|(?P<difference>[+-]\d+))\]"
+
+    def __init__(self) -> None:
+        """
+        Instantiate a strategy.
+
+        :postcondition: instantiates a strategy that is ready for a game with seed 0
+        """
+        self.rng = random.Random(0)
+        self.level = 1
+        self.hp = self.max_hp = 100
+
+    def reset(self, seed: int) -> None:
+        """
+        Prepare for a new game.
+
+        :param seed: an integer
+        :precondition: seed must be an integer
+        :postcondition: seeds the random choices of the strategy with seed and forgets the previous game
+        """
+        self.rng = random.Random(seed)
+        self.level = 1
+        self.hp = self.max_hp = 100
+
+    def observe(self, text: str, name: str = "Bot") -> None:
+        """
+        Follow the level and hp of the character through text.
+
+        :param text: everything the game printed since the bot last answered
+        :param name: the name of the character. Default is "Bot"
+        :precondition: text must be the plain output of the game
+        :postcondition: raises the level for every level up in text, follows every change to the hp of the character,
+                        and drops the level to 1 and refills the hp for every death, in order
+
+        >>> strategy = Strategy()
+        >>> strategy.observe("Congrats you leveled up [Bot | hp: 40/100] [Rat | hp: 5/50] [Bot | hp: -12]")
+        >>> strategy.level, strategy.hp
+        (2, 28)
+        >>> strategy.observe("Rip, you died ... Congrats you leveled up")
+        >>> strategy.level, strategy.hp
+        (2, 100)
+        """
+        for change in re.finditer(Strategy.CHANGES.format(name=re.escape(name)), text):
+            if change["level_up"]:
+                self.level = min(self.level + 1, Character.MAX_LEVEL)
+            elif change["died"]:
+                self.level, self.hp = 1, self.max_hp
+            elif change["hp"]:
+                self.hp, self.max_hp = int(change["hp"]), int(change["max_hp"])
+            else:
+                self.hp = min(max(self.hp + int(change["difference"]), 0), self.max_hp)
+
+    def pick(self, menu: Menu, *options: str) -> str:
+        """
+        Return the command of the first of options that menu has.
+
+        :param menu: a Menu namedtuple
+        :param options: the names of options, from most to least preferred
+        :precondition: menu must be a Menu namedtuple
+        :postcondition: returns the command of the most preferred option on menu, or of a random option if menu has
+                        none of them
+        :return: a string
+
+        >>> Strategy().pick(Menu("Choice", [("1", "Fight"), ("2", "Flee")], ""), "Auto-resolve", "Fight")
+        '1'
+        """
+        commands = {option: command for command, option in menu.options}
+        for option in options:
+            if option in commands:
+                return commands[option]
+
+        return self.rng.choice(menu.options)[0]
+
+    def move(self, menu: Menu) -> str:
+        """
+        Return the command to choose on the menu of directions.
+
+        :param menu: a Menu namedtuple of the directions, travel, stats and quit
+        :precondition: menu must be the menu shown by Character.choose_direction
+        :postcondition: returns the command of any option but quit
+        :return: a string
+        """
+        return self.rng.choice([command for command, option in menu.options if option != "quit"])
+
+    def destination(self, menu: Menu) -> str:
+        """
+        Return the command to choose on the menu of travel destinations.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Board.choose_destination
+        :postcondition: returns the command of a destination
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+    def encounter(self, menu: Menu) -> str:
+        """
+        Return the command to choose when an enemy or a boss appears.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by the battle method of an enemy
+        :postcondition: returns the command of fighting, fleeing or auto-resolving
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+    def ability(self, menu: Menu) -> str:
+        """
+        Return the command of the ability to attack with.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown every round of Enemy.fight
+        :postcondition: returns the command of an ability
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+    def web(self, menu: Menu) -> str:
+        """
+        Return the command of the ability to clear the spider webs with.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by GenericRooms.spider_web_blockade
+        :postcondition: returns the command of an ability
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+    def answer(self, menu: Menu) -> str:
+        """
+        Return the command of the answer to a riddle.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Riddle.tell
+        :postcondition: returns the command of an answer
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+    def reward(self, menu: Menu) -> str:
+        """
+        Return the command of the reward for answering a riddle.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Riddle.riddle_success
+        :postcondition: returns the command of a new ability or of refilling hp
+        :return: a string
+        """
+        return self.rng.choice(menu.options)[0]
+
+
+class GreedyExplorer(Strategy):
+    """
+    A strategy that always travels to the nearest unsolved room and deals with whatever it finds there.
+
+    It flees from enemies above its level, then wanders a few random steps, so the nearest unsolved room is a different
+    one the next time it travels. Bosses are above every level the character can reach, so it fights them once it is
+    at the highest level and has all of its hp. Every death costs the levels the character has earned, so it also
+    flees from every enemy while it has less than RETREAT_HP of its hp.
+    """
+
+    name = "greedy"
+    STRONGER = "This enemies level is greater than yours"
+    WANDER_STEPS = 3
+    RETREAT_HP = 0.5
+
+    def reset(self, seed: int) -> None:
+        """
+        Prepare for a new game.
+
+        :param seed: an integer
+        :precondition: seed must be an integer
+        :postcondition: seeds the random choices of the strategy with seed, without any wandering left to do
+        """
+        super().reset(seed)
+        self.wander = 0
+
+    def move(self, menu: Menu) -> str:
+        """
+        Travel, or take a random step while wandering.
+
+        :param menu: a Menu namedtuple of the directions, travel, stats and quit
+        :precondition: menu must be the menu shown by Character.choose_direction
+        :postcondition: returns the command of a random direction while wandering, otherwise of travelling
+        :return: a string
+        """
+        if self.wander:
+            self.wander -= 1
+            return self.rng.choice([command for command, option in menu.options if command.isdigit()])
+
+        return self.pick(menu, "travel")
+
+    def destination(self, menu: Menu) -> str:
+        """
+        Choose the nearest unsolved room.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Board.choose_destination
+        :postcondition: returns the command of the nearest unsolved room
+        :return: a string
+        """
+        return self.pick(menu, "Nearest unsolved room")
+
+    def avoids(self, menu: Menu) -> bool:
+        """
+        Return whether to flee from the enemy of menu.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by the battle method of an enemy
+        :postcondition: returns True if the character has less than RETREAT_HP of its hp, or if the game warns that the
+                        enemy is stronger, unless it is a boss, which only offers to fight or flee, and the character is
+                        at the highest level with all of its hp
+        :return: True if the strategy should flee, otherwise False
+
+        >>> strategy = GreedyExplorer()
+        >>> boss = Menu("Choice", [("1", "Fight"), ("2", "Flee")], GreedyExplorer.STRONGER)
+        >>> strategy.avoids(boss), strategy.observe("Congrats you leveled up" * 2), strategy.avoids(boss)
+        (True, None, False)
+        >>> strategy.observe("[Bot | hp: -1]")
+        >>> strategy.avoids(boss)
+        True
+        """
+        if self.hp < self.max_hp * GreedyExplorer.RETREAT_HP:
+            return True
+        if GreedyExplorer.STRONGER not in menu.text:
+            return False
+
+        return len(menu.options) != 2 or self.level < Character.MAX_LEVEL or self.hp < self.max_hp
+
+    def encounter(self, menu: Menu) -> str:
+        """
+        Flee from the enemies the strategy avoids, and auto-resolve or fight the rest.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by the battle method of an enemy
+        :postcondition: returns the command of fleeing and starts wandering if the strategy avoids the enemy, otherwise
+                        returns the command of auto-resolving, or of fighting if there is no such option
+        :return: a string
+        """
+        if self.avoids(menu):
+            self.wander = GreedyExplorer.WANDER_STEPS
+            return self.pick(menu, "Flee")
+
+        return self.pick(menu, "Auto-resolve", "Fight")
+
+    def ability(self, menu: Menu) -> str:
+        """
+        Attack with the first ability.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown every round of Enemy.fight
+        :postcondition: returns the command of the first ability
+        :return: a string
+        """
+        return menu.options[0][0]
+
+    def web(self, menu: Menu) -> str:
+        """
+        Clear the webs with Fireball.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by GenericRooms.spider_web_blockade
+        :postcondition: returns the command of Fireball, or of a random ability if the character does not have it
+        :return: a string
+        """
+        return self.pick(menu, "Fireball")
+
+    def reward(self, menu: Menu) -> str:
+        """
+        Refill hp.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Riddle.riddle_success
+        :postcondition: returns the command of refilling hp
+        :return: a string
+        """
+        return self.pick(menu, "Refill HP to max")
+
+
+class BossRush(GreedyExplorer):
+    """
+    A strategy that travels straight to the next boss, and flees from the enemies a greedy explorer avoids.
+
+    After fleeing from a boss it explores the nearest unsolved rooms for a while to level up before trying again, and
+    once a boss is defeated it targets the next one.
+    """
+
+    name = "boss-rush"
+    BOSSES = ("Royal Mage Angelozzi", "Lord-Commander Ymir", "God-King Thompson")
+    TRAINING_ROOMS = 10
+    BOSS_NAMES = tuple(boss().get_template().name for boss in (RoyalMageAngelozzi, LordCommanderYmir, GodKingThompson))
+    DEFEATED = "You have defeated the "
+
+    def reset(self, seed: int) -> None:
+        """
+        Prepare for a new game.
+
+        :param seed: an integer
+        :precondition: seed must be an integer
+        :postcondition: targets the first boss, without any training or wandering left to do
+        """
+        super().reset(seed)
+        self.target = 0
+        self.training = 0
+
+    def observe(self, text: str, name: str = "Bot") -> None:
+        """
+        Follow the level and hp of the character and the bosses it defeats through text.
+
+        :param text: everything the game printed since the bot last answered
+        :param name: the name of the character. Default is "Bot"
+        :precondition: text must be the plain output of the game
+        :postcondition: follows the level and hp of the character, and targets the next boss once the current one is
+                        defeated
+
+        >>> strategy = BossRush()
+        >>> strategy.reset(0)
+        >>> strategy.observe("Congratulations! You have defeated the Royal Battle-Mage Angelozzi")
+        >>> BossRush.BOSSES[strategy.target]
+        'Lord-Commander Ymir'
+        """
+        super().observe(text, name)
+        if f"{BossRush.DEFEATED}{BossRush.BOSS_NAMES[self.target]}" in text:
+            self.target = min(self.target + 1, len(BossRush.BOSSES) - 1)
+
+    def destination(self, menu: Menu) -> str:
+        """
+        Choose the current boss, or the nearest unsolved room while training.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by Board.choose_destination
+        :postcondition: returns the command of the current boss, or of the nearest unsolved room while training
+        :return: a string
+        """
+        if self.training:
+            self.training -= 1
+            return self.pick(menu, "Nearest unsolved room")
+
+        return self.pick(menu, BossRush.BOSSES[self.target])
+
+    def encounter(self, menu: Menu) -> str:
+        """
+        Flee from the enemies the strategy avoids, and fight the rest.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be the menu shown by the battle method of an enemy
+        :postcondition: returns the command of fleeing if the strategy avoids the enemy, and starts training if the
+                        enemy is a boss
+        :return: a string
+
+        >>> strategy = BossRush()
+        >>> strategy.reset(0)
+        >>> strategy.encounter(Menu("Choice", [("1", "Fight"), ("2", "Flee")], BossRush.STRONGER))
+        '2'
+        >>> strategy.training
+        10
+        """
+        if self.avoids(menu) and len(menu.options) == 2:
+            self.training = BossRush.TRAINING_ROOMS
+
+        return super().encounter(menu)
+
+
+class Bot:
+    """
+    A player that plays whole games by reading the menus the game prints and answering them with a strategy.
+
+    The bot plays on a ScriptedConsole without color or pauses. A game that keeps asking for input without printing a
+    new menu for STALL_LIMIT answers in a row is stuck in a dead end, such as a room that cannot be left. So is a game
+    whose last LOOP_WINDOW answers repeat the same few answers over and over. Both are ended and reported as dead ends,
+    while a game that is still going after max_turns answers is ended as unfinished.
+    """
+
+    STALL_LIMIT = 100
+    LOOP_WINDOW = 600
+    LOOP_PERIOD = 12
+    HEADER = re.compile(r"^Command {2,}(\S.*)$", re.MULTILINE)
+    NAME_PROMPT = "Please enter a name for your character.."
+    SCREENS = {"Option": "move", "Destination": "destination", "Ability": "ability", "Response": "answer"}
+
+    def __init__(self, strategy: Strategy, name: str = "Bot", max_turns: int = 10000) -> None:
+        """
+        Instantiate a bot.
+
+        :param strategy: a Strategy object
+        :param name: the name of the character of the bot. Default is "Bot"
+        :param max_turns: a positive integer, the number of answers after which a game is ended. Default is 10000
+        :precondition: strategy must be a Strategy object
+        :precondition: max_turns must be a positive integer
+        :postcondition: instantiates a bot that has not played any game
+        """
+        self.strategy = strategy
+        self.name = name
+        self.max_turns = max_turns
+        self.seed = 0
+        self.inputs = []
+        self.menu = None
+        self.stalled = 0
+        self.dead_end = None
+
+    @staticmethod
+    def parse_menu(text: str) -> Menu:
+        """
+        Return the last menu printed in text.
+
+        :param text: the plain output of the game
+        :precondition: text must not contain any color escape sequences
+        :postcondition: returns the title and options of the last menu in text
+        :return: a Menu namedtuple, or None if text has no menu
+
+        >>> Bot.parse_menu("\\nCommand        Choice\\n1              Fight\\n2              Flee\\n\\nPlease choose")
+        Menu(title='Choice', options=[('1', 'Fight'), ('2', 'Flee')], text='\\nCommand        Choice\\n1              \
+Fight\\n2              Flee\\n\\nPlease choose')
+        """
+        headers = list(Bot.HEADER.finditer(text))
+        if not headers:
+            return None
+
+        options = []
+        for line in text[headers[-1].end():].lstrip("\n").split("\n"):
+            if not line.strip():
+                break
+            options.append((line[:15].strip(), line[15:].strip()))
+
+        return Menu(headers[-1].group(1).strip(), options, text)
+
+    def choose(self, menu: Menu) -> str:
+        """
+        Return the command the strategy chooses on menu.
+
+        :param menu: a Menu namedtuple
+        :precondition: menu must be a menu printed by the game
+        :postcondition: asks the method of the strategy for the kind of menu
+        :return: a string
+        """
+        if menu.title == "Choice":
+            if any(option == "Refill HP to max" for command, option in menu.options):
+                return self.strategy.reward(menu)
+            return self.strategy.encounter(menu)
+
+        if menu.title == "Ability" and ("webs" in menu.text or "will work here" in menu.text):
+            return self.strategy.web(menu)
+
+        return getattr(self.strategy, Bot.SCREENS.get(menu.title, "encounter"))(menu)
+
+    def __call__(self, prompt: str) -> str:
+        """
+        Answer the game.
+
+        :param prompt: everything the game printed since the last answer
+        :precondition: prompt must be the plain output of the game
+        :postcondition: returns the answer of the strategy to the last menu, or None once the game is in a dead end
+        :return: a string, or None to end the game
+        """
+        if len(self.inputs) >= self.max_turns:
+            return None
+
+        if Bot.NAME_PROMPT in prompt:
+            answer = self.name
+        else:
+            self.strategy.observe(prompt, self.name)
+            menu = Bot.parse_menu(prompt)
+            if menu is None:
+                # the game asked again without printing its menu, after an answer it did not accept
+                self.stalled += 1
+                if self.stalled >= Bot.STALL_LIMIT or self.menu is None:
+                    self.dead_end = f"stuck after {self.stalled} answers at: {prompt.strip()[-200:]!r}"
+                    return None
+                menu = self.menu._replace(text=prompt)
+            else:
+                self.stalled = 0
+                self.menu = menu
+            answer = self.choose(menu)
+
+        self.inputs.append(answer)
+        if len(self.inputs) % Bot.LOOP_WINDOW == 0:
+            period = Bot.loop_period(self.inputs[-Bot.LOOP_WINDOW:])
+            if period:
+                self.dead_end = f"repeating the same {period} answers: {self.inputs[-period:]}"
+                return None
+
+        return answer
+
+    @staticmethod
+    def loop_period(answers: list) -> int:
+        """
+        Return the length of the cycle that answers repeat, if they repeat a short one.
+
+        :param answers: a list of strings
+        :precondition: answers must be a list of strings
+        :postcondition: returns the shortest period of at most LOOP_PERIOD answers that answers repeat from start to end
+        :return: a positive integer, or 0 if answers do not repeat a short cycle
+
+        >>> Bot.loop_period(["t", "1", "3"] * 10), Bot.loop_period(["t", "1", "3", "2"] + ["t", "1", "3"] * 10)
+        (3, 0)
+        """
+        for period in range(1, min(Bot.LOOP_PERIOD, len(answers) // 2) + 1):
+            if answers[period:] == answers[:-period]:
+                return period
+
+        return 0
+
+    def play(self, seed: int, rows: int = 10, columns: int = 10) -> BotResult:
+        """
+        Play a whole game.
+
+        :param seed: an integer that determines the rooms of the board and the random choices of the strategy
+        :param rows: a positive integer. Default is 10
+        :param columns: a positive integer. Default is 10
+        :precondition: rows and columns must be accepted by Board
+        :postcondition: plays until the game is completed or quit, reaches a dead end or runs out of turns
+        :return: a BotResult namedtuple
+        """
+        self.seed, self.rows, self.columns = seed, rows, columns
+        self.inputs, self.menu, self.stalled, self.dead_end = [], None, 0, None
+        self.strategy.reset(seed)
+
+        start = time.perf_counter()
+        result = Game.play(rows, columns, seed=seed, pacer=HeadlessPacer(), console=ScriptedConsole(self, color=False))
+        seconds = time.perf_counter() - start
+
+        return BotResult(self.strategy.name, seed, len(self.inputs), seconds, result.achieved_goal, self.dead_end,
+                         Replay.final_stats(result))
+
+    def replay(self) -> Replay:
+        """
+        Return the last game of the bot as a replay.
+
+        :precondition: the bot must have played a game
+        :postcondition: returns a replay of the board and answers of the last game
+        :return: a Replay object
+        """
+        return Replay(list(self.inputs), self.seed, self.rows, self.columns)
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (Strategy, GreedyExplorer, BossRush)}
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    parser = argparse.ArgumentParser(description="Play Reign of Fire with bots to find slow paths, leaks and dead ends")
+    parser.add_argument("--strategy", choices=tuple(STRATEGIES), action="append",
+                        help="the strategy to play with, which can be given more than once. Every strategy by default")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="the number of games of every strategy, 1000 by default")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the first game, 0 by default")
+    parser.add_argument("--max-turns", type=int, default=10000,
+                        help="the number of answers after which a game is ended as unfinished, 10000 by default")
+    parser.add_argument("--save-dead-ends", metavar="DIRECTORY",
+                        help="save a replay of every game that reached a dead end into this directory")
+    parser.add_argument("--memory", action="store_true", help="trace how much memory grows over the games")
+    parser.add_argument("--profile", action="store_true", help="print the functions the games spend most time in")
+    arguments = parser.parse_args()
+
+    profiler = cProfile.Profile() if arguments.profile else None
+    print(f"{'strategy':<12}{'games':>7}{'wins':>7}{'dead ends':>11}{'unfinished':>12}{'turns':>9}{'turns/s':>10}"
+          f"{'slowest':>16}")
+
+    for name in arguments.strategy or STRATEGIES:
+        bot = Bot(STRATEGIES[name](), max_turns=arguments.max_turns)
+        if arguments.memory:
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+        if profiler is not None:
+            profiler.enable()
+
+        results = []
+        for seed in range(arguments.seed, arguments.seed + arguments.games):
+            results.append(bot.play(seed))
+            if results[-1].dead_end is not None and arguments.save_dead_ends:
+                os.makedirs(arguments.save_dead_ends, exist_ok=True)
+                bot.replay().save(os.path.join(arguments.save_dead_ends, f"{name}_seed_{seed}.json"))
+
+        if profiler is not None:
+            profiler.disable()
+
+        turns = sum(result.turns for result in results)
+        seconds = sum(result.seconds for result in results)
+        slowest = max(results, key=lambda result: result.seconds)
+        dead_ends = [result for result in results if result.dead_end is not None]
+        unfinished = sum(result.turns >= arguments.max_turns and result.dead_end is None for result in results)
+        print(f"{name:<12}{len(results):>7}{sum(result.achieved_goal for result in results):>7}{len(dead_ends):>11}"
+              f"{unfinished:>12}{turns / len(results):>9.0f}{turns / seconds:>10.0f}"
+              f"{f'seed {slowest.seed} {slowest.seconds * 1000:.0f} ms':>16}")
+
+        for result in dead_ends[:10]:
+            print(f"    seed {result.seed}: {result.dead_end}")
+        if len(dead_ends) > 10:
+            print(f"    and {len(dead_ends) - 10} more")
+
+        if arguments.memory:
+            growth = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            tracemalloc.stop()
+            print(f"    memory grew by {sum(stat.size_diff for stat in growth) / 1024:.0f} KiB, most at:")
+            for stat in growth[:3]:
+                print(f"        {stat}")
+
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ class Character:
     Represents a player character in the game.
     """
 
+    MAX_LEVEL = 3
+    LEVEL_UP_XP = 60
+
     def __init__(self, name: str) -> None:
         """
         Instantiate a new character object with name.
@@ -195,64 +198,115 @@ class Character:
         """
         self.__abilities.append(new_ability)
 
-    def show_stats(self) -> None:
+    def get_state(self) -> dict:
+        """
+        Get everything about the character that can change during a game.
+
+        :postcondition: returns the name, position, hp, xp, damage, level, abilities and items of the character
+        :return: a dictionary of json values
+
+        >>> Character("Hero").get_state()["position"]
+        [1, 1]
+        """
+        return {
+            "name": self.__name,
+            "position": list(self.__position),
+            "max_hp": self.__max_hp,
+            "current_hp": self.__current_hp,
+            "xp": self.__xp,
+            "damage": self.__damage,
+            "level": self.__level,
+            "abilities": list(self.__abilities),
+            "staff": self.__staff,
+            "armour": self.__armour
+        }
+
+    def set_state(self, state: dict) -> None:
         """
-        Print the character's statistics formatted to stdout.
+        Set everything about the character that can change during a game.
 
-        :postcondition: prints the character's statistics formatted to stdout
+        :param state: a dictionary returned by get_state
+        :precondition: state must be a dictionary returned by get_state, possibly with only some of its keys
+        :postcondition: sets every attribute of the character that state has a key for
+
+        >>> character = Character("Hero")
+        >>> character.set_state({"position": [2, 3], "level": 2})
+        >>> character.get_position(), character.get_level()
+        ((2, 3), 2)
+        """
+        for key, value in state.items():
+            if key == "position":
+                value = tuple(value)
+            elif key == "abilities":
+                value = list(value)
+            setattr(self, f"_Character__{key}", value)
+
+    def show_stats(self, board=None) -> None:
         """
-        print('+----------------------------------------------------------------------------------+')
-        print('|', end="")
+        Print the character's statistics formatted to the current console.
+
+        :param board: a Board object or None. Default is None, which leaves out the board progress
+        :precondition: board must be a Board object or None
+        :postcondition: prints the character's statistics formatted to the current console
+        """
+        Helpers.print_plain('+----------------------------------------------------------------------------------+')
+        Helpers.print_plain('|', end="")
         Helpers.print_in_color('{:^82}'.format(self.__name), "red", end="")
-        print('|')
-        print('+----------------------------------------------------------------------------------+')
+        Helpers.print_plain('|')
+        Helpers.print_plain('+----------------------------------------------------------------------------------+')
 
         general_stats = [
             ("Current Coordinates", self.__position),
             ("Level", self.__level),
             ("HP", f"{round(self.__current_hp)}/{self.__max_hp}"),
         ]
-        xp_stat = ("XP (to next level)", f"{round(self.__xp)}/60") if self.__level < 3 \
+        xp_stat = ("XP (to next level)", f"{round(self.__xp)}/{Character.LEVEL_UP_XP}") \
+            if self.__level < Character.MAX_LEVEL \
             else ("XP (to next level)", "Max")
 
         general_stats.append(xp_stat)
 
+        if board is not None:
+            solved, rooms = board.progress()
+            general_stats.append(("Rooms Cleared", f"{solved}/{rooms} ({solved / rooms:.0%})"))
+
         for title, stat in general_stats:
-            print('{:<18}'.format("|"), end="")
+            Helpers.print_plain('{:<18}'.format("|"), end="")
             Helpers.print_in_color(f"{title:<20}", "blue", end="")
-            print("{:<45}".format(f": [ {stat} ]"), end="")
-            print('|')
+            Helpers.print_plain("{:<45}".format(f": [ {stat} ]"), end="")
+            Helpers.print_plain('|')
 
-        print('+----------------------------------------------------------------------------------+')
+        Helpers.print_plain('+----------------------------------------------------------------------------------+')
 
         inventory_stats = (
             ("Staff", self.__staff),
             ("Armour", self.__armour)
         )
         for item, gear in inventory_stats:
-            print('{:<18}'.format("|"), end="")
+            Helpers.print_plain('{:<18}'.format("|"), end="")
             Helpers.print_in_color(f"{item:<20}", "blue", end="")
             try:
-                print('{:<54}'.format(
-                    f": [ {gear['name']} (\033[93m{'*' * gear['rarity']}\033[0m) ]"),
-                    end="")
+                stars = '*' * gear['rarity']
+                Helpers.print_plain(f": [ {gear['name']} (", end="")
+                Helpers.print_in_color(stars, "yellow", end="")
+                Helpers.print_plain('{:<{}}'.format(") ]", 45 - len(f": [ {gear['name']} ({stars}")), end="")
             except TypeError:
-                print('{:<45}'.format(f": None"), end="")
-            print('|')
+                Helpers.print_plain('{:<45}'.format(f": None"), end="")
+            Helpers.print_plain('|')
 
-        print('+----------------------------------------------------------------------------------+')
+        Helpers.print_plain('+----------------------------------------------------------------------------------+')
 
-        print('{:<18}'.format("|"), end="")
+        Helpers.print_plain('{:<18}'.format("|"), end="")
         Helpers.print_in_color("{:<20}".format("Abilities"), "blue", end="")
-        print("{:<45}".format(f": [ {self.__abilities[0]} ]"), end="")
-        print('|')
+        Helpers.print_plain("{:<45}".format(f": [ {self.__abilities[0]} ]"), end="")
+        Helpers.print_plain('|')
 
         for ability in self.__abilities[1:]:
-            print('{:<38}'.format("|"), end="")
-            print("{:<45}".format(f"  [ {ability} ]"), end="")
-            print('|')
+            Helpers.print_plain('{:<38}'.format("|"), end="")
+            Helpers.print_plain("{:<45}".format(f"  [ {ability} ]"), end="")
+            Helpers.print_plain('|')
 
-        print('+----------------------------------------------------------------------------------+')
+        Helpers.print_plain('+----------------------------------------------------------------------------------+')
 
     def choose_direction(self, board) -> str:
         """
@@ -267,7 +321,7 @@ class Character:
         possible_directions = [direction for direction, coord in current_room["directions"].items() if
                                coord is not None]
 
-        options = [('q', "quit"), ('s', "show stats")]
+        options = [('q', "quit"), ('s', "show stats"), ('t', "travel")]
         options += list(enumerate(possible_directions, start=1))
 
         Helpers.print_user_options(options, "Option")
@@ -283,9 +337,11 @@ class Character:
         :precondition: direction must be one of the following strings in lowercase: "north", "east", "south", "west"
         :precondition: board must be a Board object
         :postcondition: changes the character position according to the direction they moved
+        :postcondition: marks the new position as visited on board
         """
         current_room = board.get_board()[self.__position]
         self.__position = current_room["directions"][direction]
+        board.grid.set_visited(self.__position)
 
     def is_alive(self) -> bool:
         """
@@ -306,7 +362,7 @@ class Character:
         :postcondition: returns True if the character leveled up, otherwise False
         :return: True if the character leveled up, otherwise False
         """
-        return True if (self.__xp >= 60) and (self.__level < 3) else False
+        return True if (self.__xp >= Character.LEVEL_UP_XP) and (self.__level < Character.MAX_LEVEL) else False
 
     def level_up_sequence(self) -> None:
         """
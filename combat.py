@@ -0,0 +1,132 @@
+"""
+Module containing the Combat class.
+"""
+import math
+from collections import namedtuple
+
+CharacterStats = namedtuple("CharacterStats", ("hp", "damage", "level", "staff_rarity"))
+EnemyStats = namedtuple("EnemyStats", ("hp", "level"))
+FightOutcome = namedtuple("FightOutcome", ("won", "rounds", "character_hp", "enemy_hp", "damage_given",
+                                           "damage_taken"))
+
+
+class Combat:
+    """
+    Class containing the rules of combat between the character and an enemy.
+
+    Every round the character hits the enemy, then the enemy hits the character, each for an amount that stays the
+    same for the whole fight. The fight ends after the first round that leaves either of them without hp, so its
+    outcome can be computed directly instead of round by round.
+    """
+
+    FIGHT_XP = 15
+
+    @staticmethod
+    def character_stats(character) -> CharacterStats:
+        """
+        Return the combat statistics of character.
+
+        :param character: a Character object
+        :precondition: character must be a Character object
+        :postcondition: returns the statistics of character that combat depends on
+        :return: a CharacterStats namedtuple
+        """
+        staff = character.get_staff()
+
+        return CharacterStats(character.get_current_hp(), character.get_damage(), character.get_level(),
+                              staff["rarity"] if staff else 0)
+
+    @staticmethod
+    def damage_given(stats: CharacterStats) -> int:
+        """
+        Return the damage the character deals to an enemy every round.
+
+        :param stats: a CharacterStats namedtuple
+        :precondition: stats must be a CharacterStats namedtuple
+        :postcondition: returns character damage * character level * (1 + (0.2 * staff rarity)), rounded
+        :return: a non-negative integer
+
+        >>> Combat.damage_given(CharacterStats(hp=100, damage=20, level=2, staff_rarity=1))
+        48
+        """
+        return round(stats.damage * stats.level * (1 + (0.2 * stats.staff_rarity)))
+
+    @staticmethod
+    def damage_taken(enemy_level: int) -> int:
+        """
+        Return the damage an enemy deals to the character every round.
+
+        :param enemy_level: a positive integer
+        :precondition: enemy_level must be a positive integer
+        :postcondition: returns 10 * (1 + (0.2 * enemy level)), rounded
+        :return: a non-negative integer
+
+        >>> Combat.damage_taken(3)
+        16
+        """
+        return round(10 * (1 + (0.2 * enemy_level)))
+
+    @staticmethod
+    def fight_xp(enemy_level: int, character_level: int) -> int:
+        """
+        Return the experience earned by defeating an enemy.
+
+        :param enemy_level: a positive integer
+        :param character_level: a positive integer
+        :precondition: enemy_level and character_level must be positive integers
+        :postcondition: returns 15 for every level the enemy has above the character, plus 15
+        :return: a positive integer
+
+        >>> Combat.fight_xp(3, 1), Combat.fight_xp(1, 2)
+        (45, 15)
+        """
+        if enemy_level > character_level:
+            return Combat.FIGHT_XP * ((enemy_level - character_level) + 1)
+
+        return Combat.FIGHT_XP
+
+    @staticmethod
+    def resolve_fight(character_stats: CharacterStats, enemy_stats: EnemyStats) -> FightOutcome:
+        """
+        Return the outcome of a fight in constant time.
+
+        :param character_stats: a CharacterStats namedtuple
+        :param enemy_stats: an EnemyStats namedtuple
+        :precondition: character_stats and enemy_stats must hold non-negative numbers
+        :postcondition: returns the outcome of fighting round by round until either side has no hp left
+        :return: a FightOutcome namedtuple
+        :raise ValueError: if neither side can ever damage the other while both have hp
+
+        >>> Combat.resolve_fight(CharacterStats(100, 20, 1, 0), EnemyStats(hp=100, level=1))
+        FightOutcome(won=True, rounds=5, character_hp=40, enemy_hp=0, damage_given=20, damage_taken=12)
+        >>> Combat.resolve_fight(CharacterStats(30, 20, 1, 0), EnemyStats(hp=100, level=1))
+        FightOutcome(won=False, rounds=3, character_hp=0, enemy_hp=40, damage_given=20, damage_taken=12)
+        """
+        given = Combat.damage_given(character_stats)
+        taken = Combat.damage_taken(enemy_stats.level)
+
+        if character_stats.hp <= 0 or enemy_stats.hp <= 0:
+            rounds = 0
+        elif given <= 0 and taken <= 0:
+            raise ValueError("Neither side can damage the other, the fight would never end!")
+        else:
+            rounds_to_win = math.ceil(enemy_stats.hp / given) if given > 0 else math.inf
+            rounds_to_lose = math.ceil(character_stats.hp / taken) if taken > 0 else math.inf
+            rounds = min(rounds_to_win, rounds_to_lose)
+
+        character_hp = max(0, character_stats.hp - rounds * taken)
+        enemy_hp = max(0, enemy_stats.hp - rounds * given)
+
+        return FightOutcome(enemy_hp <= 0 < character_hp, rounds, character_hp, enemy_hp, given, taken)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the combat.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
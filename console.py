@@ -0,0 +1,489 @@
+"""
+Module containing the Console class and its terminal, memory, scripted and socket implementations.
+"""
+import abc
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import contextvars
+import os
+import re
+import sys
+from collections import deque
+
+
+class Console(abc.ABC):
+    """
+    The input and output of one game session.
+
+    Everything the game shows is written to the console of the current context, and every choice the player makes is
+    read from it, so a process can host many sessions at once, each on its own console. A console can also be used
+    as a writable text stream. A silent console throws its output away, so anything expensive to draw can be skipped,
+    and a console without color shows text without any escape sequences.
+    """
+
+    silent = False
+    color = True
+    __current = contextvars.ContextVar("console")
+
+    @staticmethod
+    def current() -> "Console":
+        """
+        Return the console of the current context.
+
+        :postcondition: returns the console set by the closest enclosing Console.use, or the terminal console
+        :return: a Console object
+        """
+        return Console.__current.get(TERMINAL)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def use(console: "Console"):
+        """
+        Make console the console of the current context inside a with statement.
+
+        :param console: a Console object
+        :precondition: console must be a Console object
+        :postcondition: makes console the current console until the with statement ends
+        :return: a context manager that yields console
+        """
+        token = Console.__current.set(console)
+        try:
+            yield console
+        finally:
+            Console.__current.reset(token)
+
+    @abc.abstractmethod
+    def write(self, text: str) -> None:
+        """
+        Show text to the player.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: shows text exactly as given, without adding a new line
+        """
+
+    @abc.abstractmethod
+    def read(self) -> str:
+        """
+        Return the next line entered by the player.
+
+        :postcondition: returns the next line of input, without its line ending
+        :return: a string
+        :raise EOFError: if the player has no more input to give
+        """
+
+    def flush(self) -> None:
+        """
+        Make sure everything written so far has been shown.
+
+        :postcondition: does nothing unless the console buffers its output
+        """
+
+
+class TerminalConsole(Console):
+    """
+    A console on the standard input and output of the process.
+
+    Output is buffered and written to stdout in one call when the console is flushed, which happens before every read
+    and pause, or once the buffer grows past BUFFER_LIMIT characters. Colors are left out when stdout is not a
+    terminal, or when the NO_COLOR environment variable is set.
+    """
+
+    BUFFER_LIMIT = 1 << 16
+
+    def __init__(self) -> None:
+        """
+        Instantiate a terminal console with an empty buffer.
+
+        :postcondition: instantiates a terminal console that has not written to any stream yet
+        """
+        self.stream = None
+        self.colored = False
+        self.buffer = []
+        self.buffered = 0
+
+    @property
+    def color(self) -> bool:
+        """
+        Determine if text written now should be colored.
+
+        :postcondition: returns if the current sys.stdout should get colors
+        :return: True if the current sys.stdout should get colors, otherwise False
+        """
+        self.follow_stdout()
+        return self.colored
+
+    def follow_stdout(self) -> None:
+        """
+        Switch to the current sys.stdout if it has been replaced since the last write.
+
+        :postcondition: flushes the buffer to the previous stream and checks if the new stream wants colors
+        """
+        stream = sys.stdout
+        if stream is not self.stream:
+            self.flush()
+            self.stream = stream
+            self.colored = TerminalConsole.wants_color(stream)
+
+    @staticmethod
+    def wants_color(stream) -> bool:
+        """
+        Determine if text written to stream should be colored.
+
+        :param stream: a writable text stream
+        :precondition: stream must be a writable text stream
+        :postcondition: returns False if NO_COLOR is set to a non-empty value or stream is not a terminal
+        :return: True if stream should get colors, otherwise False
+        """
+        if os.environ.get("NO_COLOR"):
+            return False
+
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def write(self, text: str) -> None:
+        """
+        Add text to the buffer of stdout.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: buffers text for the current sys.stdout, first flushing anything buffered for another stream
+        """
+        self.follow_stdout()
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= TerminalConsole.BUFFER_LIMIT:
+            self.flush()
+
+    def read(self) -> str:
+        """
+        Return the next line of stdin.
+
+        :postcondition: returns the next line of stdin, without its line ending
+        :return: a string
+        :raise EOFError: if stdin is closed
+        """
+        return input()
+
+    def flush(self) -> None:
+        """
+        Write the buffer to the stream it was written for, and flush that stream.
+
+        :postcondition: empties the buffer and flushes the stream, if anything has been written
+        :postcondition: drops the buffer if the stream has been closed in the meantime
+        """
+        if self.stream is None or getattr(self.stream, "closed", False):
+            self.buffer.clear()
+            self.buffered = 0
+            return
+
+        if self.buffer:
+            text = "".join(self.buffer)
+            self.buffer.clear()
+            self.buffered = 0
+            self.stream.write(text)
+
+        self.stream.flush()
+
+
+class MemoryConsole(Console):
+    """
+    A console that reads from a list of lines and keeps its output in memory.
+    """
+
+    def __init__(self, inputs=(), record: bool = True, color: bool = True) -> None:
+        """
+        Instantiate a memory console.
+
+        :param inputs: an iterable of strings that are read one at a time. Default is an empty tuple
+        :param record: a boolean representing if output should be kept. Default is True
+        :param color: a boolean representing if output should be colored. Default is True
+        :precondition: inputs must be an iterable of strings
+        :precondition: record and color must be booleans
+        :postcondition: instantiates a memory console without any output
+        """
+        self.inputs = deque(inputs)
+        self.record = record
+        self.silent = not record
+        self.color = color
+        self.chunks = []
+
+    def feed(self, *lines: str) -> None:
+        """
+        Add lines to the end of the input.
+
+        :param lines: strings
+        :precondition: lines must be strings
+        :postcondition: adds lines to the input, after the lines that have not been read yet
+        """
+        self.inputs.extend(lines)
+
+    def write(self, text: str) -> None:
+        """
+        Keep text if the console records its output.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: appends text to the output if the console records its output
+        """
+        if self.record:
+            self.chunks.append(text)
+
+    def read(self) -> str:
+        """
+        Return the next line of input.
+
+        :postcondition: removes the next line from the input and returns it
+        :return: a string
+        :raise EOFError: if every line has been read
+
+        >>> console = MemoryConsole(["north"])
+        >>> console.read()
+        'north'
+        >>> console.read()
+        Traceback (most recent call last):
+        ...
+        EOFError: No more input
+        """
+        if not self.inputs:
+            raise EOFError("No more input")
+
+        return self.inputs.popleft()
+
+    def output(self) -> str:
+        """
+        Return everything written to the console.
+
+        :postcondition: returns the recorded output as one string
+        :return: a string
+        """
+        return "".join(self.chunks)
+
+
+class ScriptedConsole(MemoryConsole):
+    """
+    A console whose input is decided by a script, such as a bot, that sees the output since its last answer.
+    """
+
+    def __init__(self, script, record: bool = False, silent: bool = False, color: bool = True) -> None:
+        """
+        Instantiate a scripted console.
+
+        :param script: a callable accepting the output since the last read as a string, and returning the next line
+                       of input, or None to end the input
+        :param record: a boolean representing if the whole output should be kept as well. Default is False
+        :param silent: a boolean representing if the output should be skipped, for scripts that never look at it.
+                       Default is False
+        :param color: a boolean representing if output should be colored. Default is True
+        :precondition: script must be a callable
+        :precondition: record, silent and color must be booleans
+        :postcondition: instantiates a scripted console that has not asked its script anything yet
+        """
+        super().__init__(record=record, color=color)
+        self.silent = silent
+        self.script = script
+        self.pending = []
+
+    def write(self, text: str) -> None:
+        """
+        Keep text until the script is asked for its next line.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: keeps text for the script, and for the output if the console records it
+        """
+        self.pending.append(text)
+        if self.record:
+            self.chunks.append(text)
+
+    def read(self) -> str:
+        """
+        Return the line the script answers to the output since the last read.
+
+        :postcondition: asks the script for the next line, passing it the output since the last read
+        :return: a string
+        :raise EOFError: if the script returns None
+
+        >>> console = ScriptedConsole(lambda prompt: "yes" if prompt.endswith("?") else None)
+        >>> console.write("Continue?")
+        >>> console.read()
+        'yes'
+        >>> console.read()
+        Traceback (most recent call last):
+        ...
+        EOFError: The script ended
+        """
+        prompt = "".join(self.pending)
+        self.pending.clear()
+
+        line = self.script(prompt)
+        if line is None:
+            raise EOFError("The script ended")
+
+        return line
+
+
+class SocketConsole(Console):
+    """
+    A console on an asyncio stream connection, used by a game running in another thread than the event loop.
+
+    Output is buffered and handed to the event loop in one call when the console is flushed, which happens before
+    every read and pause, or once the buffer grows past DRAIN_LIMIT characters. The event loop writes it and waits for
+    the connection to drain if its write buffer is above its high-water mark, and the flush waits for both, so a slow
+    client holds up its own game instead of filling the memory of the server. Reads block the game thread until a
+    line arrives, and telnet commands are removed from every line read.
+    """
+
+    DRAIN_LIMIT = 1 << 16
+    TELNET_COMMAND = re.compile(rb"\xff(\xff)|\xff(?:\xfa.*?\xff\xf0|[\xfb-\xfe].|[\xf0-\xf9])", re.DOTALL)
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, loop: asyncio.AbstractEventLoop,
+                 timeout: float = None, encoding: str = "utf-8", color: bool = True) -> None:
+        """
+        Instantiate a socket console.
+
+        :param reader: the asyncio.StreamReader of the connection
+        :param writer: the asyncio.StreamWriter of the connection
+        :param loop: the event loop that runs the connection
+        :param timeout: the number of seconds to wait for a line, or for a slow client to drain, before the player
+                        counts as gone. Default is None, which waits forever
+        :param encoding: the name of the text encoding of the connection. Default is "utf-8"
+        :param color: a boolean representing if output should be colored. Default is True
+        :precondition: reader, writer and loop must belong to the same open connection
+        :postcondition: instantiates a console on the connection with an empty buffer
+        """
+        self.reader = reader
+        self.writer = writer
+        self.loop = loop
+        self.timeout = timeout
+        self.encoding = encoding
+        self.color = color
+        self.buffer = []
+        self.buffered = 0
+        self.timed_out = False
+
+    def write(self, text: str) -> None:
+        """
+        Add text to the buffer of the connection.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: buffers text for the connection, and flushes the buffer once it holds DRAIN_LIMIT characters
+        """
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= SocketConsole.DRAIN_LIMIT:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send the buffer to the player, and wait until the connection can take more.
+
+        :postcondition: writes the buffer to the connection on the event loop, with new lines sent as CRLF, and waits
+                        until the connection has drained if its write buffer is above its high-water mark
+        :postcondition: drops the buffer if the connection is closing
+        :postcondition: aborts the connection if it does not drain within the timeout, so the next read ends the game
+        """
+        if not self.buffer:
+            return
+
+        data = "".join(self.buffer).replace("\n", "\r\n").encode(self.encoding, "replace")
+        self.buffer.clear()
+        self.buffered = 0
+        if self.writer.is_closing():
+            return
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.send(data), self.loop)
+        except RuntimeError:
+            return
+
+        try:
+            future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.timed_out = True
+            self.loop.call_soon_threadsafe(self.writer.transport.abort)
+        except (concurrent.futures.CancelledError, ConnectionError):
+            pass
+
+    async def send(self, data: bytes) -> None:
+        """
+        Write data to the connection and wait until it can take more.
+
+        :param data: a bytes object
+        :precondition: send must run on the event loop of the connection
+        :postcondition: writes data, then waits for the write buffer to fall below its low-water mark if writing data
+                        took it above the high-water mark, which returns at once for a client that keeps up
+        """
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def read(self) -> str:
+        """
+        Return the next line sent by the player.
+
+        :postcondition: flushes the buffer, then blocks until a full line arrives, and returns it without its line
+                        ending or telnet commands
+        :postcondition: sets timed_out to True if no line arrives within the timeout
+        :return: a string
+        :raise EOFError: if the connection closes or no line arrives within the timeout
+        """
+        self.flush()
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.reader.readline(), self.loop)
+        except RuntimeError as error:
+            raise EOFError("The connection was closed") from error
+
+        try:
+            line = future.result(self.timeout)
+        except concurrent.futures.TimeoutError as error:
+            future.cancel()
+            self.timed_out = True
+            raise EOFError("The player was idle for too long") from error
+        except (concurrent.futures.CancelledError, ConnectionError, ValueError) as error:
+            future.cancel()
+            raise EOFError("The connection was closed") from error
+
+        if not line:
+            raise EOFError("The connection was closed")
+
+        return SocketConsole.strip_telnet(line).decode(self.encoding, "replace").rstrip("\r\n\0")
+
+    @staticmethod
+    def strip_telnet(line: bytes) -> bytes:
+        r"""
+        Remove the telnet commands from line.
+
+        :param line: a bytes object received from a telnet client
+        :precondition: line must be a bytes object
+        :postcondition: removes every telnet command and option negotiation, and unescapes doubled IAC bytes
+        :return: a bytes object
+
+        >>> SocketConsole.strip_telnet(b"\xff\xfb\x01north\xff\xf4\r\n")
+        b'north\r\n'
+        """
+        if b"\xff" not in line:
+            return line
+
+        return SocketConsole.TELNET_COMMAND.sub(lambda match: match.group(1) or b"", line)
+
+
+TERMINAL = TerminalConsole()
+atexit.register(TERMINAL.flush)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the console.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
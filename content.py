@@ -0,0 +1,637 @@
+"""
+Module containing the ContentRegistry class.
+"""
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import threading
+import time
+from array import array
+from collections.abc import Sequence
+from types import MappingProxyType
+from enemies import EnemyTemplate
+
+
+class ContentPack(Sequence):
+    """
+    The records of a content pack, each made read-only the first time it is read.
+    """
+
+    __slots__ = ("records", "frozen")
+
+    def __init__(self, records: list) -> None:
+        """
+        Instantiate a content pack holding records.
+
+        :param records: a list of plain records
+        :precondition: records must be a list of records parsed from json
+        :postcondition: instantiates a content pack that has not frozen any record yet
+        """
+        self.records = records
+        self.frozen = [None] * len(records)
+
+    def __len__(self) -> int:
+        """
+        Return the number of records in the content pack.
+
+        :postcondition: returns the number of records in the content pack
+        :return: an integer
+        """
+        return len(self.records)
+
+    def __getitem__(self, index):
+        """
+        Return the record at index, or a tuple of the records in a slice.
+
+        :param index: an integer or a slice
+        :precondition: index must be a valid index or slice of the content pack
+        :postcondition: freezes and remembers every record returned that had not been read before
+        :return: a read-only record mapping, or a tuple of them if index is a slice
+        :raise IndexError: if index is out of range
+        """
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(*index.indices(len(self.records))))
+
+        record = self.frozen[index]
+        if record is None:
+            record = self.frozen[index] = ContentRegistry.freeze(self.records[index])
+
+        return record
+
+
+class StreamingPack(Sequence):
+    """
+    The records of a line-delimited content pack, read from disk one record at a time.
+
+    Only an index of the byte offset of every line is kept in memory. A record is parsed, made read-only and
+    remembered the first time it is read, so a board that uses a few records of a huge pack only ever parses those.
+    """
+
+    INDEX_FORMAT = 1
+
+    def __init__(self, path: str, index_path: str = None) -> None:
+        """
+        Instantiate a streaming content pack over the line-delimited json file at path.
+
+        :param path: a path as a string
+        :param index_path: a path as a string, or None. Default is None, which keeps the offset index in memory only
+        :precondition: path must be a file holding one json record per line
+        :postcondition: loads the offset index from index_path if it matches the file, otherwise builds and stores it
+        """
+        self.path = path
+        self.file_object = open(path, "rb")
+        self.lock = threading.Lock()
+        self.frozen = {}
+
+        source = os.fstat(self.file_object.fileno())
+        self.offsets = StreamingPack.load_index(index_path, source) if index_path is not None else None
+        if self.offsets is None:
+            self.offsets = StreamingPack.build_index(self.file_object)
+            if index_path is not None:
+                StreamingPack.store_index(index_path, self.offsets, source)
+
+    @staticmethod
+    def build_index(file_object) -> array:
+        """
+        Return the byte offset of every non-blank line of a binary file.
+
+        :param file_object: a file object opened in binary mode
+        :precondition: file_object must be readable from its start
+        :postcondition: scans the whole file once without parsing any record
+        :return: an array of unsigned 64-bit integers
+        """
+        offsets = array('Q')
+        position = 0
+
+        file_object.seek(0)
+        for line in file_object:
+            if line.strip():
+                offsets.append(position)
+            position += len(line)
+
+        return offsets
+
+    @staticmethod
+    def load_index(index_path: str, source: os.stat_result):
+        """
+        Return the offset index stored at index_path, if it was built from the file as it is now.
+
+        :param index_path: a path as a string
+        :param source: the os.stat_result of the line-delimited json file
+        :precondition: index_path must be a string
+        :postcondition: returns the stored offsets if the index file is readable and up to date
+        :return: an array of unsigned 64-bit integers, or None if the index is missing, corrupt or stale
+        """
+        index = array('Q')
+
+        try:
+            with open(index_path, "rb") as file_object:
+                index.frombytes(file_object.read())
+        except (OSError, ValueError):
+            return None
+
+        if len(index) < 3 or tuple(index[:3]) != (StreamingPack.INDEX_FORMAT, source.st_size, source.st_mtime_ns):
+            return None
+
+        return index[3:]
+
+    @staticmethod
+    def store_index(index_path: str, offsets: array, source: os.stat_result) -> None:
+        """
+        Write an offset index to index_path, tagged with the size and mtime of the file it was built from.
+
+        :param index_path: a path as a string
+        :param offsets: an array of unsigned 64-bit integers
+        :param source: the os.stat_result of the line-delimited json file
+        :precondition: offsets must have been built from the file described by source
+        :postcondition: writes the index file, or leaves no file behind if it cannot be written
+        """
+        temporary_path = f"{index_path}.{os.getpid()}.tmp"
+        index = array('Q', (StreamingPack.INDEX_FORMAT, source.st_size, source.st_mtime_ns)) + offsets
+
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(temporary_path, "wb") as file_object:
+                index.tofile(file_object)
+            os.replace(temporary_path, index_path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def convert(source_path: str, destination_path: str) -> int:
+        """
+        Convert a json content pack holding an array of records into a line-delimited one.
+
+        :param source_path: a path as a string
+        :param destination_path: a path as a string
+        :precondition: source_path must be a json file holding an array of records
+        :postcondition: replaces destination_path in one step with every record of source_path, one compact json
+                        record per line, so a pack streamed from the old file is never read half written
+        :return: the number of records written
+        :raise OSError: if destination_path cannot be written
+        """
+        with open(source_path, encoding="utf-8") as file_object:
+            records = json.load(file_object)
+
+        descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{os.path.basename(destination_path)}.",
+                                                      dir=os.path.dirname(os.path.abspath(destination_path)))
+        try:
+            with open(descriptor, "w", encoding="utf-8") as file_object:
+                for record in records:
+                    file_object.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                    file_object.write("\n")
+            os.replace(temporary_path, destination_path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            raise
+
+        return len(records)
+
+    def __len__(self) -> int:
+        """
+        Return the number of records in the content pack.
+
+        :postcondition: returns the number of records in the content pack
+        :return: an integer
+        """
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """
+        Return the record at index, or a tuple of the records in a slice.
+
+        :param index: an integer or a slice
+        :precondition: index must be a valid index or slice of the content pack
+        :postcondition: reads, parses and remembers every record returned that had not been read before
+        :return: a read-only record mapping, or a tuple of them if index is a slice
+        :raise IndexError: if index is out of range
+        """
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(*index.indices(len(self.offsets))))
+
+        offset = self.offsets[index]
+        record = self.frozen.get(offset)
+        if record is None:
+            with self.lock:
+                self.file_object.seek(offset)
+                line = self.file_object.readline()
+            record = self.frozen[offset] = ContentRegistry.freeze(json.loads(line))
+
+        return record
+
+    def close(self) -> None:
+        """
+        Close the line-delimited json file.
+
+        :postcondition: closes the file, after which no record that has not been read before can be read
+        """
+        self.file_object.close()
+
+
+class ContentRegistry:
+    """
+    A registry of the enemy and riddle records the game is made from.
+
+    Each content pack is parsed at most once per registry, the first time it is needed, and its records are served as
+    read-only mappings that can be shared by every board in the process, as is the template of every enemy. When the
+    registry has a cache directory, each pack is also compiled to a marshal file there, which is loaded instead of the
+    json file for as long as the json file keeps the size and modification time it had when the pack was compiled. The
+    shared registry compiles into the user cache directory, or keeps its packs in memory when that is not writable.
+    """
+
+    DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "json")
+    CACHE_ROOT = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                              "reign-of-fire")
+    CACHE_DIRECTORY = os.path.join(CACHE_ROOT, "content")
+    CACHE_FORMAT = 1
+    PACKS = ("enemies", "riddles")
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, directory: str = None, cache_directory: str = None) -> None:
+        """
+        Instantiate a registry reading its content packs from directory.
+
+        :param directory: a path as a string, or None. Default is None, which uses the json directory of the package
+        :param cache_directory: a path as a string, or None. Default is None, which never compiles the content packs
+        :precondition: directory and cache_directory must be strings or None
+        :postcondition: instantiates a registry that has not parsed any content pack yet
+        """
+        self.directory = directory if directory is not None else ContentRegistry.DIRECTORY
+        self.cache_directory = cache_directory
+        self.packs = {}
+        self.parse_times = {}
+        self.sources = {}
+        self.fingerprints = {}
+        self.templates = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def shared() -> "ContentRegistry":
+        """
+        Return the registry shared by the whole process.
+
+        :postcondition: creates the shared registry the first time it is called, compiling its content packs into
+                        CACHE_DIRECTORY, or keeping them in memory only if that directory cannot be written
+        :return: a ContentRegistry object
+        """
+        with ContentRegistry.__shared_lock:
+            if ContentRegistry.__shared is None:
+                cache_directory = ContentRegistry.writable(ContentRegistry.CACHE_DIRECTORY)
+                ContentRegistry.__shared = ContentRegistry(cache_directory=cache_directory)
+
+            return ContentRegistry.__shared
+
+    @staticmethod
+    def writable(directory: str) -> str:
+        """
+        Return directory if content packs can be compiled into it.
+
+        :param directory: a path as a string
+        :precondition: directory must be a string
+        :postcondition: creates directory if it does not exist yet and can be created
+        :return: directory if it is a writable directory, else None
+
+        >>> ContentRegistry.writable(os.devnull) is None
+        True
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            return None
+
+        return directory if os.access(directory, os.W_OK) else None
+
+    @staticmethod
+    def freeze(value):
+        """
+        Return a read-only copy of parsed json data.
+
+        :param value: a python object parsed from json
+        :precondition: value must only hold dictionaries, lists, strings, numbers, booleans and None
+        :postcondition: returns value with every dictionary replaced by a MappingProxyType and every list by a tuple
+        :return: a read-only python object
+
+        >>> record = ContentRegistry.freeze({"options": ["Lake", "River"], "item": {"rarity": 1}})
+        >>> record["options"], record["item"]["rarity"]
+        (('Lake', 'River'), 1)
+        >>> record["item"]["rarity"] = 2
+        Traceback (most recent call last):
+        ...
+        TypeError: 'mappingproxy' object does not support item assignment
+        """
+        if isinstance(value, dict):
+            return MappingProxyType({key: ContentRegistry.freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(ContentRegistry.freeze(item) for item in value)
+
+        return value
+
+    @staticmethod
+    def thaw(value):
+        """
+        Return a plain copy of data frozen by freeze.
+
+        :param value: a python object returned by freeze
+        :precondition: value must be a python object returned by freeze
+        :postcondition: returns value with every mapping replaced by a dictionary and every tuple by a list
+        :return: a python object that json and marshal can serialize
+        """
+        if isinstance(value, MappingProxyType):
+            return {key: ContentRegistry.thaw(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [ContentRegistry.thaw(item) for item in value]
+
+        return value
+
+    def path(self, name: str) -> str:
+        """
+        Return the path of the json file of a content pack.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: returns the path of the content pack inside self.directory
+        :return: a path as a string
+        """
+        return os.path.join(self.directory, f"{name}.json")
+
+    def lines_path(self, name: str) -> str:
+        """
+        Return the path of the line-delimited json file of a content pack.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: returns the path of the line-delimited content pack inside self.directory
+        :return: a path as a string
+        """
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    def source_path(self, name: str) -> str:
+        """
+        Return the path of the file a content pack is read from.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: returns the line-delimited json file if there is one, after converting the json file into it
+                        again if the json file was changed after it, otherwise the json file
+        :return: a path as a string
+        """
+        lines_path = self.lines_path(name)
+        try:
+            lines = os.stat(lines_path)
+        except OSError:
+            return self.path(name)
+
+        try:
+            if os.stat(self.path(name)).st_mtime_ns > lines.st_mtime_ns:
+                StreamingPack.convert(self.path(name), lines_path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return self.path(name)
+
+        return lines_path
+
+    def fingerprint(self, name: str) -> str:
+        """
+        Return a hash of the file a content pack is read from.
+
+        The hash is only computed again when the size or modification time of the file changes.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: returns a hash of the raw bytes of the content pack, without parsing any record
+        :return: a hexadecimal sha1 digest as a string
+        """
+        path = self.source_path(name)
+        source = os.stat(path)
+        key = (path, source.st_size, source.st_mtime_ns)
+
+        cached = self.fingerprints.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        digest = hashlib.sha1()
+        with open(path, "rb") as file_object:
+            for block in iter(lambda: file_object.read(1 << 20), b""):
+                digest.update(block)
+
+        self.fingerprints[name] = (key, digest.hexdigest())
+        return self.fingerprints[name][1]
+
+    def cache_path(self, name: str) -> str:
+        """
+        Return the path of the compiled file of a content pack.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :precondition: self.cache_directory must not be None
+        :postcondition: returns the path of the compiled content pack inside self.cache_directory
+        :return: a path as a string
+        """
+        return os.path.join(self.cache_directory, f"{name}.marshal")
+
+    def load_compiled(self, name: str, source: os.stat_result):
+        """
+        Return the records of a compiled content pack, if it was compiled from the json file as it is now.
+
+        :param name: the name of a content pack as a string
+        :param source: the os.stat_result of the json file of the content pack
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: returns the compiled records if the compiled file is readable and up to date
+        :return: a list of plain records, or None if the compiled file is missing, corrupt or stale
+        """
+        try:
+            with open(self.cache_path(name), "rb") as file_object:
+                compiled = marshal.loads(file_object.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if (
+                type(compiled) is not dict or
+                compiled.get("format") != ContentRegistry.CACHE_FORMAT or
+                compiled.get("size") != source.st_size or
+                compiled.get("mtime") != source.st_mtime_ns
+        ):
+            return None
+
+        return compiled.get("records")
+
+    def compile(self, name: str, records: list, source: os.stat_result) -> None:
+        """
+        Write the compiled file of a content pack.
+
+        The file is written next to its final path and then renamed, so a reader never sees half a compiled pack.
+        Failing to write the file only means the json file is parsed again next time.
+
+        :param name: the name of a content pack as a string
+        :param records: a list of plain records parsed from the json file
+        :param source: the os.stat_result of the json file the records were parsed from
+        :precondition: name must be one of ContentRegistry.PACKS
+        :precondition: self.cache_directory must not be None
+        :postcondition: writes the compiled file of the content pack, tagged with the size and mtime of source
+        """
+        path = self.cache_path(name)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        compiled = {
+            "format": ContentRegistry.CACHE_FORMAT,
+            "size": source.st_size,
+            "mtime": source.st_mtime_ns,
+            "records": records
+        }
+
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            with open(temporary_path, "wb") as file_object:
+                marshal.dump(compiled, file_object)
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    def read(self, name: str) -> list:
+        """
+        Return the plain records of a content pack, from its compiled file if it is up to date, otherwise from json.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: compiles the content pack if it was read from json and the registry has a cache directory
+        :postcondition: records in self.sources whether the content pack was read from "compiled" or "json"
+        :return: a list of plain records
+        """
+        source = os.stat(self.path(name))
+
+        if self.cache_directory is not None:
+            records = self.load_compiled(name, source)
+            if records is not None:
+                self.sources[name] = "compiled"
+                return records
+
+        with open(self.path(name), encoding="utf-8") as file_object:
+            records = json.load(file_object)
+        self.sources[name] = "json"
+
+        if self.cache_directory is not None:
+            self.compile(name, records, source)
+
+        return records
+
+    def pack(self, name: str) -> tuple:
+        """
+        Return every record of a content pack, reading it the first time it is asked for.
+
+        A line-delimited json file takes precedence over the json file of the same pack, unless the json file was
+        changed after it, and is streamed instead of being read whole.
+
+        :param name: the name of a content pack as a string
+        :precondition: name must be one of ContentRegistry.PACKS
+        :postcondition: reads the content pack if it has not been read by this registry yet
+        :return: a ContentPack or StreamingPack object
+        :raise KeyError: if name is not the name of a content pack
+        """
+        records = self.packs.get(name)
+        if records is not None:
+            return records
+
+        if name not in ContentRegistry.PACKS:
+            raise KeyError(f"There is no content pack named {name}!")
+
+        with self.lock:
+            if name not in self.packs:
+                start = time.perf_counter()
+                lines_path = self.lines_path(name)
+                if self.source_path(name) == lines_path:
+                    index_path = None
+                    if self.cache_directory is not None:
+                        index_path = os.path.join(self.cache_directory, f"{name}.jsonl.idx")
+                    self.packs[name] = StreamingPack(lines_path, index_path)
+                    self.sources[name] = "jsonl"
+                else:
+                    self.packs[name] = ContentPack(self.read(name))
+                self.parse_times[name] = time.perf_counter() - start
+
+            return self.packs[name]
+
+    def get(self, name: str, record_id: int):
+        """
+        Return a single record of a content pack by id.
+
+        :param name: the name of a content pack as a string
+        :param record_id: a non-negative integer
+        :precondition: name must be one of ContentRegistry.PACKS
+        :precondition: record_id must be the position of a record in its content pack
+        :postcondition: returns the record with record_id
+        :return: a read-only record mapping
+        :raise IndexError: if the content pack has no record with record_id
+        """
+        return self.pack(name)[record_id]
+
+    def enemy(self, enemy_id: int):
+        """
+        Return the enemy record with enemy_id.
+
+        :param enemy_id: a non-negative integer
+        :precondition: enemy_id must be the position of a record in the enemies pack
+        :postcondition: returns the enemy record with enemy_id
+        :return: a read-only enemy mapping
+        """
+        return self.get("enemies", enemy_id)
+
+    def enemy_template(self, enemy_id: int) -> EnemyTemplate:
+        """
+        Return the template of the enemy with enemy_id, shared by every board and room that uses the enemy.
+
+        :param enemy_id: a non-negative integer
+        :precondition: enemy_id must be the position of a record in the enemies pack
+        :postcondition: creates the template the first time it is asked for, and returns the same one afterwards
+        :return: an EnemyTemplate object
+        """
+        template = self.templates.get(enemy_id)
+        if template is None:
+            template = self.templates.setdefault(enemy_id, EnemyTemplate(self.enemy(enemy_id)))
+
+        return template
+
+    def riddle(self, riddle_id: int):
+        """
+        Return the riddle record with riddle_id.
+
+        :param riddle_id: a non-negative integer
+        :precondition: riddle_id must be the position of a record in the riddles pack
+        :postcondition: returns the riddle record with riddle_id
+        :return: a read-only riddle mapping
+        """
+        return self.get("riddles", riddle_id)
+
+    def report(self) -> list:
+        """
+        Return how many records each loaded content pack holds and how long it took to load.
+
+        :postcondition: returns one entry per content pack loaded so far, in the order of ContentRegistry.PACKS
+        :return: a list of tuples of a pack name, a record count and a load time in seconds
+        """
+        return [(name, len(self.packs[name]), self.parse_times[name]) for name in ContentRegistry.PACKS
+                if name in self.packs]
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the content.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
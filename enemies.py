@@ -2,31 +2,106 @@
 Module contains Enemy class.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from character import Character
+from combat import Combat, EnemyStats
+from events import EventBus, FightEnded, FightStarted, Fled, LootDropped, RoundFought, XpGained
 from helpers import Helpers
 
 
+class EnemyTemplate:
+    """
+    The immutable description of an enemy, shared by every room and every encounter with it.
+    """
+
+    __slots__ = ("name", "max_hp", "starting_hp", "level", "item")
+
+    def __init__(self, enemy_data: Mapping) -> None:
+        """
+        Instantiate a new EnemyTemplate object.
+
+        :param enemy_data: a mapping containing the required keys
+        :precondition: enemy_data must be a mapping, such as a dictionary, containing the required keys
+        :postcondition: instantiates a new EnemyTemplate object that cannot be changed afterwards
+        :raise TypeError: if enemy_data is not a mapping
+        """
+        if not isinstance(enemy_data, Mapping):
+            raise TypeError("Enemy_data must be a mapping")
+
+        item = enemy_data["item"]
+        object.__setattr__(self, "name", enemy_data["name"])
+        object.__setattr__(self, "max_hp", enemy_data["max_hp"])
+        object.__setattr__(self, "starting_hp", enemy_data["current_hp"])
+        object.__setattr__(self, "level", enemy_data["level"])
+        object.__setattr__(self, "item", MappingProxyType(dict(item)) if item else item)
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Refuse to change the template.
+
+        :raise AttributeError: always
+        """
+        raise AttributeError(f"EnemyTemplate is immutable, {name} cannot be set")
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Refuse to change the template.
+
+        :raise AttributeError: always
+        """
+        raise AttributeError(f"EnemyTemplate is immutable, {name} cannot be deleted")
+
+
+class Encounter:
+    """
+    The state of a single fight against an enemy, which only exists while the fight is running.
+    """
+
+    __slots__ = ("template", "current_hp")
+
+    def __init__(self, template: EnemyTemplate) -> None:
+        """
+        Instantiate a new Encounter object against the enemy described by template.
+
+        :param template: an EnemyTemplate object
+        :precondition: template must be an EnemyTemplate object
+        :postcondition: instantiates a new Encounter where the enemy has its starting hp
+        """
+        self.template = template
+        self.current_hp = template.starting_hp
+
+
 class Enemy:
     """
     A class to represent an enemy in the game.
+
+    An Enemy holds no state of its own between fights. Every fight gets a new Encounter, so the same enemy can be
+    fought from several rooms, or by several characters at once.
     """
 
-    def __init__(self, enemy_data: dict):
+    __slots__ = ("__template",)
+
+    def __init__(self, enemy_data):
         """
         Instantiate a new Enemy object.
 
-        :param enemy_data: a dictionary containing the required keys
-        :precondition: enemy_data must be a dictionary containing the required keys
+        :param enemy_data: a mapping containing the required keys, or an EnemyTemplate object
+        :precondition: enemy_data must be a mapping, such as a dictionary, containing the required keys, or an
+                       EnemyTemplate object
         :postcondition: instantiates a new Enemy object
-        :raise TypeError: if enemy_data is not a dictionary
+        :raise TypeError: if enemy_data is not a mapping or an EnemyTemplate object
         """
-        if type(enemy_data) is not dict:
-            raise TypeError("Enemy_data must be a dictionary")
+        self.__template = enemy_data if isinstance(enemy_data, EnemyTemplate) else EnemyTemplate(enemy_data)
 
-        self.__name = enemy_data["name"]
-        self.__max_hp = enemy_data["max_hp"]
-        self.__current_hp = enemy_data["current_hp"]
-        self.__level = enemy_data["level"]
-        self.__item = enemy_data["item"]
+    def get_template(self) -> EnemyTemplate:
+        """
+        Get the value of template.
+
+        :postcondition: returns the value of template
+        :return: the value of template
+        """
+        return self.__template
 
     def fight(self, character) -> bool:
         """
@@ -38,98 +113,181 @@ class Enemy:
         :postcondition: returns True if character wins the fight, otherwise False
         :return: True if character wins the fight, otherwise False
         """
-        Helpers.print_in_color(f"\nBoth you and the {self.__name} step forward, and prepare for a battle..\n", "cyan")
-
-        while (character.get_current_hp() > 0) and (self.__current_hp > 0):
+        enemy = self.__template
+        encounter = Encounter(enemy)
+        damage_given = Combat.damage_given(Combat.character_stats(character))
+        damage_taken = Combat.damage_taken(enemy.level)
+        bus = EventBus.shared()
+        # a fight emits all of its events or none, even if a subscriber arrives while it waits for the player
+        active = bus.active
+        if active:
+            started = EventBus.clock()
+            bus.emit(FightStarted(enemy.name, enemy.level, character.get_level(), False))
+        rounds = 0
+
+        Helpers.print_in_color(f"\nBoth you and the {enemy.name} step forward, and prepare for a battle..\n", "cyan")
+
+        while (character.get_current_hp() > 0) and (encounter.current_hp > 0):
             ability_options = list(enumerate(character.get_abilities(), start=1))
             Helpers.print_user_options(ability_options, "Ability")
 
             chosen_ability = Helpers.get_user_choice(ability_options)
 
-            Helpers.print_in_color(f"\nYour {chosen_ability} hits the {self.__name}", "cyan")
-            # enemy health will decrease by character damage * character level * (1 + (0.1 * staff rarity))
-            try:
-                damage_given = (character.get_damage() * character.get_level() *
-                                (1 + (0.2 * character.get_staff()["rarity"])))
-            except TypeError:
-                damage_given = character.get_damage() * character.get_level()
+            Helpers.print_in_color(f"\nYour {chosen_ability} hits the {enemy.name}", "cyan")
+            encounter.current_hp = max(0, encounter.current_hp - damage_given)
 
-            if (self.__current_hp - round(damage_given)) < 0:
-                self.__current_hp = 0
-            else:
-                self.__current_hp -= round(damage_given)
+            Helpers.print_in_color(f"But the {enemy.name}'s attack lands successfully as well", "cyan")
+            character.set_current_hp(max(0, character.get_current_hp() - damage_taken))
+            rounds += 1
 
-            Helpers.print_in_color(f"But the {self.__name}'s attack lands successfully as well", "cyan")
-            # character health with decrease by 10 * (1 + (0.2 * enemy level))
-            damage_taken = 10 * (1 + (0.2 * self.__level))
-
-            updated_hp = round(character.get_current_hp() - damage_taken)
-            if updated_hp < 0:
-                updated_hp = 0
-            character.set_current_hp(updated_hp)
+            if active:
+                bus.emit(RoundFought(enemy.name, rounds, damage_given, damage_taken, character.get_current_hp(),
+                                     encounter.current_hp))
 
             Helpers.print_in_color(
                 f"\n[{character.get_name()} | hp: {character.get_current_hp()}/{character.get_max_hp()}]", "yellow"
             )
-            print(f"[{self.__name} | hp: {self.__current_hp}/{self.__max_hp}]")
-
-        if (self.__current_hp <= 0) and (character.get_current_hp() > 0):
-            Helpers.print_in_color(f"\n\nCongratulations! You have defeated the {self.__name}", "cyan")
-
-            if self.__level > character.get_level():
-                earned_xp = 15 * ((self.__level - character.get_level()) + 1)
-            else:
-                earned_xp = 15
-
-            if character.get_level() < 3:
-                updated_xp = round(character.get_xp() + earned_xp)
-                character.set_xp(updated_xp)
-                Helpers.print_in_color(f"\n[{character.get_name()} | xp: +{earned_xp}]", "yellow")
-
-            enemy_item = self.__item
-
-            try:
-                character_staff_rarity = character.get_staff()["rarity"]
-            except TypeError:
-                character_staff_rarity = 0
-
-            try:
-                character_armour_rarity = character.get_armour()["rarity"]
-            except TypeError:
-                character_armour_rarity = 0
-
-            if (
-                    enemy_item and
-                    enemy_item["type"] == "staff" and
-                    enemy_item["rarity"] > character_staff_rarity
-            ):
-                staff = {
-                    key: value for key, value in enemy_item.items() if key != 'type'
-                }
-                character.set_staff(staff)
-
-                Helpers.print_in_color(
-                    f"[{character.get_name()} | {enemy_item['type']}: +{enemy_item['name']}]\n", "yellow"
-                )
-            elif (
-                    enemy_item and
-                    enemy_item["type"] == "armour" and
-                    enemy_item["rarity"] > character_armour_rarity
-            ):
-                armour = {
-                    key: value for key, value in enemy_item.items() if key != 'type'
-                }
-                character.set_armour(armour)
-
-                Helpers.print_in_color(
-                    f"[{character.get_name()} | {enemy_item['type']}: +{enemy_item['name']}]\n",
-                    "yellow")
-
-            self.__current_hp = self.__max_hp
-            return True
-
-        self.__current_hp = self.__max_hp
-        return False
+            Helpers.print_plain(f"[{enemy.name} | hp: {encounter.current_hp}/{enemy.max_hp}]")
+
+        won = (encounter.current_hp <= 0) and (character.get_current_hp() > 0)
+        if active:
+            bus.emit(FightEnded(enemy.name, won, rounds, EventBus.clock() - started))
+
+        if won:
+            self.reward(character)
+
+        return won
+
+    def auto_resolve(self, character) -> bool:
+        """
+        Resolve a fight in one step and print its outcome.
+
+        :param character: a Character object
+        :precondition: character must be a Character object
+        :postcondition: sets the hp of character to what it would be after fighting round by round
+        :postcondition: prints the outcome of the fight and rewards character if they won
+        :postcondition: returns True if character wins the fight, otherwise False
+        :return: True if character wins the fight, otherwise False
+        """
+        enemy = self.__template
+        bus = EventBus.shared()
+        active = bus.active
+        if active:
+            started = EventBus.clock()
+            bus.emit(FightStarted(enemy.name, enemy.level, character.get_level(), True))
+
+        outcome = Combat.resolve_fight(Combat.character_stats(character), EnemyStats(enemy.starting_hp, enemy.level))
+
+        if active:
+            character_hp, enemy_hp = character.get_current_hp(), enemy.starting_hp
+            for fought in range(1, outcome.rounds + 1):
+                enemy_hp = max(0, enemy_hp - outcome.damage_given)
+                character_hp = max(0, character_hp - outcome.damage_taken)
+                bus.emit(RoundFought(enemy.name, fought, outcome.damage_given, outcome.damage_taken, character_hp,
+                                     enemy_hp))
+            bus.emit(FightEnded(enemy.name, outcome.won, outcome.rounds, EventBus.clock() - started))
+
+        character.set_current_hp(outcome.character_hp)
+
+        Helpers.print_in_color(f"\nYou and the {enemy.name} trade blows for {outcome.rounds} rounds..", "cyan")
+        Helpers.print_in_color(
+            f"\n[{character.get_name()} | hp: {character.get_current_hp()}/{character.get_max_hp()}]", "yellow"
+        )
+        Helpers.print_plain(f"[{enemy.name} | hp: {outcome.enemy_hp}/{enemy.max_hp}]")
+
+        if outcome.won:
+            self.reward(character)
+
+        return outcome.won
+
+    def reward(self, character) -> None:
+        """
+        Print dialog and give character the experience and item earned by defeating the enemy.
+
+        :param character: a Character object
+        :precondition: character must be a Character object that has just defeated the enemy
+        :postcondition: gives character experience if they are below level 3
+        :postcondition: gives character the enemy's item if it is rarer than the one they have of the same type
+        """
+        enemy = self.__template
+        Helpers.print_in_color(f"\n\nCongratulations! You have defeated the {enemy.name}", "cyan")
+
+        earned_xp = Combat.fight_xp(enemy.level, character.get_level())
+
+        if character.get_level() < Character.MAX_LEVEL:
+            updated_xp = round(character.get_xp() + earned_xp)
+            character.set_xp(updated_xp)
+            Helpers.print_in_color(f"\n[{character.get_name()} | xp: +{earned_xp}]", "yellow")
+
+            bus = EventBus.shared()
+            if bus.active:
+                bus.emit(XpGained("fight", earned_xp, character.get_level()))
+
+        enemy_item = enemy.item
+
+        try:
+            character_staff_rarity = character.get_staff()["rarity"]
+        except TypeError:
+            character_staff_rarity = 0
+
+        try:
+            character_armour_rarity = character.get_armour()["rarity"]
+        except TypeError:
+            character_armour_rarity = 0
+
+        if (
+                enemy_item and
+                enemy_item["type"] == "staff" and
+                enemy_item["rarity"] > character_staff_rarity
+        ):
+            staff = {
+                key: value for key, value in enemy_item.items() if key != 'type'
+            }
+            character.set_staff(staff)
+            Enemy.emit_loot(enemy)
+
+            Helpers.print_in_color(
+                f"[{character.get_name()} | {enemy_item['type']}: +{enemy_item['name']}]\n", "yellow"
+            )
+        elif (
+                enemy_item and
+                enemy_item["type"] == "armour" and
+                enemy_item["rarity"] > character_armour_rarity
+        ):
+            armour = {
+                key: value for key, value in enemy_item.items() if key != 'type'
+            }
+            character.set_armour(armour)
+            Enemy.emit_loot(enemy)
+
+            Helpers.print_in_color(
+                f"[{character.get_name()} | {enemy_item['type']}: +{enemy_item['name']}]\n",
+                "yellow")
+
+    @staticmethod
+    def emit_loot(enemy: EnemyTemplate) -> None:
+        """
+        Emit the drop of the item of enemy if anyone is listening.
+
+        :param enemy: an EnemyTemplate object with an item
+        :precondition: enemy must be an EnemyTemplate object whose item has just been given to the character
+        :postcondition: emits a LootDropped event on the shared event bus if it is active
+        """
+        bus = EventBus.shared()
+        if bus.active:
+            bus.emit(LootDropped(enemy.name, enemy.item["type"], enemy.item["name"], enemy.item["rarity"]))
+
+    def flee(self, character) -> None:
+        """
+        Emit the character fleeing from the enemy if anyone is listening.
+
+        :param character: a Character object
+        :precondition: character must be a Character object that has just fled from the enemy
+        :postcondition: emits a Fled event on the shared event bus if it is active
+        """
+        bus = EventBus.shared()
+        if bus.active:
+            bus.emit(Fled(self.__template.name, self.__template.level, character.get_level()))
 
     def battle(self, character) -> bool:
         """
@@ -141,14 +299,14 @@ class Enemy:
         :postcondition: returns True if character wins the enemy battle, otherwise False
         :return: True if character wins the enemy battle, otherwise False
         """
-        Helpers.print_in_color(f"Out of the corner of your eye you see a {self.__name} appear!\n", "cyan")
+        Helpers.print_in_color(f"Out of the corner of your eye you see a {self.__template.name} appear!\n", "cyan")
 
-        if character.get_level() < self.__level:
+        if character.get_level() < self.__template.level:
             Helpers.print_in_color(f"This enemies level is greater than yours, you might want to weigh your options "
                                    f"before "
                                    f"you make your decision\n", "red")
 
-        options = list(enumerate(["Fight", "Flee"], start=1))
+        options = list(enumerate(["Fight", "Flee", "Auto-resolve"], start=1))
 
         Helpers.print_user_options(options, "Choice")
 
@@ -156,10 +314,13 @@ class Enemy:
 
         if int(decision) == 1:
             return self.fight(character)
+        elif int(decision) == 3:
+            return self.auto_resolve(character)
         else:
-            Helpers.print_in_color(f"\nAs you turn to flee the {self.__name} says:", "cyan")
-            print("I should have guessed. You do seem like a cowardly creature. I will be here if you wish "
-                  "to return with a bit more courage..")
+            Helpers.print_in_color(f"\nAs you turn to flee the {self.__template.name} says:", "cyan")
+            Helpers.print_plain("I should have guessed. You do seem like a cowardly creature. I will be here if you "
+                                "wish to return with a bit more courage..")
+            self.flee(character)
             return False
 
 
@@ -219,14 +380,17 @@ class RoyalMageAngelozzi(Enemy):
 
         if int(decision) == 1:
             Helpers.print_in_color(f"The battle mage notices you, he readies his staff: \n", "cyan")
-            print("You wretched createre, how dare you stain this sacred haven with your miserable existence.\n"
-                  "Instead of fulfilling your duty as one of the royal knights, you chose to betray our King.\n"
-                  "I do not know how you escaped your cell, but on my honour as the Left wing of Alyndelle, "
-                  "the guardian of this empire, I must stop you.\n")
+            Helpers.print_plain("You wretched createre, how dare you stain this sacred haven with your miserable "
+                                "existence.\n"
+                                "Instead of fulfilling your duty as one of the royal knights, you chose to betray our "
+                                "King.\n"
+                                "I do not know how you escaped your cell, but on my honour as the Left wing of "
+                                "Alyndelle, the guardian of this empire, I must stop you.\n")
 
             return super().fight(character)
         else:
             Helpers.print_in_color(f"\nYou fled. You should probably get stronger first.", "cyan")
+            self.flee(character)
             return False
 
 
@@ -288,13 +452,14 @@ class LordCommanderYmir(Enemy):
 
         if int(decision) == 1:
             Helpers.print_in_color(f"The giant knight notices you, and he readies his greatsword: \n", "cyan")
-            print("I commend you for making this far, but, your luck ends here, mortal.\n"
-                  "On my honour as the Right wing of Alyndelle, the guardian of this empire,\n"
-                  "and as the Lord-Commander, I must stop you.\n")
+            Helpers.print_plain("I commend you for making this far, but, your luck ends here, mortal.\n"
+                                "On my honour as the Right wing of Alyndelle, the guardian of this empire,\n"
+                                "and as the Lord-Commander, I must stop you.\n")
 
             return super().fight(character)
         else:
             Helpers.print_in_color(f"\nYou fled. You should probably get stronger first.", "cyan")
+            self.flee(character)
             return False
 
 
@@ -351,14 +516,15 @@ class GodKingThompson(Enemy):
 
         if int(decision) == 1:
             Helpers.print_in_color("The King acknowledge you, and readies his Warhammer: \n", "cyan")
-            print("You have done well, mortal. It is commendable. However, as the God King of Alyndelle,"
-                  "I cannot allow your transgression no longer.\nYour treachery will end here, I will not "
-                  "allow the Flame of Humanity to be restored. This is the sacrifice your kind must make "
-                  "for my victory.")
+            Helpers.print_plain("You have done well, mortal. It is commendable. However, as the God King of "
+                                "Alyndelle,I cannot allow your transgression no longer.\nYour treachery will end "
+                                "here, I will not allow the Flame of Humanity to be restored. This is the sacrifice "
+                                "your kind must make for my victory.")
 
             return super().fight(character)
         else:
             Helpers.print_in_color(f"\nYou fled. You should probably get stronger first.", "cyan")
+            self.flee(character)
             return False
 
 
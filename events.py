@@ -0,0 +1,257 @@
+"""
+Module containing the game events and the EventBus, EventAggregator and EventRing classes.
+"""
+import threading
+import time
+from collections import deque, namedtuple
+
+FightStarted = namedtuple("FightStarted", ("enemy", "enemy_level", "character_level", "resolved"))
+RoundFought = namedtuple("RoundFought", ("enemy", "round", "damage_given", "damage_taken", "character_hp",
+                                         "enemy_hp"))
+FightEnded = namedtuple("FightEnded", ("enemy", "won", "rounds", "seconds"))
+Fled = namedtuple("Fled", ("enemy", "enemy_level", "character_level"))
+XpGained = namedtuple("XpGained", ("source", "xp", "character_level"))
+LootDropped = namedtuple("LootDropped", ("enemy", "item_type", "item_name", "rarity"))
+RiddleAnswered = namedtuple("RiddleAnswered", ("correct", "hp_change"))
+
+EVENT_TYPES = (FightStarted, RoundFought, FightEnded, Fled, XpGained, LootDropped, RiddleAnswered)
+
+
+class EventBus:
+    """
+    A publisher of game events to any number of subscribers.
+
+    Emitting code checks active before it builds an event, so the game does no extra work while nobody listens.
+    Subscribers are called synchronously, on the thread that emits the event.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Instantiate an event bus without subscribers.
+
+        :postcondition: instantiates an inactive event bus
+        """
+        self.subscribers = ()
+        self.active = False
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def shared() -> "EventBus":
+        """
+        Return the event bus shared by the whole process.
+
+        :postcondition: creates the shared event bus the first time it is called
+        :return: an EventBus object
+        """
+        if EventBus.__shared is None:
+            with EventBus.__shared_lock:
+                if EventBus.__shared is None:
+                    EventBus.__shared = EventBus()
+
+        return EventBus.__shared
+
+    @staticmethod
+    def clock() -> float:
+        """
+        Return the time that fight durations are measured with.
+
+        :postcondition: returns the value of a monotonic clock
+        :return: a number of seconds as a float
+        """
+        return time.perf_counter()
+
+    def subscribe(self, subscriber) -> None:
+        """
+        Call subscriber with every event emitted from now on.
+
+        :param subscriber: a callable accepting one event
+        :precondition: subscriber must be a callable accepting one event
+        :postcondition: adds subscriber to the subscribers of the bus and activates the bus
+        """
+        with self.lock:
+            self.subscribers = self.subscribers + (subscriber,)
+            self.active = True
+
+    def unsubscribe(self, subscriber) -> None:
+        """
+        Stop calling subscriber with events.
+
+        :param subscriber: a callable passed to subscribe
+        :precondition: subscriber must be a callable
+        :postcondition: removes subscriber from the bus, and deactivates the bus if it has no subscribers left
+        :raise ValueError: if subscriber is not subscribed to the bus
+        """
+        with self.lock:
+            subscribers = list(self.subscribers)
+            subscribers.remove(subscriber)
+            self.subscribers = tuple(subscribers)
+            self.active = bool(subscribers)
+
+    def emit(self, event: tuple) -> None:
+        """
+        Send event to every subscriber.
+
+        :param event: one of the events in EVENT_TYPES
+        :precondition: event must be one of the events in EVENT_TYPES
+        :postcondition: calls every subscriber with event, in the order they subscribed
+
+        >>> bus = EventBus()
+        >>> ring = EventRing(2)
+        >>> bus.subscribe(ring)
+        >>> bus.emit(Fled("Goblin", 2, 1))
+        >>> ring.events()
+        [Fled(enemy='Goblin', enemy_level=2, character_level=1)]
+        """
+        for subscriber in self.subscribers:
+            subscriber(event)
+
+
+class EventAggregator:
+    """
+    A subscriber that keeps running totals of the events it receives.
+    """
+
+    def __init__(self) -> None:
+        """
+        Instantiate an aggregator without any events.
+
+        :postcondition: instantiates an aggregator with every total at 0
+        """
+        self.lock = threading.Lock()
+        self.counts = {event_type.__name__: 0 for event_type in EVENT_TYPES}
+        self.enemies = {}
+        self.xp = {}
+        self.loot = {}
+        self.damage_given = 0
+        self.damage_taken = 0
+        self.riddles_correct = 0
+
+    def __call__(self, event: tuple) -> None:
+        """
+        Add event to the totals.
+
+        :param event: one of the events in EVENT_TYPES
+        :precondition: event must be one of the events in EVENT_TYPES
+        :postcondition: updates the totals that event contributes to
+        """
+        with self.lock:
+            self.counts[type(event).__name__] += 1
+
+            if type(event) is RoundFought:
+                self.damage_given += event.damage_given
+                self.damage_taken += event.damage_taken
+            elif type(event) is FightEnded:
+                totals = self.enemy_totals(event.enemy)
+                totals["fights"] += 1
+                totals["wins"] += event.won
+                totals["rounds"] += event.rounds
+                totals["seconds"] += event.seconds
+            elif type(event) is Fled:
+                self.enemy_totals(event.enemy)["flees"] += 1
+            elif type(event) is XpGained:
+                self.xp[event.source] = self.xp.get(event.source, 0) + event.xp
+            elif type(event) is LootDropped:
+                self.loot[event.item_name] = self.loot.get(event.item_name, 0) + 1
+            elif type(event) is RiddleAnswered:
+                self.riddles_correct += event.correct
+
+    def enemy_totals(self, enemy: str) -> dict:
+        """
+        Return the totals kept for enemy.
+
+        :param enemy: the name of an enemy
+        :precondition: enemy must be a string
+        :postcondition: creates the totals of enemy the first time it is called for enemy
+        :return: a dictionary of totals
+        """
+        totals = self.enemies.get(enemy)
+        if totals is None:
+            totals = self.enemies[enemy] = {"fights": 0, "wins": 0, "rounds": 0, "seconds": 0.0, "flees": 0}
+
+        return totals
+
+    def summary(self) -> dict:
+        """
+        Return a copy of the totals with the averages per enemy.
+
+        :postcondition: returns the totals along with the win rate and mean rounds and seconds of every enemy fought
+        :return: a dictionary
+
+        >>> aggregator = EventAggregator()
+        >>> aggregator(FightEnded("Goblin", True, 4, 0.5))
+        >>> aggregator(FightEnded("Goblin", False, 2, 0.5))
+        >>> aggregator.summary()["enemies"]["Goblin"]["win_rate"], aggregator.summary()["enemies"]["Goblin"]["rounds"]
+        (0.5, 3.0)
+        """
+        with self.lock:
+            enemies = {}
+            for enemy, totals in self.enemies.items():
+                fights = totals["fights"]
+                enemies[enemy] = {
+                    "fights": fights,
+                    "flees": totals["flees"],
+                    "win_rate": totals["wins"] / fights if fights else 0.0,
+                    "rounds": totals["rounds"] / fights if fights else 0.0,
+                    "seconds": totals["seconds"] / fights if fights else 0.0,
+                }
+
+            return {
+                "counts": dict(self.counts),
+                "enemies": enemies,
+                "xp": dict(self.xp),
+                "loot": dict(self.loot),
+                "damage_given": self.damage_given,
+                "damage_taken": self.damage_taken,
+                "riddles": self.counts["RiddleAnswered"],
+                "riddles_correct": self.riddles_correct,
+            }
+
+
+class EventRing:
+    """
+    A subscriber that keeps the most recent events it receives.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        """
+        Instantiate an empty ring buffer of events.
+
+        :param size: a positive integer. Default is 1024
+        :precondition: size must be a positive integer
+        :postcondition: instantiates a ring buffer that keeps the last size events
+        """
+        self.buffer = deque(maxlen=size)
+
+    def __call__(self, event: tuple) -> None:
+        """
+        Add event to the ring buffer, dropping the oldest event if it is full.
+
+        :param event: one of the events in EVENT_TYPES
+        :precondition: event must be one of the events in EVENT_TYPES
+        :postcondition: appends event to the ring buffer
+        """
+        self.buffer.append(event)
+
+    def events(self) -> list:
+        """
+        Return the events in the ring buffer.
+
+        :postcondition: returns the buffered events from oldest to newest
+        :return: a list of events
+        """
+        return list(self.buffer)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the events.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,26 @@
 The primary game module. Contains the main game loop in the Game class.
 """
 
+import argparse
+from collections import namedtuple
 from board import Board
 from character import Character
+from console import Console
+from content import ContentRegistry, StreamingPack
 from helpers import Helpers
+from journal import Journal
+from pacing import ClientPacer, HeadlessPacer, Pacer, RealTimePacer
+from renderer import Screen
 from story import Story
+from templates import BoardTemplates
+
+GameResult = namedtuple("GameResult", ("character", "board", "achieved_goal"))
+
+PACERS = {
+    "real-time": RealTimePacer,
+    "headless": HeadlessPacer,
+    "client": lambda: ClientPacer(lambda seconds: Helpers.read_line("Press Enter to continue..")),
+}
 
 
 class Game:
@@ -14,41 +30,140 @@ class Game:
     """
 
     @staticmethod
-    def play() -> None:
+    def play(rows: int = 10, columns: int = 10, boss_1_coords: tuple = None, boss_2_coords: tuple = None,
+             final_boss_coords: tuple = None, seed: int = None, full_screen: bool = False, viewport: tuple = None,
+             minimap: tuple = None, pacer: Pacer = None, console: Console = None,
+             journal: Journal = None) -> "GameResult":
         """
         Control the flow of the game.
 
         Create necessary data structures and contain game loop.
 
-        :postcondition: executes the game loop until game is quit or completed
+        :param rows: a positive integer. Default is 10
+        :param columns: a positive integer. Default is 10
+        :param boss_1_coords: a tuple of positive non-zero integers. Default is None, which places the boss 40% of the
+                              way across and up the board, or in the next free room on a small board
+        :param boss_2_coords: a tuple of positive non-zero integers. Default is None, which places the boss 70% of the
+                              way across and up the board, or in the next free room on a small board
+        :param final_boss_coords: a tuple of positive integers. Default is None, which places the final boss above the
+                                  top right room
+        :param seed: an integer that determines the generated rooms. Default is None, which picks a random seed
+        :param full_screen: a boolean representing if the map should be pinned to the top of the terminal and redrawn
+                            incrementally. Default is False, which prints a new copy of the map every time
+        :param viewport: a tuple of the width and height in rooms of the map window drawn around the character.
+                         Default is None, which draws the whole map
+        :param minimap: a tuple of the width and height in cells of a minimap drawn under the map. Default is None,
+                        which draws no minimap
+        :param pacer: a Pacer object that times the pauses of the story. Default is None, which uses the pacer of the
+                      current context
+        :param console: a Console object that the game is played on. Default is None, which uses the console of the
+                        current context
+        :param journal: a Journal object that saves the game as it is played. Default is None, which saves nothing. If
+                        the journal holds a saved game, that game is resumed instead of starting a new one, and the
+                        board arguments are ignored
+        :precondition: rows, columns and the boss coordinates must be accepted by Board
+        :precondition: full_screen must be a boolean
+        :precondition: viewport and minimap must each be a tuple of two positive non-zero integers or None
+        :precondition: pacer must be a Pacer object or None
+        :precondition: console must be a Console object or None
+        :precondition: journal must be a Journal object that is not recording a game, or None
+        :postcondition: executes the game loop until game is quit or completed, or the console runs out of input
+        :postcondition: deletes the saved game of journal once the game is completed
+        :return: a GameResult namedtuple, whose character is None if the game ended before it was created
         """
-        rows = 10
-        columns = 10
-        boss_1_coords = (4, 4)
-        boss_2_coords = (7, 7)
+        if boss_1_coords is None or boss_2_coords is None:
+            default_1, default_2 = Board.default_boss_coords(rows, columns)
+            boss_1_coords = default_1 if boss_1_coords is None else boss_1_coords
+            boss_2_coords = default_2 if boss_2_coords is None else boss_2_coords
+
+        if journal is not None and journal.exists():
+            board, character = journal.resume()
+        else:
+            board = Board(rows, columns, boss_1_coords, boss_2_coords, final_boss_coords, seed)
+            character = None
+
+        with Console.use(console or Console.current()), Pacer.use(pacer or Pacer.current()):
+            screen, achieved_goal = None, False
+            try:
+                if character is None:
+                    character = Character(Helpers.get_character_name())
+                    if journal is not None:
+                        journal.start(board, character)
+
+                    Story.opening_dialogue()
+                    Story.cell_description()
+                else:
+                    Helpers.print_in_color(f"\nWelcome back {character.get_name()}, your journey continues.\n",
+                                           "cyan")
+
+                screen = Screen() if full_screen else None
+                achieved_goal = Game.explore(board, character, screen, viewport, minimap, journal)
+            except EOFError:
+                # the player has left, which ends the game the same way as quitting
+                pass
+            finally:
+                if screen is not None:
+                    screen.close()
+                if journal is not None:
+                    journal.close(delete=achieved_goal)
+
+            if achieved_goal:
+                Story.game_completed()
+                Helpers.print_in_color(
+                    "<------------------------------------Final Stats--------------------------------->", "green"
+                )
+                character.show_stats(board)
+            else:
+                Helpers.print_in_color("\nThanks for playing, we hope you play again sometime :)", "cyan")
 
-        board = Board(rows, columns, boss_1_coords, boss_2_coords)
+            Console.current().flush()
 
-        character_name = Helpers.get_character_name()
-        character = Character(character_name)
+        return GameResult(character, board, achieved_goal)
 
-        Story.opening_dialogue()
-        Story.cell_description()
+    @staticmethod
+    def explore(board: Board, character: Character, screen: Screen = None, viewport: tuple = None,
+                minimap: tuple = None, journal: Journal = None) -> bool:
+        """
+        Move character around board until the game is quit or completed.
 
+        :param board: a Board object
+        :param character: a Character object
+        :param screen: a Screen object or None. Default is None, which prints a new copy of the map every time
+        :param viewport: a tuple of the width and height in rooms of the map window drawn around the character.
+                         Default is None, which draws the whole map
+        :param minimap: a tuple of the width and height in cells of a minimap drawn under the map. Default is None,
+                        which draws no minimap
+        :param journal: a Journal object recording the game, or None. Default is None, which records nothing
+        :precondition: character must be a Character object on board
+        :postcondition: runs the game loop, reading the choices of the player from the current console
+        :return: True if the final boss was defeated, False if the game was quit
+        :raise EOFError: if the current console runs out of input
+        """
         achieved_goal = False
         while not achieved_goal:
-            board.print_board(character.get_position())
+            board.show(character.get_position(), screen, viewport, minimap)
             choice = character.choose_direction(board)
 
             if choice == "quit":
                 break
             elif choice == "show stats":
-                character.show_stats()
-            elif board.is_valid_move(choice, character):
+                character.show_stats(board)
+            elif choice == "travel" or board.is_valid_move(choice, character):
 
-                character.move(choice, board)
+                if choice == "travel":
+                    route = board.travel_route(character.get_position(), board.choose_destination())
+                else:
+                    route = [choice]
 
-                board.print_board(character.get_position())
+                # travelling stops early in the first room that still needs to be dealt with
+                for direction in route:
+                    character.move(direction, board)
+                    if journal is not None:
+                        journal.moved(character.get_position())
+                    if not board.get_board()[character.get_position()]["solved"]:
+                        break
+
+                board.show(character.get_position(), screen, viewport, minimap)
 
                 room_solved = board.get_board()[character.get_position()]["solved"]
                 if not room_solved:
@@ -56,7 +171,10 @@ class Game:
 
                     action_function = board.get_board()[character.get_position()]["action"]
                     if action_function is not None:
-                        board.get_board()[character.get_position()]["solved"] = action_function(character)
+                        solved = action_function(character)
+                        board.get_board()[character.get_position()]["solved"] = solved
+                        if journal is not None and solved:
+                            journal.solved(character.get_position(), True)
                 else:
                     Helpers.print_in_color("\nYou have already completed your duties here, please move on.\n", "cyan")
 
@@ -67,23 +185,112 @@ class Game:
                     character.died()
 
                 achieved_goal = board.boss_defeated()
+                if journal is not None:
+                    journal.commit()
             else:
                 Helpers.print_in_color("There is no path in that direction, you can't walk through walls!!", "red")
 
-        if achieved_goal:
-            Story.game_completed()
-            Helpers.print_in_color("<------------------------------------Final Stats--------------------------------->",
-                                   "green")
-            character.show_stats()
-        else:
-            Helpers.print_in_color("\nThanks for playing, we hope you play again sometime :)", "cyan")
+        return achieved_goal
+
+
+def parse_size(text: str) -> tuple:
+    """
+    Convert a size written as WIDTHxHEIGHT to a tuple of integers.
+
+    :param text: a string in the format WIDTHxHEIGHT
+    :precondition: text must be two positive integers separated by an x
+    :postcondition: returns the width and height as a tuple of integers
+    :return: the width and height as a tuple of integers
+    :raise argparse.ArgumentTypeError: if text is not two positive integers separated by an x
+
+    >>> parse_size("21x11")
+    (21, 11)
+    """
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a size like 21x11")
+
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError("Sizes must be greater than 0!")
+
+    return width, height
+
+
+def parse_board_size(text: str) -> tuple:
+    """
+    Convert the size of a board written as WIDTHxHEIGHT to a tuple of integers.
+
+    :param text: a string in the format WIDTHxHEIGHT
+    :precondition: text must be two positive integers separated by an x, for a board of at least 3 rooms
+    :postcondition: returns the width and height as a tuple of integers
+    :return: the width and height as a tuple of integers
+    :raise argparse.ArgumentTypeError: if text is not a size, or the board would have no room for both mini bosses
+
+    >>> parse_board_size("3x1")
+    (3, 1)
+    >>> parse_board_size("1x2")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: A board needs at least 3 rooms, one to start in and one for each boss!
+    """
+    width, height = parse_size(text)
+
+    if width * height < 3:
+        raise argparse.ArgumentTypeError("A board needs at least 3 rooms, one to start in and one for each boss!")
+
+    return width, height
 
 
 def main() -> None:
     """
     Drive the program.
     """
-    Game.play()
+    parser = argparse.ArgumentParser(description="Reign of Fire")
+    parser.add_argument("--size", type=parse_board_size, default=(10, 10), metavar="WxH",
+                        help="the number of columns and rows of the board, 10x10 by default")
+    parser.add_argument("--seed", type=int, help="the seed that determines the rooms of the board")
+    parser.add_argument("--full-screen", action="store_true",
+                        help="pin the map to the top of the terminal and only redraw what changes")
+    parser.add_argument("--viewport", type=parse_size, metavar="WxH",
+                        help="only draw a window of the map of this many rooms around the character")
+    parser.add_argument("--minimap", type=parse_size, metavar="WxH", help="draw a minimap of this size under the map")
+    parser.add_argument("--pacing", choices=tuple(PACERS), default="real-time",
+                        help="wait for the full pauses of the story, skip them, or wait for Enter instead")
+    parser.add_argument("--cache-templates", action="store_true",
+                        help=f"keep the layouts of seeded boards in {BoardTemplates.DIRECTORY} to start them faster")
+    parser.add_argument("--save", metavar="PATH",
+                        help="save the game as it is played to files at PATH, and resume the game saved there if any")
+    parser.add_argument("--snapshot-every", type=int, default=Journal.SNAPSHOT_EVERY, metavar="N",
+                        help=f"take a snapshot of a saved game every N steps, {Journal.SNAPSHOT_EVERY} by default")
+    parser.add_argument("--content-report", action="store_true",
+                        help="print how long each content pack takes to load and how many records it holds, then exit")
+    parser.add_argument("--convert-content", action="store_true",
+                        help="convert the json content packs into line-delimited packs that are streamed, then exit")
+    arguments = parser.parse_args()
+
+    if arguments.convert_content:
+        registry = ContentRegistry.shared()
+        for name in ContentRegistry.PACKS:
+            count = StreamingPack.convert(registry.path(name), registry.lines_path(name))
+            print(f"Converted {count} records into {registry.lines_path(name)}")
+        return
+
+    if arguments.content_report:
+        registry = ContentRegistry.shared()
+        for name in ContentRegistry.PACKS:
+            registry.pack(name)
+        for name, count, parse_time in registry.report():
+            print(f"{name:<10}{count:>8} records{parse_time * 1000:>10.2f} ms from {registry.sources[name]}")
+        return
+
+    if arguments.cache_templates:
+        Board.TEMPLATES = BoardTemplates(BoardTemplates.DIRECTORY)
+
+    journal = Journal(arguments.save, arguments.snapshot_every) if arguments.save else None
+    columns, rows = arguments.size
+    Game.play(rows, columns, seed=arguments.seed, full_screen=arguments.full_screen, viewport=arguments.viewport,
+              minimap=arguments.minimap, pacer=PACERS[arguments.pacing](), journal=journal)
 
 
 if __name__ == '__main__':
@@ -2,6 +2,8 @@
 Module contains GenericRooms class.
 """
 
+from character import Character
+from events import EventBus, XpGained
 from helpers import Helpers
 
 
@@ -10,6 +12,8 @@ class GenericRooms:
     A class containing generic room methods.
     """
 
+    SPIDER_WEB_XP = 12
+
     @staticmethod
     def spider_web_blockade(character) -> bool:
         """
@@ -37,11 +41,15 @@ class GenericRooms:
         Helpers.print_in_color("\n\nNice work! You were able to clear out all of those webs with your Fireball!",
                                "cyan")
 
-        if character.get_level() < 3:
-            new_xp = character.get_xp() + 12
+        if character.get_level() < Character.MAX_LEVEL:
+            new_xp = character.get_xp() + GenericRooms.SPIDER_WEB_XP
             character.set_xp(new_xp)
 
-            Helpers.print_in_color(f"\n[{character.get_name()} | xp: +12]", "yellow")
+            Helpers.print_in_color(f"\n[{character.get_name()} | xp: +{GenericRooms.SPIDER_WEB_XP}]", "yellow")
+
+            bus = EventBus.shared()
+            if bus.active:
+                bus.emit(XpGained("spider_web", GenericRooms.SPIDER_WEB_XP, character.get_level()))
 
         return True
 
@@ -0,0 +1,633 @@
+"""
+Module containing the Grid class and the views that expose it as the classic board dictionary.
+"""
+from array import array
+from collections.abc import Mapping, MutableMapping
+
+
+class Chunk:
+    """
+    A square block of rooms stored in flat typed arrays.
+    """
+
+    __slots__ = ("kinds", "actions", "descriptions")
+
+    def __init__(self, size: int) -> None:
+        """
+        Instantiate a chunk holding size * size rooms.
+
+        :param size: a positive integer
+        :precondition: size must be a positive non-zero integer
+        :postcondition: instantiates a chunk where every room is generic and has action and description 0
+        """
+        rooms = size * size
+        self.kinds = array('B', bytes(rooms))
+        self.actions = array('I', bytes(4 * rooms))
+        self.descriptions = array('B', bytes(rooms))
+
+    def dump(self) -> tuple:
+        """
+        Return the raw contents of the chunk.
+
+        :postcondition: returns the kinds, actions and descriptions arrays as bytes
+        :return: a tuple of three bytes objects
+        """
+        return self.kinds.tobytes(), self.actions.tobytes(), self.descriptions.tobytes()
+
+    @staticmethod
+    def load(size: int, data: tuple) -> "Chunk":
+        """
+        Return a chunk of size * size rooms filled in from the raw contents returned by dump.
+
+        :param size: a positive integer
+        :param data: a tuple of three bytes objects
+        :precondition: size must be the size of the chunk that data was dumped from
+        :precondition: data must be a tuple returned by Chunk.dump on this machine
+        :postcondition: returns a chunk equal to the one data was dumped from
+        :return: a Chunk object
+        :raise ValueError: if data does not hold size * size rooms
+        """
+        chunk = Chunk(size)
+        kinds, actions, descriptions = (array(typecode) for typecode in ('B', 'I', 'B'))
+        kinds.frombytes(data[0])
+        actions.frombytes(data[1])
+        descriptions.frombytes(data[2])
+
+        if not len(kinds) == len(actions) == len(descriptions) == size * size:
+            raise ValueError(f"Chunk data does not hold {size * size} rooms!")
+
+        chunk.kinds, chunk.actions, chunk.descriptions = kinds, actions, descriptions
+        return chunk
+
+
+class Bitset:
+    """
+    A fixed-size set of bits with a running count of the bits that are set.
+    """
+
+    __slots__ = ("bits", "size", "count")
+
+    def __init__(self, size: int) -> None:
+        """
+        Instantiate a bitset of size bits, all cleared.
+
+        :param size: a positive integer
+        :precondition: size must be a positive integer
+        :postcondition: instantiates a bitset of size bits, all cleared
+        """
+        self.bits = bytearray((size + 7) // 8)
+        self.size = size
+        self.count = 0
+
+    def __getitem__(self, index: int) -> bool:
+        """
+        Determine if the bit at index is set.
+
+        :param index: an integer between 0 and size - 1 inclusive
+        :precondition: index must be an integer between 0 and size - 1 inclusive
+        :postcondition: returns True if the bit at index is set, otherwise False
+        :return: True if the bit at index is set, otherwise False
+        """
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        """
+        Set or clear the bit at index and update the running count.
+
+        :param index: an integer between 0 and size - 1 inclusive
+        :param value: a boolean
+        :precondition: index must be an integer between 0 and size - 1 inclusive
+        :postcondition: sets the bit at index if value is truthy, otherwise clears it
+        """
+        mask = 1 << (index & 7)
+        was_set = bool(self.bits[index >> 3] & mask)
+
+        if value and not was_set:
+            self.bits[index >> 3] |= mask
+            self.count += 1
+        elif was_set and not value:
+            self.bits[index >> 3] &= ~mask
+            self.count -= 1
+
+    def count_range(self, start: int, stop: int) -> int:
+        """
+        Return the number of set bits from start up to but not including stop.
+
+        :param start: an integer between 0 and size inclusive
+        :param stop: an integer between start and size inclusive
+        :precondition: 0 <= start <= stop <= size
+        :postcondition: returns the number of set bits in the range, counted with a popcount over whole bytes
+        :return: the number of set bits as an integer
+
+        >>> bitset = Bitset(20)
+        >>> for index in (1, 8, 9, 19):
+        ...     bitset[index] = True
+        >>> bitset.count_range(0, 20), bitset.count_range(2, 19), bitset.count_range(9, 9)
+        (4, 2, 0)
+        """
+        return self.window(start, stop).bit_count()
+
+    def window(self, start: int, stop: int) -> int:
+        """
+        Return the bits from start up to but not including stop as an integer.
+
+        :param start: an integer between 0 and size inclusive
+        :param stop: an integer between start and size inclusive
+        :precondition: 0 <= start <= stop <= size
+        :postcondition: returns an integer whose bit i is the bit at start + i
+        :return: a non-negative integer
+
+        >>> bitset = Bitset(20)
+        >>> for index in (1, 8, 9, 19):
+        ...     bitset[index] = True
+        >>> bin(bitset.window(7, 11)), bitset.window(9, 9)
+        ('0b110', 0)
+        """
+        if stop <= start:
+            return 0
+
+        window = int.from_bytes(self.bits[start >> 3:(stop + 7) >> 3], "little") >> (start & 7)
+        return window & ((1 << (stop - start)) - 1)
+
+    def indices(self):
+        """
+        Iterate over the indices of the set bits in increasing order.
+
+        :postcondition: yields the index of every set bit, skipping empty bytes
+        """
+        for byte_index, byte in enumerate(self.bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield byte_index * 8 + bit
+
+
+class Grid:
+    """
+    A compact grid of rooms, materialized lazily one chunk at a time.
+
+    Every room is stored as a handful of integers (room kind, action index and description index) instead of a
+    dictionary, and its solved and visited flags are bits in grid-wide bitsets. Neighbours are computed from
+    coordinates rather than stored. A chunk is only created, and filled in by the generator, the first time one of its
+    rooms is touched.
+    """
+
+    GENERIC = 0
+    START = 1
+    BOSS_1 = 2
+    BOSS_2 = 3
+    FINAL_BOSS = 4
+
+    CHUNK_SIZE = 32
+
+    DIRECTIONS = (
+        ("north", 0, 1),
+        ("east", 1, 0),
+        ("south", 0, -1),
+        ("west", -1, 0)
+    )
+
+    def __init__(self, columns: int, rows: int, extra_cells: tuple = (), generator=None) -> None:
+        """
+        Instantiate a grid of columns * rows rooms, plus any extra rooms outside the rectangle.
+
+        :param columns: a positive integer
+        :param rows: a positive integer
+        :param extra_cells: a tuple of coordinates outside the rectangle that are also rooms, such as the final boss
+        :param generator: a function accepting a chunk key, a Chunk and a list of the room coordinates in it, that
+                          fills in the chunk. Default is None, which leaves every room generic
+        :precondition: columns must be a positive non-zero integer
+        :precondition: rows must be a positive non-zero integer
+        :precondition: every coordinate in extra_cells must be orthogonally adjacent to the rectangle
+        :postcondition: instantiates an empty grid, no chunk is materialized yet
+        """
+        self.columns = columns
+        self.rows = rows
+        self.extra_cells = frozenset(extra_cells)
+        self.extra_order = sorted(self.extra_cells)
+        self.generator = generator
+        self.chunks = {}
+
+        self.solved = Bitset(len(self))
+        self.visited = Bitset(len(self))
+        self.solved_per_chunk = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of rooms in the grid.
+
+        :postcondition: returns the number of rooms in the grid, including extra rooms
+        :return: the number of rooms in the grid as an integer
+        """
+        return self.columns * self.rows + len(self.extra_cells)
+
+    def __contains__(self, coords: tuple) -> bool:
+        """
+        Determine if there is a room at coords.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be a tuple of two integers
+        :postcondition: returns True if there is a room at coords, otherwise False
+        :return: True if there is a room at coords, otherwise False
+
+        >>> (1, 1) in Grid(10, 10)
+        True
+        >>> (10, 11) in Grid(10, 10, ((10, 11),))
+        True
+        >>> (0, 1) in Grid(10, 10)
+        False
+        """
+        x_coord, y_coord = coords
+        if 1 <= x_coord <= self.columns and 1 <= y_coord <= self.rows:
+            return True
+
+        return coords in self.extra_cells
+
+    @staticmethod
+    def chunk_key(coords: tuple) -> tuple:
+        """
+        Return the key of the chunk containing coords.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be a tuple of two integers
+        :postcondition: returns the key of the chunk containing coords
+        :return: the chunk key as a tuple of two integers
+
+        >>> Grid.chunk_key((1, 1))
+        (0, 0)
+        >>> Grid.chunk_key((33, 70))
+        (1, 2)
+        """
+        x_coord, y_coord = coords
+        return (x_coord - 1) // Grid.CHUNK_SIZE, (y_coord - 1) // Grid.CHUNK_SIZE
+
+    @staticmethod
+    def chunk_offset(coords: tuple) -> int:
+        """
+        Return the index of the room at coords inside its chunk's arrays.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be a tuple of two integers
+        :postcondition: returns the index of the room at coords inside its chunk
+        :return: the index as an integer
+
+        >>> Grid.chunk_offset((1, 1))
+        0
+        >>> Grid.chunk_offset((2, 3))
+        65
+        """
+        x_coord, y_coord = coords
+        return ((y_coord - 1) % Grid.CHUNK_SIZE) * Grid.CHUNK_SIZE + (x_coord - 1) % Grid.CHUNK_SIZE
+
+    def chunk_rooms(self, key: tuple) -> list:
+        """
+        Return the coordinates of every room inside the chunk with key.
+
+        :param key: a chunk key as a tuple of two integers
+        :precondition: key must be a tuple of two integers
+        :postcondition: returns a list of the coordinates of every room in the chunk
+        :return: a list of coordinates
+        """
+        chunk_x, chunk_y = key
+        first_x = chunk_x * Grid.CHUNK_SIZE + 1
+        first_y = chunk_y * Grid.CHUNK_SIZE + 1
+        last_x = min(first_x + Grid.CHUNK_SIZE - 1, self.columns)
+        last_y = min(first_y + Grid.CHUNK_SIZE - 1, self.rows)
+
+        rooms = [(x_coord, y_coord) for y_coord in range(max(first_y, 1), last_y + 1)
+                 for x_coord in range(max(first_x, 1), last_x + 1)]
+        rooms += [coords for coords in self.extra_cells if Grid.chunk_key(coords) == key]
+
+        return rooms
+
+    def chunk(self, coords: tuple) -> Chunk:
+        """
+        Return the chunk containing coords, generating it first if it has never been touched.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: returns the materialized chunk containing coords
+        :return: a Chunk object
+        """
+        key = Grid.chunk_key(coords)
+        chunk = self.chunks.get(key)
+
+        if chunk is None:
+            chunk = Chunk(Grid.CHUNK_SIZE)
+            if self.generator is not None:
+                self.generator(key, chunk, self.chunk_rooms(key))
+            self.chunks[key] = chunk
+
+        return chunk
+
+    def is_materialized(self, coords: tuple) -> bool:
+        """
+        Determine if the chunk containing coords has been generated.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be a tuple of two integers
+        :postcondition: returns True if the chunk containing coords has been generated, otherwise False
+        :return: True if the chunk containing coords has been generated, otherwise False
+        """
+        return Grid.chunk_key(coords) in self.chunks
+
+    def materialized_rooms(self) -> int:
+        """
+        Return the number of room slots held in memory.
+
+        :postcondition: returns the number of room slots across every generated chunk
+        :return: the number of room slots as an integer
+        """
+        return len(self.chunks) * Grid.CHUNK_SIZE * Grid.CHUNK_SIZE
+
+    def index(self, coords: tuple) -> int:
+        """
+        Return the position of the room at coords in the grid's bitsets.
+
+        Rooms inside the rectangle are numbered row by row, followed by the extra rooms.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: returns the position of the room at coords
+        :return: the position as an integer
+
+        >>> Grid(10, 10).index((2, 3))
+        21
+        >>> Grid(10, 10, ((10, 11),)).index((10, 11))
+        100
+        """
+        x_coord, y_coord = coords
+        if 1 <= x_coord <= self.columns and 1 <= y_coord <= self.rows:
+            return (y_coord - 1) * self.columns + (x_coord - 1)
+
+        return self.columns * self.rows + self.extra_order.index(coords)
+
+    def coords(self, index: int) -> tuple:
+        """
+        Return the coordinates of the room at a position in the grid's bitsets.
+
+        :param index: an integer between 0 and len(self) - 1 inclusive
+        :precondition: index must be an integer between 0 and len(self) - 1 inclusive
+        :postcondition: returns the coordinates of the room at index
+        :return: the coordinates as a tuple of two integers
+
+        >>> Grid(10, 10).coords(21)
+        (2, 3)
+        """
+        inner_rooms = self.columns * self.rows
+        if index < inner_rooms:
+            return index % self.columns + 1, index // self.columns + 1
+
+        return self.extra_order[index - inner_rooms]
+
+    def is_solved(self, coords: tuple) -> bool:
+        """
+        Determine if the room at coords is solved, without generating its chunk.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: returns True if the room at coords is solved, otherwise False
+        :return: True if the room at coords is solved, otherwise False
+        """
+        return self.solved[self.index(coords)]
+
+    def set_solved(self, coords: tuple, solved: bool) -> None:
+        """
+        Set the solved state of the room at coords and update the solved count of its chunk.
+
+        :param coords: a tuple of two integers
+        :param solved: a boolean
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: sets the solved state of the room at coords
+        """
+        index = self.index(coords)
+        solved = bool(solved)
+        if self.solved[index] == solved:
+            return
+
+        self.solved[index] = solved
+        key = Grid.chunk_key(coords)
+        self.solved_per_chunk[key] = self.solved_per_chunk.get(key, 0) + (1 if solved else -1)
+
+    def count_solved(self, first_corner: tuple, last_corner: tuple) -> int:
+        """
+        Return the number of solved rooms in the rectangle between two corners, inclusive.
+
+        Each row of the rectangle is counted with a popcount over the solved bitset. Extra rooms are not counted.
+
+        :param first_corner: a tuple of two integers
+        :param last_corner: a tuple of two integers
+        :precondition: both corners must be tuples of two integers
+        :postcondition: returns the number of solved rooms inside both the rectangle and the grid
+        :return: the number of solved rooms as an integer
+        """
+        first_x = max(1, min(first_corner[0], last_corner[0]))
+        last_x = min(self.columns, max(first_corner[0], last_corner[0]))
+        first_y = max(1, min(first_corner[1], last_corner[1]))
+        last_y = min(self.rows, max(first_corner[1], last_corner[1]))
+
+        solved = 0
+        for y_coord in range(first_y, last_y + 1):
+            row_start = (y_coord - 1) * self.columns
+            solved += self.solved.count_range(row_start + first_x - 1, row_start + last_x)
+
+        return solved
+
+    def chunk_progress(self, key: tuple) -> tuple:
+        """
+        Return how many rooms of a chunk are solved, out of how many rooms it holds.
+
+        :param key: a chunk key as a tuple of two integers
+        :precondition: key must be a tuple of two integers
+        :postcondition: returns the progress of the chunk in constant time
+        :return: a tuple of the number of solved rooms and the number of rooms in the chunk
+        """
+        chunk_x, chunk_y = key
+        width = max(0, min(Grid.CHUNK_SIZE, self.columns - chunk_x * Grid.CHUNK_SIZE))
+        height = max(0, min(Grid.CHUNK_SIZE, self.rows - chunk_y * Grid.CHUNK_SIZE))
+        extra_rooms = sum(1 for coords in self.extra_order if Grid.chunk_key(coords) == key)
+
+        return self.solved_per_chunk.get(key, 0), width * height + extra_rooms
+
+    def set_visited(self, coords: tuple) -> None:
+        """
+        Record that the room at coords has been visited.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: marks the room at coords as visited
+        """
+        self.visited[self.index(coords)] = True
+
+    def dump_progress(self) -> tuple:
+        """
+        Return the raw solved and visited flags of every room.
+
+        :postcondition: returns the solved and visited bitsets as bytes
+        :return: a tuple of two bytes objects
+        """
+        return bytes(self.solved.bits), bytes(self.visited.bits)
+
+    def load_progress(self, data: tuple) -> None:
+        """
+        Replace the solved and visited flags of every room with the raw flags returned by dump_progress.
+
+        :param data: a tuple of two bytes objects returned by dump_progress
+        :precondition: data must be returned by dump_progress of a grid of the same size
+        :postcondition: sets the solved and visited flags of every room, and recounts the solved rooms of every chunk
+        :raise ValueError: if data does not fit the grid
+
+        >>> grid = Grid(3, 3)
+        >>> grid.set_solved((2, 2), True)
+        >>> copy = Grid(3, 3)
+        >>> copy.load_progress(grid.dump_progress())
+        >>> copy.is_solved((2, 2)), copy.solved.count, copy.chunk_progress((0, 0))
+        (True, 1, (1, 9))
+        """
+        solved, visited = data
+        if len(solved) != len(self.solved.bits) or len(visited) != len(self.visited.bits):
+            raise ValueError("The progress does not fit the grid")
+
+        for bitset, bits in ((self.solved, solved), (self.visited, visited)):
+            bitset.bits[:] = bits
+            bitset.count = int.from_bytes(bits, "little").bit_count()
+
+        self.solved_per_chunk = {}
+        for index in self.solved.indices():
+            key = Grid.chunk_key(self.coords(index))
+            self.solved_per_chunk[key] = self.solved_per_chunk.get(key, 0) + 1
+
+    def directions(self, coords: tuple) -> dict:
+        """
+        Return the neighbouring rooms of the room at coords, keyed by direction.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room in the grid
+        :postcondition: returns a dictionary mapping each direction to the neighbouring coordinates or None
+        :return: a dictionary mapping "north", "east", "south" and "west" to a tuple or None
+
+        >>> Grid(10, 10).directions((1, 1))
+        {'north': (1, 2), 'east': (2, 1), 'south': None, 'west': None}
+        """
+        x_coord, y_coord = coords
+        directions = {}
+
+        for direction, x_step, y_step in Grid.DIRECTIONS:
+            neighbour = (x_coord + x_step, y_coord + y_step)
+            directions[direction] = neighbour if neighbour in self else None
+
+        return directions
+
+    def __iter__(self):
+        """
+        Iterate over the coordinates of every room without generating any chunk.
+
+        :postcondition: yields the coordinates of every room, row by row, followed by the extra rooms
+        """
+        for y_coord in range(1, self.rows + 1):
+            for x_coord in range(1, self.columns + 1):
+                yield x_coord, y_coord
+
+        yield from self.extra_order
+
+
+class RoomView(MutableMapping):
+    """
+    A dictionary-like view of a single room in a board's grid.
+    """
+
+    __slots__ = ("_board", "_coords")
+
+    KEYS = ("description", "action", "solved", "directions")
+
+    def __init__(self, board, coords: tuple) -> None:
+        """
+        Instantiate a view of the room at coords.
+
+        :param board: a Board object
+        :param coords: a tuple of two integers
+        :precondition: board must be a Board object
+        :precondition: coords must be the coordinates of a room in board.grid
+        :postcondition: instantiates a view of the room at coords
+        """
+        self._board = board
+        self._coords = coords
+
+    def __getitem__(self, key: str):
+        grid = self._board.grid
+
+        if key == "solved":
+            return grid.is_solved(self._coords)
+        if key == "description":
+            chunk = grid.chunk(self._coords)
+            return self._board.room_descriptions[chunk.descriptions[Grid.chunk_offset(self._coords)]]
+        if key == "action":
+            chunk = grid.chunk(self._coords)
+            return self._board.room_action(chunk.actions[Grid.chunk_offset(self._coords)])
+        if key == "directions":
+            return grid.directions(self._coords)
+
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key != "solved":
+            raise KeyError(f"Only the solved state of a room can be changed, not {key!r}")
+
+        self._board.set_solved(self._coords, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Rooms do not support deleting keys")
+
+    def __iter__(self):
+        return iter(RoomView.KEYS)
+
+    def __len__(self) -> int:
+        return len(RoomView.KEYS)
+
+
+class BoardView(Mapping):
+    """
+    A read-only dictionary-like view of a board's grid, keyed by room coordinates.
+    """
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board) -> None:
+        """
+        Instantiate a view of the rooms of board.
+
+        :param board: a Board object
+        :precondition: board must be a Board object
+        :postcondition: instantiates a view of the rooms of board
+        """
+        self._board = board
+
+    def __getitem__(self, coords: tuple) -> RoomView:
+        if coords not in self:
+            raise KeyError(coords)
+
+        return RoomView(self._board, coords)
+
+    def __contains__(self, coords) -> bool:
+        try:
+            return coords in self._board.grid
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self):
+        return iter(self._board.grid)
+
+    def __len__(self) -> int:
+        return len(self._board.grid)
+
+
+def main():
+    """
+    Drive the Program.
+    """
+    print("You are attempting to execute the grid.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 """
 Functions to assist in the creation of the game.
 """
+from console import Console
+from renderer import Renderer
 
 
 class Helpers:
@@ -8,31 +10,63 @@ class Helpers:
     A class containing helper functions for the game.
     """
 
+    @staticmethod
+    def print_plain(value="", end: str = "\n") -> None:
+        """
+        Print value to the console of the current session with a specific ending.
+
+        :param value: a python object of any type that will be printed. Default is an empty string
+        :param end: a string representing the last characters to be printed. Default value is "\n".
+        :precondition: value must be a python object of any type
+        :precondition: end must be a string
+        :postcondition: prints value to the current console with the ending specified, unless it is silent
+        """
+        console = Console.current()
+        if not console.silent:
+            console.write(f"{value}{end}")
+
+    @staticmethod
+    def read_line(prompt: str = "") -> str:
+        """
+        Return the next line entered in the console of the current session.
+
+        :param prompt: a string printed before reading. Default is an empty string
+        :precondition: prompt must be a string
+        :postcondition: prints prompt, then returns the next line entered in the current console
+        :return: the line entered, as a string
+        :raise EOFError: if the console has no more input
+        """
+        console = Console.current()
+        if prompt:
+            console.write(prompt)
+        console.flush()
+
+        return console.read()
+
     @staticmethod
     def print_in_color(value, color: str, end: str = "\n") -> None:
         """
-        Print value to stdout in a specific color with a specific ending.
+        Print value to the current console in a specific color with a specific ending.
 
-        :param value: a python object of any type that will be printed to stdout
+        :param value: a python object of any type that will be printed
         :param color: the name of the color you want to print in, as one of the following strings: "purple", "blue",
         "cyan", "green", "yellow", "red"
         :param end: a string representing the last characters to be printed. Default value is "\n".
         :precondition: value must be a python object of any type
         :precondition: color must be one of the following strings: "purple", "blue", "cyan", "green", "yellow", "red"
         :precondition: end must be a string
-        :postcondition: prints value to stdout in the color specified with the ending specified
+        :postcondition: prints value to the current console in the color specified with the ending specified, or
+                        without color if the console has none, unless it is silent
         """
-        colors = {
-            "purple": '\033[95m',
-            "blue": '\033[94m',
-            "cyan": '\033[96m',
-            "green": '\033[92m',
-            "yellow": '\033[93m',
-            "red": '\033[91m',
-            "end_color": '\033[0m',
-        }
+        console = Console.current()
+        if console.silent:
+            return
 
-        print(colors[color.lower()] + str(value) + colors["end_color"], end=end)
+        if console.color:
+            prefix = Renderer.COLORS.get(color) or Renderer.COLORS[color.lower()]
+            console.write(f"{prefix}{value}{Renderer.END_COLOR}{end}")
+        else:
+            console.write(f"{value}{end}")
 
     @staticmethod
     def cleanse(text: str) -> str:
@@ -80,7 +114,7 @@ class Helpers:
     @staticmethod
     def print_user_options(options: list, option_title: str) -> None:
         """
-        Print an enumerated and formatted list of options to stdout.
+        Print an enumerated and formatted list of options to the current console.
 
         The original options list does not get modified during execution.
 
@@ -88,12 +122,12 @@ class Helpers:
         :param option_title: a string that will be the title of the printed options
         :precondition: options must be an enumerated list of options
         :precondition: option_title must be a string
-        :postcondition: prints an enumerated and formatted list of options to stdout
+        :postcondition: prints an enumerated and formatted list of options to the current console
         """
         Helpers.print_in_color("\n{:<15}{}".format("Command", option_title), "blue")
 
         for number, option in options:
-            print(f"{number:<15}{option}")
+            Helpers.print_plain(f"{number:<15}{option}")
 
     @staticmethod
     def get_user_choice(options: list, numeric: bool = False) -> str:
@@ -109,6 +143,7 @@ class Helpers:
         :precondition: numeric must be a boolean. Default is False.
         :postcondition: returns the user's selected option or number as a string
         :return: the user's selected option or number as a string
+        :raise EOFError: if the current console has no more input
         """
         options = list(map(Helpers.convert_first_index_to_str, options))
 
@@ -116,11 +151,11 @@ class Helpers:
 
         Helpers.print_in_color(f"\nPlease choose an option:", "purple")
 
-        user_choice = Helpers.cleanse(input())
+        user_choice = Helpers.cleanse(Helpers.read_line())
         while user_choice not in commands:
             Helpers.print_in_color("That is not a valid choice. Take a closer look and try again.", "red")
             Helpers.print_in_color(f"\nPlease choose an option?", "purple")
-            user_choice = Helpers.cleanse(input())
+            user_choice = Helpers.cleanse(Helpers.read_line())
 
         # will return a string version of the numeric command
         if numeric:
@@ -133,11 +168,12 @@ class Helpers:
         """
         Return the input from the user.
 
-        :postcondition: returns the string value of what the user entered into stdin
+        :postcondition: returns the string value of what the user entered into the current console
         :return: the input from the user, as a string
+        :raise EOFError: if the current console has no more input
         """
         Helpers.print_in_color("Please enter a name for your character..", "purple")
-        return input()
+        return Helpers.read_line()
 
 
 def main() -> None:
@@ -0,0 +1,306 @@
+"""
+Module containing the Journal class, which saves a game as it is played so it can be resumed later.
+"""
+import base64
+import json
+import os
+import zlib
+from board import Board
+from character import Character
+
+
+class Journal:
+    """
+    A saved game, kept as a compact snapshot of its state and an append-only journal of every step taken since.
+
+    Every move, solved room and change to the character is appended to the journal as one short line. The lines of a
+    turn are handed to the operating system together at the end of the turn, so a crash loses at most the turn in
+    progress without waiting for the disk every turn. Every snapshot_every entries the whole state is written to a new
+    snapshot and the journal starts over, so resuming reads one snapshot and at most a turn more than snapshot_every
+    entries, however long the game has run.
+
+    Entries are json arrays of a sequence number, a kind and its values:
+
+    - ["m", x, y]: the character moved to the room at (x, y) and visited it
+    - ["s", x, y, solved]: the room at (x, y) was solved (1) or unsolved (0)
+    - ["c", key, value]: the key of the state of the character, such as its hp, xp, level or an item, changed to value
+    - ["a", ability]: the character gained ability
+    """
+
+    FORMAT = 1
+    SNAPSHOT_EVERY = 256
+
+    def __init__(self, path: str, snapshot_every: int = SNAPSHOT_EVERY) -> None:
+        """
+        Instantiate a journal kept in files next to path.
+
+        :param path: the path of the save, without extension
+        :param snapshot_every: a positive integer, the number of entries after which a snapshot is taken. Default is
+                               SNAPSHOT_EVERY
+        :precondition: the directory of path must exist
+        :precondition: snapshot_every must be a positive non-zero integer
+        :postcondition: instantiates a journal that is not recording any game yet
+        """
+        self.snapshot_path = path + ".snapshot"
+        self.journal_path = path + ".journal"
+        self.snapshot_every = snapshot_every
+        self.board = None
+        self.character = None
+        self.file = None
+        self.sequence = 0
+        self.since_snapshot = 0
+        self.snapshots = 0
+        self.recorded = None
+
+    def exists(self) -> bool:
+        """
+        Determine if there is a saved game to resume.
+
+        :postcondition: returns True if a snapshot has been written at the path of the journal, otherwise False
+        :return: True if there is a saved game, otherwise False
+        """
+        return os.path.exists(self.snapshot_path)
+
+    def start(self, board: Board, character: Character) -> None:
+        """
+        Start recording a new game.
+
+        :param board: a Board object
+        :param character: a Character object on board
+        :precondition: the journal must not be recording a game
+        :postcondition: replaces any saved game with a snapshot of board and character, and records from now on
+        """
+        self.board, self.character = board, character
+        self.sequence = 0
+        self.snapshot()
+
+    def resume(self) -> tuple:
+        """
+        Load the saved game and keep recording it.
+
+        :precondition: the journal must not be recording a game
+        :postcondition: rebuilds the board and character of the latest snapshot, replays the entries after it, and
+                        takes a new snapshot of the result
+        :return: a tuple of the Board and Character objects of the saved game
+        :raise ValueError: if there is no snapshot, or it was written by an incompatible version of the game
+        """
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except (OSError, json.JSONDecodeError) as error:
+            raise ValueError(f"There is no saved game at {self.snapshot_path}") from error
+
+        if snapshot.get("format") != Journal.FORMAT:
+            raise ValueError("The saved game was written by an incompatible version of the game")
+
+        layout = snapshot["board"]
+        self.board = Board(layout["rows"], layout["columns"], tuple(layout["boss_1_coords"]),
+                           tuple(layout["boss_2_coords"]), tuple(layout["final_boss_coords"]), layout["seed"])
+        self.board.load_progress((Journal.unpack(snapshot["solved"]), Journal.unpack(snapshot["visited"])))
+        self.character = Character(snapshot["character"]["name"])
+        self.character.set_state(snapshot["character"])
+        self.sequence = snapshot["sequence"]
+
+        for entry in self.tail():
+            if entry[0] > self.sequence:
+                self.apply(entry)
+                self.sequence = entry[0]
+
+        self.snapshot()
+        return self.board, self.character
+
+    def tail(self):
+        """
+        Iterate over the entries in the journal.
+
+        :postcondition: yields every complete entry in the journal file in order, stopping at the first line that was
+                        cut short by a crash
+        """
+        try:
+            file = open(self.journal_path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+
+        with file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    return
+
+    def apply(self, entry: list) -> None:
+        """
+        Make the change recorded in entry to the board and character.
+
+        :param entry: a list read from the journal
+        :precondition: entry must have been appended by this class, and a game must be loaded
+        :postcondition: changes the board or character the way the step recorded in entry changed them
+        """
+        kind, values = entry[1], entry[2:]
+        if kind == "m":
+            self.character.set_state({"position": values})
+            self.board.grid.set_visited(tuple(values))
+        elif kind == "s":
+            self.board.set_solved(tuple(values[:2]), bool(values[2]))
+        elif kind == "c":
+            self.character.set_state({values[0]: values[1]})
+        elif kind == "a":
+            self.character.add_ability(values[0])
+
+    def append(self, *entry) -> None:
+        """
+        Append an entry to the journal.
+
+        :param entry: the kind of the entry followed by its values, which must all be json values
+        :precondition: the journal must be recording a game
+        :postcondition: buffers the entry, which reaches the file at the latest when the turn is committed
+        """
+        self.sequence += 1
+        self.since_snapshot += 1
+        self.file.write(json.dumps((self.sequence,) + entry, separators=(",", ":")) + "\n")
+
+    def moved(self, position: tuple) -> None:
+        """
+        Record that the character moved into a room.
+
+        :param position: a tuple of the coordinates of the room
+        :precondition: the journal must be recording a game
+        :postcondition: appends a move entry to the journal
+        """
+        self.append("m", *position)
+        self.recorded["position"] = list(position)
+
+    def solved(self, coords: tuple, solved: bool) -> None:
+        """
+        Record that a room was solved or unsolved.
+
+        :param coords: a tuple of the coordinates of the room
+        :param solved: a boolean
+        :precondition: the journal must be recording a game
+        :postcondition: appends a solved entry to the journal
+        """
+        self.append("s", *coords, int(solved))
+
+    def commit(self) -> None:
+        """
+        Finish recording a turn.
+
+        :precondition: the journal must be recording a game
+        :postcondition: appends an entry for every change to the character since the last turn, hands the entries of
+                        the turn to the operating system, and takes a snapshot once snapshot_every entries have been
+                        appended since the last one
+        """
+        state = self.character.get_state()
+        for key, value in state.items():
+            if value == self.recorded[key]:
+                continue
+            if key == "abilities" and value[:len(self.recorded[key])] == self.recorded[key]:
+                for ability in value[len(self.recorded[key]):]:
+                    self.append("a", ability)
+            else:
+                self.append("c", key, value)
+        self.recorded = state
+
+        if self.since_snapshot >= self.snapshot_every:
+            self.snapshot()
+        else:
+            self.file.flush()
+
+    def snapshot(self) -> None:
+        """
+        Write the whole state of the game to a new snapshot and start a new journal.
+
+        :precondition: a game must be loaded
+        :postcondition: replaces the snapshot file in one step, so a crash leaves either the old or the new snapshot,
+                        then empties the journal
+        """
+        board = self.board
+        solved, visited = board.grid.dump_progress()
+        snapshot = {
+            "format": Journal.FORMAT,
+            "sequence": self.sequence,
+            "board": {"rows": board.rows, "columns": board.columns, "boss_1_coords": board.boss_1_coords,
+                      "boss_2_coords": board.boss_2_coords, "final_boss_coords": board.final_boss_coords,
+                      "seed": board.seed},
+            "character": self.character.get_state(),
+            "solved": Journal.pack(solved),
+            "visited": Journal.pack(visited)
+        }
+
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+
+        # entries up to the sequence of the snapshot are skipped on resume, so a crash before this point is harmless
+        if self.file is not None:
+            self.file.close()
+        self.file = open(self.journal_path, "w", encoding="utf-8")
+        self.since_snapshot = 0
+        self.snapshots += 1
+        self.recorded = snapshot["character"]
+
+    def close(self, delete: bool = False) -> None:
+        """
+        Stop recording the game.
+
+        :param delete: a boolean representing if the saved game should be deleted, such as when it has been completed.
+                       Default is False, which takes a last snapshot so the game resumes without replaying anything
+        :precondition: delete must be a boolean
+        :postcondition: closes the journal file, and deletes the saved game if delete is True
+        """
+        if self.file is None:
+            return
+
+        if not delete:
+            self.commit()
+            if self.since_snapshot:
+                self.snapshot()
+        self.file.close()
+        self.file = None
+
+        if delete:
+            for path in (self.snapshot_path, self.journal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    @staticmethod
+    def pack(bits: bytes) -> str:
+        """
+        Compress raw flags into text.
+
+        :param bits: a bytes object
+        :precondition: bits must be a bytes object
+        :postcondition: returns bits compressed and encoded as base64, which is short when most flags are the same
+        :return: a string
+
+        >>> Journal.unpack(Journal.pack(bytes(1000))) == bytes(1000), len(Journal.pack(bytes(1000)))
+        (True, 24)
+        """
+        return base64.b64encode(zlib.compress(bits)).decode("ascii")
+
+    @staticmethod
+    def unpack(text: str) -> bytes:
+        """
+        Decompress flags compressed by pack.
+
+        :param text: a string returned by pack
+        :precondition: text must be returned by pack
+        :postcondition: returns the raw flags that were packed into text
+        :return: a bytes object
+        """
+        return zlib.decompress(base64.b64decode(text))
+
+
+def main():
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the journal.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
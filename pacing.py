@@ -0,0 +1,355 @@
+"""
+Module containing the Beat namedtuple and the pacers that decide how long dramatic pauses last.
+"""
+import abc
+import asyncio
+import contextlib
+import contextvars
+import threading
+from collections import namedtuple
+from console import Console
+from helpers import Helpers
+
+Beat = namedtuple("Beat", ("text", "color", "delay"))
+
+
+class Pacer(abc.ABC):
+    """
+    The timing of the pauses between the beats of a scene.
+
+    Every pause can be taken in two ways: pause blocks the calling thread, while wait is awaited, so an event loop can
+    keep running other sessions during the pause. The pacer used by the game is the one of the current context.
+    """
+
+    __current = contextvars.ContextVar("pacer")
+
+    @staticmethod
+    def current() -> "Pacer":
+        """
+        Return the pacer of the current context.
+
+        :postcondition: returns the pacer set by the closest enclosing Pacer.use, or a real-time pacer
+        :return: a Pacer object
+        """
+        return Pacer.__current.get(REAL_TIME)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def use(pacer: "Pacer"):
+        """
+        Make pacer the pacer of the current context inside a with statement.
+
+        :param pacer: a Pacer object
+        :precondition: pacer must be a Pacer object
+        :postcondition: makes pacer the current pacer until the with statement ends
+        :return: a context manager that yields pacer
+        """
+        token = Pacer.__current.set(pacer)
+        try:
+            yield pacer
+        finally:
+            Pacer.__current.reset(token)
+
+    @staticmethod
+    def show(beat: Beat) -> None:
+        """
+        Print the text of beat to the current console.
+
+        :param beat: a Beat namedtuple
+        :precondition: beat must be a Beat namedtuple whose color is None or accepted by Helpers.print_in_color
+        :postcondition: prints the text of beat in its color, or without color if it has none
+        """
+        if beat.color is None:
+            Helpers.print_plain(beat.text)
+        else:
+            Helpers.print_in_color(beat.text, beat.color)
+
+    @abc.abstractmethod
+    def pause(self, seconds: float) -> None:
+        """
+        Block the calling thread for a pause of seconds.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns once the pause is over
+        """
+
+    @abc.abstractmethod
+    async def wait(self, seconds: float) -> None:
+        """
+        Wait for a pause of seconds without blocking the event loop.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns once the pause is over
+        """
+
+    def interrupt(self) -> None:
+        """
+        End the pause that is running, and skip every pause after it.
+
+        :postcondition: does nothing unless the pacer has pauses that can be cut short
+        """
+
+    def play(self, scene: tuple, output=None) -> None:
+        """
+        Show every beat of scene, pausing after each one for its delay.
+
+        :param scene: a tuple of Beat namedtuples
+        :param output: a callable accepting a Beat. Default is None, which uses Pacer.show
+        :precondition: scene must be a tuple of Beat namedtuples
+        :postcondition: shows the beats of scene in order, blocking the calling thread during the pauses
+        :postcondition: flushes the current console before every pause and at the end of the scene
+        """
+        output = Pacer.show if output is None else output
+        console = Console.current()
+        for beat in scene:
+            output(beat)
+            if beat.delay:
+                console.flush()
+                self.pause(beat.delay)
+
+        console.flush()
+
+    async def perform(self, scene: tuple, output=None) -> None:
+        """
+        Show every beat of scene, waiting after each one for its delay.
+
+        :param scene: a tuple of Beat namedtuples
+        :param output: a callable accepting a Beat. Default is None, which uses Pacer.show
+        :precondition: scene must be a tuple of Beat namedtuples
+        :postcondition: shows the beats of scene in order, letting the event loop run during the pauses
+        :postcondition: flushes the current console before every pause and at the end of the scene
+
+        >>> shown = []
+        >>> asyncio.run(HeadlessPacer().perform((Beat("a", None, 2), Beat("b", "cyan", 0)), shown.append))
+        >>> [beat.text for beat in shown]
+        ['a', 'b']
+        """
+        output = Pacer.show if output is None else output
+        console = Console.current()
+        for beat in scene:
+            output(beat)
+            if beat.delay:
+                console.flush()
+                await self.wait(beat.delay)
+
+        console.flush()
+
+
+class RealTimePacer(Pacer):
+    """
+    A pacer that lasts every pause for its full length, or a fraction of it.
+    """
+
+    def __init__(self, scale: float = 1.0) -> None:
+        """
+        Instantiate a real-time pacer.
+
+        :param scale: a non-negative number that every pause is multiplied by. Default is 1.0
+        :precondition: scale must be a non-negative number
+        :postcondition: instantiates a pacer whose pauses last scale times their length
+        """
+        self.scale = scale
+        self.interrupted = threading.Event()
+
+    def interrupt(self) -> None:
+        """
+        End the pause that is running, and skip every pause after it.
+
+        :postcondition: wakes any thread sleeping in pause, and makes every later pause return at once
+        """
+        self.interrupted.set()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Sleep for seconds times the scale of the pacer, unless the pacer is interrupted.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns after the scaled pause, or as soon as the pacer is interrupted
+
+        >>> pacer = RealTimePacer()
+        >>> pacer.interrupt()
+        >>> pacer.pause(60)
+        """
+        self.interrupted.wait(seconds * self.scale)
+
+    async def wait(self, seconds: float) -> None:
+        """
+        Wait for seconds times the scale of the pacer without blocking the event loop.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns after the scaled pause, or at once if the pacer has been interrupted
+        """
+        if not self.interrupted.is_set():
+            await asyncio.sleep(seconds * self.scale)
+
+
+class HeadlessPacer(Pacer):
+    """
+    A pacer that skips every pause, for tests, bots and replays.
+    """
+
+    def pause(self, seconds: float) -> None:
+        """
+        Return at once.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns without pausing
+        """
+
+    async def wait(self, seconds: float) -> None:
+        """
+        Yield to the event loop once and return.
+
+        :param seconds: a non-negative number
+        :precondition: seconds must be a non-negative number
+        :postcondition: lets other tasks run before returning, so a long scene cannot starve them
+        """
+        await asyncio.sleep(0)
+
+
+class ClientPacer(Pacer):
+    """
+    A pacer whose pauses last until the client asks for the next beat.
+
+    The client either calls advance, from any thread, or is asked directly through a request callable.
+    """
+
+    def __init__(self, request=None, timeout: float = None) -> None:
+        """
+        Instantiate a client-driven pacer.
+
+        :param request: a callable accepting the length of a pause, which returns once the client wants to continue.
+                        Default is None, which waits for advance to be called instead
+        :param timeout: a non-negative number of seconds after which a pause ends even if the client has not
+                        continued. Default is None, which waits forever
+        :precondition: request must be a callable or None
+        :precondition: timeout must be a non-negative number or None
+        :postcondition: instantiates a pacer without any early advances
+        """
+        self.request = request
+        self.timeout = timeout
+        self.condition = threading.Condition()
+        self.advances = 0
+        self.waiters = []
+        self.interrupted = False
+
+    def advance(self) -> None:
+        """
+        End the current pause, or the next one if no pause is running.
+
+        :postcondition: wakes the oldest awaited pause, or a blocked pause, or remembers the advance for the next pause
+        """
+        with self.condition:
+            while self.waiters:
+                loop, future = self.waiters.pop(0)
+                if not future.done():
+                    loop.call_soon_threadsafe(ClientPacer.finish, future)
+                    return
+
+            self.advances += 1
+            self.condition.notify()
+
+    def interrupt(self) -> None:
+        """
+        End every waiting pause, and make every later pause return at once.
+
+        :postcondition: wakes every pause waiting for the client, which no longer has to continue
+        """
+        with self.condition:
+            self.interrupted = True
+            self.condition.notify_all()
+            for loop, future in self.waiters:
+                loop.call_soon_threadsafe(ClientPacer.finish, future)
+            self.waiters.clear()
+
+    @staticmethod
+    def finish(future: asyncio.Future) -> None:
+        """
+        Complete future unless it has already been cancelled.
+
+        :param future: an asyncio.Future object
+        :precondition: future must be called from the event loop of future
+        :postcondition: sets the result of future to None if it is still pending
+        """
+        if not future.done():
+            future.set_result(None)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Block the calling thread until the client continues.
+
+        :param seconds: a non-negative number, passed on to request
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns once the client continues or the timeout is reached
+
+        >>> pacer = ClientPacer(timeout=1)
+        >>> pacer.advance()
+        >>> pacer.pause(5), pacer.advances
+        (None, 0)
+        """
+        if self.interrupted:
+            return
+
+        if self.request is not None:
+            self.request(seconds)
+            return
+
+        with self.condition:
+            if self.condition.wait_for(lambda: self.advances > 0 or self.interrupted, self.timeout):
+                if not self.interrupted:
+                    self.advances -= 1
+
+    async def wait(self, seconds: float) -> None:
+        """
+        Wait without blocking the event loop until the client continues.
+
+        A request callable blocks, so it is called in the default executor of the event loop.
+
+        :param seconds: a non-negative number, passed on to request
+        :precondition: seconds must be a non-negative number
+        :postcondition: returns once the client continues or the timeout is reached
+        """
+        if self.request is not None and not self.interrupted:
+            await asyncio.get_running_loop().run_in_executor(None, self.request, seconds)
+            return
+
+        with self.condition:
+            if self.interrupted:
+                return
+
+            if self.advances > 0:
+                self.advances -= 1
+                return
+
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.waiters.append((loop, future))
+
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self.condition:
+                if (loop, future) in self.waiters:
+                    self.waiters.remove((loop, future))
+
+
+REAL_TIME = RealTimePacer()
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the pacing.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Module containing the DistanceField class.
+"""
+from array import array
+from collections import deque
+
+
+class DistanceField:
+    """
+    Breadth-first distances from every room of a grid to its nearest target room.
+
+    The field is computed once and then kept up to date as targets are added or removed, so the shortest path from
+    any room can be read off in time proportional to its length, without searching the grid again.
+    """
+
+    UNREACHABLE = 2 ** 31 - 1
+
+    def __init__(self, grid, targets) -> None:
+        """
+        Instantiate the distance field of grid towards targets.
+
+        :param grid: a Grid object
+        :param targets: an iterable of room coordinates
+        :precondition: grid must be a Grid object
+        :precondition: every coordinate in targets must be a room of grid
+        :postcondition: instantiates a distance field where every room knows its distance to the nearest target
+        """
+        self.grid = grid
+        self.columns = grid.columns
+        self.inner_rooms = grid.columns * grid.rows
+        self.extra_links = {}
+
+        for coords in grid.extra_order:
+            extra_index = grid.index(coords)
+            for neighbour in grid.directions(coords).values():
+                if neighbour is not None:
+                    self.extra_links.setdefault(extra_index, []).append(grid.index(neighbour))
+                    self.extra_links.setdefault(grid.index(neighbour), []).append(extra_index)
+
+        size = len(grid)
+        self.distances = array('i', [DistanceField.UNREACHABLE]) * size
+        self.sources = array('i', [-1]) * size
+        self.targets = set()
+
+        self.add_targets(targets)
+
+    def neighbours(self, index: int) -> list:
+        """
+        Return the indices of the rooms next to the room at index.
+
+        :param index: an integer
+        :precondition: index must be a valid index of the field's arrays
+        :postcondition: returns the indices of the neighbouring rooms
+        :return: a list of integers
+        """
+        neighbours = []
+
+        if index < self.inner_rooms:
+            column = index % self.columns
+            if column > 0:
+                neighbours.append(index - 1)
+            if column < self.columns - 1:
+                neighbours.append(index + 1)
+            if index >= self.columns:
+                neighbours.append(index - self.columns)
+            if index + self.columns < self.inner_rooms:
+                neighbours.append(index + self.columns)
+
+        neighbours += self.extra_links.get(index, ())
+        return neighbours
+
+    def spread(self, queue: deque, seeds: list = ()) -> None:
+        """
+        Relax distances outwards from the rooms in queue and seeds until nothing gets closer.
+
+        :param queue: a deque of room indices whose distances have just decreased, all with the same distance
+        :param seeds: a list of (distance, index) tuples sorted by distance, of rooms to spread from in order
+        :precondition: queue and seeds must only hold rooms with a known distance
+        :postcondition: every room reachable from queue or seeds holds its shortest distance and nearest source
+        """
+        distances = self.distances
+        sources = self.sources
+        seed_position = 0
+
+        while queue or seed_position < len(seeds):
+            if queue and (seed_position == len(seeds) or distances[queue[0]] <= seeds[seed_position][0]):
+                room = queue.popleft()
+            else:
+                room = seeds[seed_position][1]
+                seed_position += 1
+
+            next_distance = distances[room] + 1
+            for neighbour in self.neighbours(room):
+                if next_distance < distances[neighbour]:
+                    distances[neighbour] = next_distance
+                    sources[neighbour] = sources[room]
+                    queue.append(neighbour)
+
+    def add_targets(self, targets) -> None:
+        """
+        Add target rooms and lower the distances of every room that is now closer to a target.
+
+        :param targets: an iterable of room coordinates
+        :precondition: every coordinate in targets must be a room of the grid
+        :postcondition: every room holds its distance to the nearest target, including the new ones
+        """
+        queue = deque()
+
+        for coords in targets:
+            index = self.grid.index(coords)
+            if index in self.targets:
+                continue
+
+            self.targets.add(index)
+            self.distances[index] = 0
+            self.sources[index] = index
+            queue.append(index)
+
+        self.spread(queue)
+
+    def remove_target(self, coords: tuple) -> None:
+        """
+        Remove a target room and recompute the distances of only the rooms that relied on it.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room of the grid
+        :postcondition: every room holds its distance to the nearest remaining target
+        """
+        target = self.grid.index(coords)
+        if target not in self.targets:
+            return
+
+        self.targets.remove(target)
+        distances = self.distances
+        sources = self.sources
+
+        region = [target]
+        sources[target] = -1
+        position = 0
+        while position < len(region):
+            for neighbour in self.neighbours(region[position]):
+                if sources[neighbour] == target:
+                    sources[neighbour] = -1
+                    region.append(neighbour)
+            position += 1
+
+        for room in region:
+            distances[room] = DistanceField.UNREACHABLE
+
+        seeds = set()
+        for room in region:
+            for neighbour in self.neighbours(room):
+                if sources[neighbour] != -1:
+                    seeds.add((distances[neighbour], neighbour))
+
+        self.spread(deque(), sorted(seeds))
+
+    def distance(self, coords: tuple) -> int:
+        """
+        Return the number of moves from coords to the nearest target.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room of the grid
+        :postcondition: returns the number of moves to the nearest target, or None if no target can be reached
+        :return: the number of moves as an integer, or None
+        """
+        distance = self.distances[self.grid.index(coords)]
+        return None if distance == DistanceField.UNREACHABLE else distance
+
+    def route(self, coords: tuple) -> list:
+        """
+        Return the directions of a shortest path from coords to the nearest target.
+
+        :param coords: a tuple of two integers
+        :precondition: coords must be the coordinates of a room of the grid
+        :postcondition: returns the directions to follow, in time proportional to the length of the path
+        :return: a list of direction strings, empty if coords is a target or no target can be reached
+        """
+        distances = self.distances
+        room = self.grid.index(coords)
+        if distances[room] == DistanceField.UNREACHABLE:
+            return []
+
+        directions = []
+        while distances[room] > 0:
+            for direction, neighbour in self.grid.directions(self.grid.coords(room)).items():
+                if neighbour is not None and distances[self.grid.index(neighbour)] == distances[room] - 1:
+                    directions.append(direction)
+                    room = self.grid.index(neighbour)
+                    break
+
+        return directions
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the pathfinding.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Module containing the Renderer class.
+"""
+import shutil
+import unicodedata
+from console import Console
+
+
+class Renderer:
+    """
+    A class that builds whole frames of colored text in one buffer.
+    """
+
+    COLORS = {
+        "purple": '\033[95m',
+        "blue": '\033[94m',
+        "cyan": '\033[96m',
+        "green": '\033[92m',
+        "yellow": '\033[93m',
+        "red": '\033[91m',
+    }
+    END_COLOR = '\033[0m'
+
+    @staticmethod
+    def encode(rows, color: bool = True) -> str:
+        """
+        Encode rows of colored cells as a single string.
+
+        Neighbouring segments that share a color are merged into one escape sequence run, and the color is only reset
+        once, at the end of the last row. Without color, only the text of the segments is kept.
+
+        :param rows: an iterable of rows, where each row is an iterable of cells and each cell is a tuple of
+                     (text, color) segments
+        :param color: a boolean representing if escape sequences should be included. Default is True
+        :precondition: every color must be one of the following strings: "purple", "blue", "cyan", "green",
+                       "yellow", "red"
+        :postcondition: returns the frame encoded as a string ending in a newline
+        :return: the frame encoded as a string
+
+        >>> Renderer.encode([[(("|", "green"), ("#", "purple"), ("|", "green")), (("|?|", "green"),)]])
+        '\\x1b[92m|\\x1b[95m#\\x1b[92m||?|\\x1b[0m\\n'
+        >>> Renderer.encode([[(("---", "green"),)], [(("| |", "green"),)]])
+        '\\x1b[92m---\\n| |\\x1b[0m\\n'
+        >>> Renderer.encode([[(("|", "green"), ("#", "purple"), ("|", "green"))]], color=False)
+        '|#|\\n'
+        """
+        if not color:
+            return "".join("".join(text for cell in row for text, _ in cell) + "\n" for row in rows)
+
+        colors = Renderer.COLORS
+        parts = []
+        current_color = None
+
+        for row in rows:
+            for cell in row:
+                for text, color in cell:
+                    if color != current_color:
+                        parts.append(colors[color])
+                        current_color = color
+                    parts.append(text)
+            parts.append("\n")
+
+        if current_color is not None:
+            parts.insert(len(parts) - 1, Renderer.END_COLOR)
+
+        return "".join(parts)
+
+    @staticmethod
+    def write_frame(rows, stream=None) -> None:
+        """
+        Encode rows of colored cells and write them with a single call.
+
+        :param rows: an iterable of rows, where each row is an iterable of cells and each cell is a tuple of
+                     (text, color) segments
+        :param stream: a writable text stream. Default is None, which writes to the current console
+        :precondition: rows must be in the format accepted by Renderer.encode
+        :postcondition: writes a blank line followed by the encoded frame to stream, in one write call, leaving out
+                        colors if stream is a console without color
+        """
+        if stream is None:
+            stream = Console.current()
+
+        stream.write("\n" + Renderer.encode(rows, getattr(stream, "color", True)))
+
+
+class Screen:
+    """
+    A full-screen map that keeps the last frame and only rewrites the cells that changed.
+
+    The map is pinned to the top of the terminal with raw ANSI cursor addressing, and the terminal's scroll region is
+    limited to the lines below it so the rest of the game text scrolls underneath the map.
+    """
+
+    SAVE_CURSOR = '\0337'
+    RESTORE_CURSOR = '\0338'
+    RESET_SCROLL_REGION = '\033[r'
+    CLEAR_SCREEN = '\033[2J\033[H'
+
+    def __init__(self, stream=None, terminal_lines: int = None) -> None:
+        """
+        Instantiate a new Screen with no previous frame.
+
+        :param stream: a writable text stream. Default is None, which writes to the current console
+        :param terminal_lines: the height of the terminal in lines. Default is None, which asks the terminal
+        :precondition: terminal_lines must be a positive integer or None
+        :postcondition: instantiates a new Screen with no previous frame
+        """
+        self.stream = stream if stream is not None else Console.current()
+        self.terminal_lines = terminal_lines
+        self.last_frame = None
+        self.widths = {}
+
+    def cell_width(self, cell: tuple) -> int:
+        """
+        Return the number of terminal columns a cell occupies.
+
+        :param cell: a tuple of (text, color) segments
+        :precondition: cell must be a tuple of (text, color) segments
+        :postcondition: returns the display width of cell, counting wide characters such as emoji as two columns
+        :return: the display width of cell as an integer
+        """
+        width = self.widths.get(cell)
+        if width is None:
+            width = sum(2 if unicodedata.east_asian_width(character) in "WF" else 1
+                        for text, color in cell for character in text)
+            self.widths[cell] = width
+
+        return width
+
+    def full_paint(self, rows: list) -> str:
+        """
+        Return the output that clears the terminal, draws rows at the top and pins them there.
+
+        If the terminal is too short to hold the map above a scroll region, rows are returned as a plain frame and no
+        frame is remembered, so the next draw is a full paint as well.
+
+        :param rows: a list of rows in the format accepted by Renderer.encode
+        :precondition: rows must be a list of rows in the format accepted by Renderer.encode
+        :postcondition: returns the output that paints rows, leaving out colors if the stream has none
+        :return: the output as a string
+        """
+        lines = self.terminal_lines or shutil.get_terminal_size().lines
+        color = getattr(self.stream, "color", True)
+
+        if len(rows) + 2 >= lines:
+            self.last_frame = None
+            return "\n" + Renderer.encode(rows, color)
+
+        self.last_frame = rows
+        return (Screen.RESET_SCROLL_REGION + Screen.CLEAR_SCREEN + Renderer.encode(rows, color) +
+                f"\033[{len(rows) + 2};{lines}r\033[{lines};1H")
+
+    def diff(self, rows: list) -> str:
+        """
+        Return the output that turns the last frame into rows by rewriting only the cells that changed.
+
+        :param rows: a list of rows with the same shape as the last frame
+        :precondition: rows must have the same number of rows and cells per row as self.last_frame
+        :postcondition: returns the cursor movements and cells that update the pinned map, leaving out colors if the
+                        stream has none
+        :return: the output as a string, empty if nothing changed
+        """
+        colors = Renderer.COLORS if getattr(self.stream, "color", True) else None
+        parts = []
+        current_color = None
+
+        for line, (new_row, old_row) in enumerate(zip(rows, self.last_frame), start=1):
+            column = 1
+            in_run = False
+            shifted = False
+
+            for new_cell, old_cell in zip(new_row, old_row):
+                width = self.cell_width(new_cell)
+                shifted = shifted or width != self.cell_width(old_cell)
+
+                if shifted or new_cell != old_cell:
+                    if not in_run:
+                        parts.append(f"\033[{line};{column}H")
+                        in_run = True
+                    for text, color in new_cell:
+                        if colors is not None and color != current_color:
+                            parts.append(colors[color])
+                            current_color = color
+                        parts.append(text)
+                else:
+                    in_run = False
+
+                column += width
+
+        self.last_frame = rows
+        if not parts:
+            return ""
+
+        end_color = Renderer.END_COLOR if current_color is not None else ""
+        return Screen.SAVE_CURSOR + "".join(parts) + end_color + Screen.RESTORE_CURSOR
+
+    def draw(self, rows) -> None:
+        """
+        Draw a frame, rewriting only what changed since the last frame when possible.
+
+        :param rows: an iterable of rows in the format accepted by Renderer.encode
+        :precondition: rows must be in the format accepted by Renderer.encode
+        :postcondition: writes the output that brings the pinned map up to date with rows, in one write call
+        """
+        rows = [list(row) for row in rows]
+        last_frame = self.last_frame
+
+        if (last_frame is None or len(rows) != len(last_frame) or
+                any(len(new_row) != len(old_row) for new_row, old_row in zip(rows, last_frame))):
+            output = self.full_paint(rows)
+        else:
+            output = self.diff(rows)
+
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Release the scroll region and forget the last frame.
+
+        :postcondition: restores normal scrolling for the whole terminal
+        """
+        if self.last_frame is not None:
+            lines = self.terminal_lines or shutil.get_terminal_size().lines
+            self.stream.write(f"{Screen.RESET_SCROLL_REGION}\033[{lines};1H\n")
+            self.stream.flush()
+
+        self.last_frame = None
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the renderer.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
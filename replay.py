@@ -0,0 +1,193 @@
+"""
+Module containing the Replay class, which plays input scripts through whole games at machine speed.
+"""
+import argparse
+import json
+import time
+from collections import namedtuple
+from console import Console, MemoryConsole
+from game import Game, GameResult
+from pacing import HeadlessPacer
+
+ReplayResult = namedtuple("ReplayResult", ("turns", "seconds", "achieved_goal", "stats"))
+
+
+class Replay:
+    """
+    An input script for a game on a seeded board.
+
+    A replay is played on a silent console with every pause skipped, so a whole game takes milliseconds. Boards with
+    the same seed always have the same rooms, and fights are decided without chance, so the same script always ends
+    in the same state. Replays are stored as json files holding the board, the inputs and the expected final stats.
+    """
+
+    def __init__(self, inputs: list, seed: int = 0, rows: int = 10, columns: int = 10, expected: dict = None) -> None:
+        """
+        Instantiate a replay.
+
+        :param inputs: a list of strings, every line the player enters in order, starting with the character name
+        :param seed: an integer that determines the rooms of the board. Default is 0
+        :param rows: a positive integer. Default is 10
+        :param columns: a positive integer. Default is 10
+        :param expected: a dictionary of the final stats the replay should end with. Default is None, which expects
+                         nothing
+        :precondition: inputs must be a list of strings
+        :precondition: rows and columns must be accepted by Board
+        :postcondition: instantiates a replay that has not been played
+        """
+        self.inputs = inputs
+        self.seed = seed
+        self.rows = rows
+        self.columns = columns
+        self.expected = expected
+
+    @staticmethod
+    def load(path: str) -> "Replay":
+        """
+        Read a replay from a json file.
+
+        :param path: the path of a json file written by save
+        :precondition: path must be a json file holding at least the inputs of a replay
+        :postcondition: returns the replay stored in the file
+        :return: a Replay object
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        return Replay(data["inputs"], data.get("seed", 0), data.get("rows", 10), data.get("columns", 10),
+                      data.get("expected"))
+
+    def save(self, path: str) -> None:
+        """
+        Write the replay to a json file.
+
+        :param path: the path of a json file
+        :precondition: the directory of path must exist
+        :postcondition: writes the board, inputs and expected stats of the replay to path
+        """
+        data = {"seed": self.seed, "rows": self.rows, "columns": self.columns, "expected": self.expected,
+                "inputs": self.inputs}
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+
+    def play(self, console: Console = None) -> GameResult:
+        """
+        Play the inputs of the replay through a game without pauses.
+
+        :param console: a MemoryConsole holding the inputs of the replay. Default is None, which plays on a silent
+                        console
+        :precondition: console must be a MemoryConsole or None
+        :postcondition: plays the game until the inputs run out or the game is quit or completed
+        :return: a GameResult namedtuple
+        """
+        console = console or MemoryConsole(self.inputs, record=False)
+
+        return Game.play(self.rows, self.columns, seed=self.seed, pacer=HeadlessPacer(), console=console)
+
+    def run(self) -> ReplayResult:
+        """
+        Play the replay and measure it.
+
+        :postcondition: plays the replay on a silent console and counts the lines of input the game read
+        :return: a ReplayResult namedtuple
+        """
+        console = MemoryConsole(self.inputs, record=False)
+
+        start = time.perf_counter()
+        result = self.play(console)
+        seconds = time.perf_counter() - start
+
+        return ReplayResult(len(self.inputs) - len(console.inputs), seconds, result.achieved_goal,
+                            Replay.final_stats(result))
+
+    @staticmethod
+    def final_stats(result: GameResult) -> dict:
+        """
+        Return the state shown by show_stats at the end of a game.
+
+        :param result: a GameResult namedtuple
+        :precondition: result must be returned by Game.play
+        :postcondition: returns everything show_stats shows about the character and the board, as json values
+        :return: a dictionary, or None if the game ended before the character was created
+        """
+        character = result.character
+        if character is None:
+            return None
+
+        solved, rooms = result.board.progress()
+        staff, armour = character.get_staff(), character.get_armour()
+
+        return {
+            "name": character.get_name(),
+            "position": list(character.get_position()),
+            "level": character.get_level(),
+            "hp": round(character.get_current_hp()),
+            "max_hp": character.get_max_hp(),
+            "xp": round(character.get_xp()),
+            "damage": character.get_damage(),
+            "staff": [staff["name"], staff["rarity"]] if staff else None,
+            "armour": [armour["name"], armour["rarity"]] if armour else None,
+            "abilities": list(character.get_abilities()),
+            "rooms_cleared": solved,
+            "rooms": rooms,
+            "achieved_goal": result.achieved_goal,
+        }
+
+    def show_stats(self) -> str:
+        """
+        Return the stats of the character at the end of the replay, exactly as show_stats prints them.
+
+        :postcondition: plays the replay, then shows the stats of the character without color
+        :return: a string, which is empty if the game ended before the character was created
+        """
+        result = self.play()
+        if result.character is None:
+            return ""
+
+        console = MemoryConsole(color=False)
+        with Console.use(console):
+            result.character.show_stats(result.board)
+
+        return console.output()
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    parser = argparse.ArgumentParser(description="Play Reign of Fire replays at machine speed")
+    parser.add_argument("paths", nargs="+", metavar="replay", help="the json files of the replays to play")
+    parser.add_argument("--repeat", type=int, default=1, help="play every replay this many times, 1 by default")
+    parser.add_argument("--update", action="store_true",
+                        help="store the final stats of every replay as its expected stats instead of checking them")
+    arguments = parser.parse_args()
+
+    mismatches = 0
+    for path in arguments.paths:
+        replay = Replay.load(path)
+        results = [replay.run() for _ in range(arguments.repeat)]
+        turns = sum(result.turns for result in results)
+        seconds = sum(result.seconds for result in results)
+        stats = results[-1].stats
+
+        print(replay.show_stats(), end="")
+        print(f"{path}: {results[-1].turns} turns, {turns / seconds:.0f} turns/s over {arguments.repeat} plays")
+
+        if arguments.update:
+            replay.expected = stats
+            replay.save(path)
+        elif replay.expected is not None and replay.expected != stats:
+            mismatches += 1
+            print(f"{path}: the final stats do not match the expected stats")
+            for key in replay.expected:
+                if replay.expected[key] != stats.get(key):
+                    print(f"    {key}: expected {replay.expected[key]!r}, got {stats.get(key)!r}")
+
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
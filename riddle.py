@@ -2,8 +2,12 @@
 Contains the Riddle class.
 """
 
-import time
+from collections.abc import Mapping
+from character import Character
+from console import Console
+from events import EventBus, RiddleAnswered, XpGained
 from helpers import Helpers
+from pacing import Pacer
 
 
 class Riddle:
@@ -11,16 +15,19 @@ class Riddle:
     Class to represent a single riddle.
     """
 
+    SUCCESS_XP = 15
+    FAILURE_HP_LOSS = 0.25
+
     def __init__(self, riddle_data: dict):
         """
         Instantiate a new Riddle object.
 
-        :param riddle_data: a dictionary containing necessary riddle data
-        :precondition: riddle_data must be a dictionary containing the necessary riddle data
+        :param riddle_data: a mapping containing necessary riddle data
+        :precondition: riddle_data must be a mapping, such as a dictionary, containing the necessary riddle data
         :postcondition: instantiates a new Riddle object
         """
-        if type(riddle_data) is not dict:
-            raise TypeError("Riddle data must be a dictionary")
+        if not isinstance(riddle_data, Mapping):
+            raise TypeError("Riddle data must be a mapping")
 
         self.__question = riddle_data["question"]
         self.__options = riddle_data["options"]
@@ -40,11 +47,15 @@ class Riddle:
                                f"such "
                                f"as yourself.", "green")
 
-        if character.get_level() < 3:
-            updated_xp = round(character.get_xp() + 15)
+        if character.get_level() < Character.MAX_LEVEL:
+            updated_xp = round(character.get_xp() + Riddle.SUCCESS_XP)
             character.set_xp(updated_xp)
 
-            Helpers.print_in_color(f"\n[{character.get_name()} | xp: +15]", "yellow")
+            Helpers.print_in_color(f"\n[{character.get_name()} | xp: +{Riddle.SUCCESS_XP}]", "yellow")
+
+            bus = EventBus.shared()
+            if bus.active:
+                bus.emit(XpGained("riddle", Riddle.SUCCESS_XP, character.get_level()))
 
         Helpers.print_in_color(f"\n\nTo reward your success, I give you two options: try your luck at possibly "
                                f"earning a "
@@ -63,11 +74,12 @@ class Riddle:
                     new_ability not in character.get_abilities()
             ):
                 character.add_ability(new_ability)
-                print(f"\nYou got lucky! I am feeling generous and will grant you a new ability. You can now use "
-                      f"{new_ability}")
+                Helpers.print_plain(f"\nYou got lucky! I am feeling generous and will grant you a new ability. You "
+                                    f"can now use {new_ability}")
                 Helpers.print_in_color(f"\n[{character.get_name()} | abilities: +'{new_ability}']", "yellow")
             else:
-                print("\nOh no, looks like you lost the coin flip, you will not be getting a new ability.")
+                Helpers.print_plain("\nOh no, looks like you lost the coin flip, you will not be getting a new "
+                                    "ability.")
         else:
             difference = character.get_max_hp() - character.get_current_hp()
             character.set_current_hp(character.get_max_hp())
@@ -87,7 +99,8 @@ class Riddle:
         Helpers.print_in_color("***POOF***", "cyan")
         Helpers.print_in_color("Through the thick purple smoke, a Phantom Imp appears, with unnaturally wide smile, \n"
                                "and in a high-pitch crackle, speaks:", "cyan")
-        time.sleep(3)
+        Console.current().flush()
+        Pacer.current().pause(3)
 
         Helpers.print_in_color(r"""
                         _.----._     _.---.
@@ -130,9 +143,11 @@ class Riddle:
                                '----------'
                                """, "green")
 
-        print(f"Oh {character.get_name()}, you foolish creature, how dare you interrupt my slumber. For your "
-              f"transgression you must prove your intellect to me with a riddle if you want me to spare your life..\n")
-        time.sleep(1)
+        Helpers.print_plain(f"Oh {character.get_name()}, you foolish creature, how dare you interrupt my slumber. For "
+                            f"your transgression you must prove your intellect to me with a riddle if you want me to "
+                            f"spare your life..\n")
+        Console.current().flush()
+        Pacer.current().pause(1)
         Helpers.print_in_color(self.__question, "purple")
 
         options = list(enumerate(self.__options, start=1))
@@ -146,6 +161,10 @@ class Riddle:
         user_answer = Helpers.get_user_choice(options)
 
         if user_answer == self.__answer:
+            bus = EventBus.shared()
+            if bus.active:
+                bus.emit(RiddleAnswered(True, 0))
+
             self.riddle_success(character)
             return True
         else:
@@ -153,11 +172,16 @@ class Riddle:
                                    f"intellectually gifted. That answer is far from correct and for that you must be "
                                    f"punished!", "red")
 
-            lost_hp = character.get_current_hp() * 0.25
+            lost_hp = character.get_current_hp() * Riddle.FAILURE_HP_LOSS
             updated_hp = round(character.get_current_hp() - lost_hp)
 
+            hp_change = updated_hp - character.get_current_hp()
             character.set_current_hp(updated_hp)
 
+            bus = EventBus.shared()
+            if bus.active:
+                bus.emit(RiddleAnswered(False, hp_change))
+
             Helpers.print_in_color(f"\n[{character.get_name()} | hp: -{lost_hp}]", "yellow")
 
             return False
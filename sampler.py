@@ -0,0 +1,162 @@
+"""
+Module containing the AliasSampler and RoomSampler classes.
+"""
+import random
+
+
+class AliasSampler:
+    """
+    A weighted choice between a fixed set of outcomes, drawn in constant time with the alias method.
+    """
+
+    __slots__ = ("probabilities", "aliases")
+
+    def __init__(self, weights) -> None:
+        """
+        Instantiate a sampler choosing each index of weights with a probability proportional to its weight.
+
+        :param weights: a sequence of non-negative numbers
+        :precondition: weights must be a non-empty sequence of non-negative numbers with a positive sum
+        :postcondition: instantiates a sampler with one probability and one alias per outcome
+        :raise ValueError: if weights is empty, holds a negative weight or sums to 0
+        """
+        weights = list(weights)
+        if not weights or min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError("Weights must be non-negative and add up to more than 0!")
+
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+    def sample(self, rng: random.Random) -> int:
+        """
+        Return a random outcome.
+
+        :param rng: a random.Random object
+        :precondition: rng must be a random.Random object
+        :postcondition: returns each index with a probability proportional to its weight, in constant time
+        :return: an index of the weights the sampler was built from
+
+        >>> sampler = AliasSampler([0, 3, 1])
+        >>> rng = random.Random(0)
+        >>> draws = [sampler.sample(rng) for _ in range(4000)]
+        >>> draws.count(0), round(draws.count(1) / draws.count(2))
+        (0, 3)
+        """
+        index = rng.randrange(len(self.probabilities))
+        return index if rng.random() < self.probabilities[index] else self.aliases[index]
+
+
+class RoomSampler:
+    """
+    A configurable distribution of generic room types, which can change near the bosses.
+
+    Room types are drawn from the weights of the first region whose radius reaches the nearest boss, or from the
+    default weights away from every boss.
+    """
+
+    ENEMY_ROOM = "enemy"
+    RIDDLE_ROOM = "riddle"
+    SPIDER_WEB_ROOM = "spider_web"
+    EMPTY_ROOM = "empty"
+    ROOM_TYPES = (ENEMY_ROOM, RIDDLE_ROOM, SPIDER_WEB_ROOM, EMPTY_ROOM)
+
+    WEIGHTS = {ENEMY_ROOM: 36, RIDDLE_ROOM: 36, SPIDER_WEB_ROOM: 13, EMPTY_ROOM: 12}
+    NEAR_BOSS_WEIGHTS = {ENEMY_ROOM: 60, RIDDLE_ROOM: 24, SPIDER_WEB_ROOM: 13, EMPTY_ROOM: 3}
+    NEAR_BOSS_RADIUS = 2
+
+    def __init__(self, weights: dict = None, regions: tuple = None) -> None:
+        """
+        Instantiate a room sampler.
+
+        :param weights: a dictionary of room types to non-negative weights. Default is None, which uses
+                        RoomSampler.WEIGHTS
+        :param regions: a tuple of (radius, weights) tuples, where radius is a number of rooms from the nearest boss.
+                        Default is None, which uses RoomSampler.NEAR_BOSS_WEIGHTS within RoomSampler.NEAR_BOSS_RADIUS
+        :precondition: every key of the weight dictionaries must be one of RoomSampler.ROOM_TYPES
+        :postcondition: instantiates a room sampler with one alias sampler per region
+        :raise ValueError: if a weight dictionary names an unknown room type or has no positive weight
+        """
+        self.weights = dict(weights if weights is not None else RoomSampler.WEIGHTS)
+        self.regions = tuple(sorted(
+            ((radius, dict(region_weights)) for radius, region_weights in regions) if regions is not None
+            else ((RoomSampler.NEAR_BOSS_RADIUS, RoomSampler.NEAR_BOSS_WEIGHTS),),
+            key=lambda region: region[0]
+        ))
+
+        self.default_sampler = RoomSampler.alias_sampler(self.weights)
+        self.region_samplers = tuple((radius, RoomSampler.alias_sampler(region_weights))
+                                     for radius, region_weights in self.regions)
+
+    @staticmethod
+    def alias_sampler(weights: dict) -> AliasSampler:
+        """
+        Return an alias sampler over the room types with weights.
+
+        :param weights: a dictionary of room types to non-negative weights
+        :precondition: weights must be a dictionary of room types to non-negative weights
+        :postcondition: returns an alias sampler whose outcomes are indices of RoomSampler.ROOM_TYPES
+        :return: an AliasSampler object
+        :raise ValueError: if weights names an unknown room type or has no positive weight
+        """
+        unknown = set(weights) - set(RoomSampler.ROOM_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown room types: {', '.join(sorted(unknown))}!")
+
+        return AliasSampler([weights.get(room_type, 0) for room_type in RoomSampler.ROOM_TYPES])
+
+    def key(self) -> tuple:
+        """
+        Return a description of the distribution that is equal for samplers that draw the same rooms.
+
+        :postcondition: returns the weights of the sampler in a canonical order
+        :return: a tuple
+        """
+        def ordered(weights):
+            return tuple(weights.get(room_type, 0) for room_type in RoomSampler.ROOM_TYPES)
+
+        return ordered(self.weights), tuple((radius, ordered(weights)) for radius, weights in self.regions)
+
+    def sample(self, rng: random.Random, boss_distance: int) -> str:
+        """
+        Return a random room type for a room boss_distance rooms away from the nearest boss.
+
+        :param rng: a random.Random object
+        :param boss_distance: a non-negative integer
+        :precondition: rng must be a random.Random object
+        :precondition: boss_distance must be a non-negative integer
+        :postcondition: returns a room type drawn from the weights of the region of the room, in constant time
+        :return: one of RoomSampler.ROOM_TYPES
+
+        >>> sampler = RoomSampler({"empty": 1}, ((1, {"enemy": 1}),))
+        >>> sampler.sample(random.Random(0), 1), sampler.sample(random.Random(0), 2)
+        ('enemy', 'empty')
+        """
+        for radius, sampler in self.region_samplers:
+            if boss_distance <= radius:
+                return RoomSampler.ROOM_TYPES[sampler.sample(rng)]
+
+        return RoomSampler.ROOM_TYPES[self.default_sampler.sample(rng)]
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the sampler.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Module containing the GameServer class, which hosts a separate game for every client connected over TCP.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import signal
+import socket
+import traceback
+from console import SocketConsole
+from game import Game, GameResult, PACERS, parse_size
+
+
+class GameServer:
+    """
+    A TCP server that plays a separate game with every client that connects to it, such as a telnet client.
+
+    Every connection is handled by its own coroutine on a single event loop. The game loop is synchronous, so each game
+    runs in a worker thread and talks to its connection through a SocketConsole, while the coroutine waits for the game
+    to end. A player who is thinking costs a blocked worker thread and a pending read, and nothing else. Reading,
+    writing, idle timeouts and backpressure all happen in coroutines on the event loop, and max_sessions bounds the
+    worker threads as well as the connections.
+    """
+
+    LINE_LIMIT = 1 << 12
+    WRITE_LIMIT = 1 << 16
+    CLOSE_TIMEOUT = 10.0
+    FULL_MESSAGE = "The server is full, please try again later.\n"
+    IDLE_MESSAGE = "\nYou have been idle for too long, goodbye!\n"
+    SHUTDOWN_MESSAGE = "\nThe server is shutting down, thanks for playing!\n"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 4000, max_sessions: int = 1000,
+                 idle_timeout: float = 600.0, pacing: str = "real-time", color: bool = True, rows: int = 10,
+                 columns: int = 10, seed: int = None) -> None:
+        """
+        Instantiate a game server that has not started listening yet.
+
+        :param host: the host name or address to listen on. Default is "127.0.0.1"
+        :param port: the port to listen on, or 0 for any free port. Default is 4000
+        :param max_sessions: the number of games that can be played at once. Default is 1000
+        :param idle_timeout: the number of seconds a player can take to answer, or a slow client can take to receive
+                             the output of the game, before the game ends. Default is 600.0
+        :param pacing: one of the keys of game.PACERS, the pacing of the story in every game. Default is "real-time"
+        :param color: a boolean representing if the games should be colored. Default is True
+        :param rows: a positive integer, the rows of every board. Default is 10
+        :param columns: a positive integer, the columns of every board. Default is 10
+        :param seed: an integer that determines the rooms of every board. Default is None, which gives every game a
+                     random board
+        :precondition: max_sessions must be a positive integer
+        :precondition: idle_timeout must be a positive number or None
+        :precondition: rows and columns must be accepted by Board
+        :postcondition: instantiates a server without any sessions
+        """
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.pacing = pacing
+        self.color = color
+        self.rows = rows
+        self.columns = columns
+        self.seed = seed
+        self.server = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_sessions, thread_name_prefix="session")
+        self.closing = False
+        self.sessions = {}
+        self.served = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.peak = 0
+
+    @staticmethod
+    def encode(text: str) -> bytes:
+        """
+        Convert text to the bytes sent to a client.
+
+        :param text: a string
+        :precondition: text must be a string
+        :postcondition: returns text encoded as UTF-8, with new lines sent as CRLF
+        :return: a bytes object
+
+        >>> GameServer.encode("Bye\\n")
+        b'Bye\\r\\n'
+        """
+        return text.replace("\n", "\r\n").encode("utf-8")
+
+    def address(self) -> tuple:
+        """
+        Return the address the server is listening on.
+
+        :precondition: the server must have been started
+        :postcondition: returns the host and port of the listening socket, with the port picked if it was 0
+        :return: a tuple of a string and an integer
+        """
+        return self.server.sockets[0].getsockname()[:2]
+
+    def stats(self) -> dict:
+        """
+        Return the counts of the sessions of the server.
+
+        :postcondition: returns the current and peak number of sessions, and the number of sessions that were served,
+                        rejected because the server was full, ended by the idle timeout or ended by an error
+        :return: a dictionary
+        """
+        return {
+            "sessions": len(self.sessions),
+            "peak": self.peak,
+            "served": self.served,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+    async def start(self) -> None:
+        """
+        Start listening for connections.
+
+        :precondition: the server must not have been started before
+        :postcondition: accepts connections until shutdown is called
+        """
+        self.server = await asyncio.start_server(self.handle, self.host, self.port, limit=GameServer.LINE_LIMIT,
+                                                 backlog=max(100, min(self.max_sessions, 4096)))
+
+    async def serve(self) -> None:
+        """
+        Start the server and accept connections until the coroutine is cancelled.
+
+        :postcondition: shuts the server down gracefully once the coroutine is cancelled
+        """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.shutdown()
+
+    def play(self, console: SocketConsole, pacer) -> GameResult:
+        """
+        Play one game on console.
+
+        :param console: the SocketConsole of a connection
+        :param pacer: a Pacer object
+        :precondition: play must be called from a worker thread, not from the event loop
+        :postcondition: plays a game on a new board until it is quit, completed or the connection ends
+        :return: a GameResult namedtuple
+        """
+        return Game.play(self.rows, self.columns, seed=self.seed, pacer=pacer, console=console)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Play a game with the client of a new connection, then close the connection.
+
+        :param reader: the asyncio.StreamReader of the connection
+        :param writer: the asyncio.StreamWriter of the connection
+        :precondition: reader and writer must belong to a connection accepted by the server
+        :postcondition: turns the client away if the server is full or shutting down
+        :postcondition: otherwise plays a game with the client in a worker thread and closes the connection after it
+        """
+        if self.closing or len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            writer.write(GameServer.encode(GameServer.FULL_MESSAGE))
+            await GameServer.close(writer)
+            return
+
+        loop = asyncio.get_running_loop()
+        writer.transport.set_write_buffer_limits(high=GameServer.WRITE_LIMIT)
+        console = SocketConsole(reader, writer, loop, self.idle_timeout, color=self.color)
+        pacer = PACERS[self.pacing]()
+
+        self.sessions[writer] = (asyncio.current_task(), pacer)
+        self.served += 1
+        self.peak = max(self.peak, len(self.sessions))
+        try:
+            await loop.run_in_executor(self.executor, self.play, console, pacer)
+            if console.timed_out:
+                self.timeouts += 1
+                if not writer.is_closing():
+                    writer.write(GameServer.encode(GameServer.IDLE_MESSAGE))
+        except Exception:
+            # a broken game must not take the rest of the server down with it
+            self.errors += 1
+            traceback.print_exc()
+        finally:
+            del self.sessions[writer]
+            await GameServer.close(writer)
+
+    async def adopt(self, sock: socket.socket) -> None:
+        """
+        Play a game with the client of a connection that was accepted somewhere else, such as by a supervisor.
+
+        :param sock: a connected socket.socket
+        :precondition: sock must be a connected stream socket that nothing else reads from or writes to
+        :postcondition: plays a game with the client exactly like a connection accepted by the server itself
+        """
+        reader, writer = await asyncio.open_connection(sock=sock, limit=GameServer.LINE_LIMIT)
+        await self.handle(reader, writer)
+
+    @staticmethod
+    async def close(writer: asyncio.StreamWriter) -> None:
+        """
+        Close a connection after sending what is left in its write buffer.
+
+        :param writer: an asyncio.StreamWriter
+        :precondition: writer must be the writer of a connection
+        :postcondition: closes the connection, aborting it if the client does not take the rest of the output within
+                        CLOSE_TIMEOUT seconds
+        """
+        writer.close()
+        try:
+            await asyncio.wait_for(writer.wait_closed(), GameServer.CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            writer.transport.abort()
+        except OSError:
+            pass
+
+    async def shutdown(self, grace: float = 5.0) -> None:
+        """
+        Stop accepting connections and end every game.
+
+        :param grace: the number of seconds the clients get to receive the end of their games before their connections
+                      are aborted. Default is 5.0
+        :precondition: grace must be a non-negative number
+        :postcondition: tells every player the server is shutting down, closes their connections and waits for every
+                        game to end
+        """
+        self.closing = True
+        if self.server is not None:
+            self.server.close()
+
+        for writer, (task, pacer) in list(self.sessions.items()):
+            pacer.interrupt()
+            if not writer.is_closing():
+                writer.write(GameServer.encode(GameServer.SHUTDOWN_MESSAGE))
+                writer.close()
+
+        tasks = [task for task, pacer in self.sessions.values()]
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=grace)
+            if pending:
+                for writer in list(self.sessions):
+                    writer.transport.abort()
+                await asyncio.wait(pending)
+
+        if self.server is not None:
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the options of a game server to parser.
+
+    :param parser: an argparse.ArgumentParser object
+    :precondition: parser must not have any of the options of a game server yet
+    :postcondition: adds the options read by server_options to parser
+    """
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on, 127.0.0.1 by default")
+    parser.add_argument("--port", type=int, default=4000, help="the port to listen on, 4000 by default")
+    parser.add_argument("--max-sessions", type=int, default=1000,
+                        help="the number of games that can be played at once, 1000 by default")
+    parser.add_argument("--idle-timeout", type=float, default=600.0,
+                        help="the number of seconds a player can take to answer before the game ends, 600 by default")
+    parser.add_argument("--size", type=parse_size, default=(10, 10), metavar="WxH",
+                        help="the number of columns and rows of every board, 10x10 by default")
+    parser.add_argument("--seed", type=int, help="the seed that determines the rooms of every board")
+    parser.add_argument("--pacing", choices=tuple(PACERS), default="real-time",
+                        help="wait for the full pauses of the story, skip them, or wait for Enter instead")
+    parser.add_argument("--no-color", action="store_true", help="leave the colors out of every game")
+
+
+def server_options(arguments: argparse.Namespace) -> dict:
+    """
+    Convert the options added by add_arguments to the keyword arguments of GameServer.
+
+    :param arguments: an argparse.Namespace object
+    :precondition: arguments must have been parsed by a parser passed to add_arguments
+    :postcondition: returns the keyword arguments of a GameServer with the parsed options
+    :return: a dictionary
+    """
+    columns, rows = arguments.size
+
+    return {"host": arguments.host, "port": arguments.port, "max_sessions": arguments.max_sessions,
+            "idle_timeout": arguments.idle_timeout, "pacing": arguments.pacing, "color": not arguments.no_color,
+            "rows": rows, "columns": columns, "seed": arguments.seed}
+
+
+def run_until_stopped(serve) -> None:
+    """
+    Run serve until the process is interrupted with Ctrl+C or asked to terminate.
+
+    :param serve: a coroutine function that serves until it is cancelled
+    :precondition: serve must clean up after itself when it is cancelled
+    :postcondition: returns once serve has been cancelled and has finished
+    """
+    async def run() -> None:
+        task = asyncio.current_task()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+        except (NotImplementedError, AttributeError):
+            # signal handlers are not available on every platform, where only Ctrl+C stops the server
+            pass
+
+        await serve()
+
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    parser = argparse.ArgumentParser(description="Reign of Fire server")
+    add_arguments(parser)
+    arguments = parser.parse_args()
+
+    server = GameServer(**server_options(arguments))
+    print(f"Serving Reign of Fire on {arguments.host}:{arguments.port}, press Ctrl+C to stop")
+    run_until_stopped(server.serve)
+    print(f"Stopped after serving {server.served} sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Module containing the Simulator class.
+
+The simulator needs numpy, which the game itself does not. Install it with pip install numpy.
+"""
+from collections import namedtuple
+from character import Character
+from combat import CharacterStats, Combat
+from generic_rooms import GenericRooms
+from riddle import Riddle
+from sampler import RoomSampler
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LevelSummary = namedtuple("LevelSummary", ("enemy_level", "fights", "win_rate", "hp_loss", "xp", "loot_rate"))
+RunSummary = namedtuple("RunSummary", ("runs", "rooms", "level", "xp", "hp", "deaths", "staff_rarity"))
+
+
+class Simulator:
+    """
+    Class containing Monte Carlo simulations of fights and whole runs, computed as array operations.
+
+    Every formula is the one used in live play: fights follow Combat, and experience, level ups, deaths, riddles and
+    spider webs follow Character, Riddle and GenericRooms. Damage and fight experience are looked up in tables built
+    by calling Combat for the few levels, rarities and damage values there are, so they can never drift apart.
+    """
+
+    NO_ITEM = 0
+    STAFF = 1
+    ARMOUR = 2
+
+    @staticmethod
+    def require_numpy() -> None:
+        """
+        Make sure numpy can be used.
+
+        :postcondition: does nothing if numpy is installed
+        :raise ImportError: if numpy is not installed
+        """
+        if np is None:
+            raise ImportError("The simulator requires numpy, install it with: pip install numpy")
+
+    @staticmethod
+    def enemy_arrays(enemies) -> dict:
+        """
+        Return the columns of a sequence of enemy records as arrays.
+
+        :param enemies: a sequence of enemy mappings
+        :precondition: enemies must be a non-empty sequence of enemy mappings
+        :postcondition: returns one array per column, holding one entry per enemy
+        :return: a dictionary of arrays with the keys "hp", "level", "item_type" and "item_rarity"
+        """
+        Simulator.require_numpy()
+        item_types = {"staff": Simulator.STAFF, "armour": Simulator.ARMOUR}
+
+        return {
+            "hp": np.array([enemy["current_hp"] for enemy in enemies], dtype=np.int64),
+            "level": np.array([enemy["level"] for enemy in enemies], dtype=np.int64),
+            "item_type": np.array([item_types.get(enemy["item"]["type"], Simulator.NO_ITEM) if enemy["item"]
+                                   else Simulator.NO_ITEM for enemy in enemies], dtype=np.int64),
+            "item_rarity": np.array([enemy["item"]["rarity"] if enemy["item"] else 0 for enemy in enemies],
+                                    dtype=np.int64)
+        }
+
+    @staticmethod
+    def draw(rng, distribution: dict, size: int):
+        """
+        Return size values drawn from a weighted distribution.
+
+        :param rng: a numpy Generator
+        :param distribution: a dictionary of values to non-negative weights
+        :param size: a non-negative integer
+        :precondition: distribution must have at least one positive weight
+        :postcondition: returns the values drawn with probabilities proportional to their weights
+        :return: an array of integers of length size
+        """
+        values = np.array(list(distribution), dtype=np.int64)
+        weights = np.array(list(distribution.values()), dtype=np.float64)
+
+        return rng.choice(values, size=size, p=weights / weights.sum())
+
+    @staticmethod
+    def lookup(function, *arrays):
+        """
+        Return function of the entries of arrays, looked up in a table that calls function once for every combination
+        of values.
+
+        :param function: a function of as many non-negative integers as there are arrays, that returns an integer
+        :param arrays: arrays of small non-negative integers, or scalars, of compatible shapes
+        :precondition: every array must hold small non-negative integers, such as levels, rarities or damage
+        :postcondition: returns function of the entries of arrays in time proportional to their size, plus the size
+                        of the table
+        :return: an array of integers with the broadcast shape of arrays
+
+        >>> Simulator.lookup(Combat.fight_xp, np.array([1, 3, 3]), 1).tolist()
+        [15, 45, 45]
+        """
+        arrays = [np.asarray(array, dtype=np.int64) for array in arrays]
+        shape = tuple(int(array.max()) + 1 for array in arrays)
+        table = np.array([function(*index) for index in np.ndindex(*shape)], dtype=np.int64).reshape(shape)
+
+        return table[tuple(arrays)]
+
+    @staticmethod
+    def resolve_fights(hp, damage, level, staff_rarity, enemy_hp, enemy_level) -> tuple:
+        """
+        Return the outcomes of many fights at once, as Combat.resolve_fight would compute them one at a time.
+
+        :param hp: an array of character hp
+        :param damage: an array of character damage
+        :param level: an array of character levels
+        :param staff_rarity: an array of character staff rarities, 0 for no staff
+        :param enemy_hp: an array of enemy hp
+        :param enemy_level: an array of enemy levels
+        :precondition: every parameter must be an array of non-negative integers, or a scalar, of compatible shapes
+        :postcondition: returns the outcome of every fight in time proportional to the number of fights
+        :return: a tuple of arrays: won, rounds, character hp and enemy hp after the fight
+        :raise ValueError: if a fight could never end
+        """
+        given = Simulator.lookup(lambda *stats: Combat.damage_given(CharacterStats(0, *stats)), damage, level,
+                                 staff_rarity)
+        taken = Simulator.lookup(Combat.damage_taken, enemy_level)
+        given, taken, hp, enemy_hp = np.broadcast_arrays(given, taken, hp, enemy_hp)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rounds_to_win = np.where(given > 0, np.ceil(enemy_hp / given), np.inf)
+            rounds_to_lose = np.where(taken > 0, np.ceil(hp / taken), np.inf)
+
+        rounds = np.where((hp <= 0) | (enemy_hp <= 0), 0, np.minimum(rounds_to_win, rounds_to_lose))
+        if np.isinf(rounds).any():
+            raise ValueError("Neither side can damage the other in some fights, they would never end!")
+
+        rounds = rounds.astype(np.int64)
+        character_hp = np.maximum(0, hp - rounds * taken).astype(np.int64)
+        enemy_hp = np.maximum(0, enemy_hp - rounds * given).astype(np.int64)
+
+        return (enemy_hp <= 0) & (character_hp > 0), rounds, character_hp, enemy_hp
+
+    @staticmethod
+    def fight_xp(enemy_level, level):
+        """
+        Return the experience earned by defeating enemies, as Combat.fight_xp would compute it one at a time.
+
+        :param enemy_level: an array of enemy levels
+        :param level: an array of character levels
+        :precondition: enemy_level and level must be arrays of positive integers of compatible shapes
+        :postcondition: returns the experience earned for every fight, ignoring the level cap
+        :return: an array of integers
+        """
+        return Simulator.lookup(Combat.fight_xp, enemy_level, level)
+
+    @staticmethod
+    def fight_table(enemies, levels: dict = None, staff_rarities: dict = None, armour_rarities: dict = None,
+                    hp: int = 100, damage: int = 20, fights: int = 100_000, seed: int = None) -> list:
+        """
+        Simulate fights against every enemy and summarize them by enemy level.
+
+        :param enemies: a sequence of enemy mappings
+        :param levels: a dictionary of character levels to weights. Default is None, which is level 1 to 3 evenly
+        :param staff_rarities: a dictionary of staff rarities to weights, 0 for no staff. Default is None, which is
+                               no staff
+        :param armour_rarities: a dictionary of armour rarities to weights, 0 for no armour. Default is None, which
+                                is no armour
+        :param hp: a positive integer, the hp of the character at the start of every fight. Default is 100
+        :param damage: a positive integer, the damage of the character. Default is 20
+        :param fights: a positive integer, the number of fights against each enemy. Default is 100000
+        :param seed: an integer, or None. Default is None, which picks a random seed
+        :precondition: enemies must be a non-empty sequence of enemy mappings
+        :postcondition: returns one summary per enemy level, in increasing order of level
+        :return: a list of LevelSummary namedtuples
+        """
+        Simulator.require_numpy()
+        rng = np.random.default_rng(seed)
+        enemy = Simulator.enemy_arrays(enemies)
+        count = len(enemy["hp"]) * fights
+
+        which = np.repeat(np.arange(len(enemy["hp"])), fights)
+        level = Simulator.draw(rng, levels or {1: 1, 2: 1, 3: 1}, count)
+        staff_rarity = Simulator.draw(rng, staff_rarities or {0: 1}, count)
+        armour_rarity = Simulator.draw(rng, armour_rarities or {0: 1}, count)
+
+        won, _, character_hp, _ = Simulator.resolve_fights(hp, damage, level, staff_rarity, enemy["hp"][which],
+                                                           enemy["level"][which])
+        xp = np.where(won & (level < Character.MAX_LEVEL), Simulator.fight_xp(enemy["level"][which], level), 0)
+
+        item_type, item_rarity = enemy["item_type"][which], enemy["item_rarity"][which]
+        loot = won & (((item_type == Simulator.STAFF) & (item_rarity > staff_rarity)) |
+                      ((item_type == Simulator.ARMOUR) & (item_rarity > armour_rarity)))
+
+        summaries = []
+        for enemy_level in np.unique(enemy["level"]):
+            mask = enemy["level"][which] == enemy_level
+            summaries.append(LevelSummary(int(enemy_level), int(mask.sum()), float(won[mask].mean()),
+                                          float((hp - character_hp[mask]).mean()), float(xp[mask].mean()),
+                                          float(loot[mask].mean())))
+
+        return summaries
+
+    @staticmethod
+    def progression(enemies, runs: int = 10_000, rooms: int = 100, room_weights: dict = None,
+                    riddle_success: float = 0.5, riddle_reward: str = "refill", damage: int = 20,
+                    seed: int = None) -> RunSummary:
+        """
+        Simulate whole runs in parallel, room after room, from a new level 1 character.
+
+        Every room is drawn from room_weights. The character fights every enemy they meet, answers riddles correctly
+        with probability riddle_success, and clears every spider web. Level ups and deaths happen after each room as
+        they do in Game.play, and items are kept through deaths.
+
+        :param enemies: a sequence of enemy mappings
+        :param runs: a positive integer, the number of runs. Default is 10000
+        :param rooms: a positive integer, the number of rooms visited in each run. Default is 100
+        :param room_weights: a dictionary of room types to weights. Default is None, which uses RoomSampler.WEIGHTS
+        :param riddle_success: a float between 0 and 1. Default is 0.5
+        :param riddle_reward: "refill" to refill hp after a correct answer, or "ability" to try for an ability instead.
+                              Default is "refill"
+        :param damage: a positive integer, the damage of the character. Default is 20
+        :param seed: an integer, or None. Default is None, which picks a random seed
+        :precondition: enemies must be a non-empty sequence of enemy mappings
+        :postcondition: returns the mean level, xp, hp, deaths and staff rarity of the runs after every room
+        :return: a RunSummary namedtuple whose curves are arrays with one entry per room
+        """
+        Simulator.require_numpy()
+        rng = np.random.default_rng(seed)
+        enemy = Simulator.enemy_arrays(enemies)
+        weights = room_weights or RoomSampler.WEIGHTS
+        room_codes = {room_type: code for code, room_type in enumerate(RoomSampler.ROOM_TYPES)}
+
+        max_hp = 100
+        hp = np.full(runs, max_hp, dtype=np.int64)
+        level = np.ones(runs, dtype=np.int64)
+        xp = np.zeros(runs, dtype=np.int64)
+        deaths = np.zeros(runs, dtype=np.int64)
+        staff_rarity = np.zeros(runs, dtype=np.int64)
+        curves = {name: np.zeros(rooms) for name in ("level", "xp", "hp", "deaths", "staff_rarity")}
+
+        room = Simulator.draw(rng, {room_codes[room_type]: weight for room_type, weight in weights.items()},
+                              (rooms, runs))
+        which = rng.integers(len(enemy["hp"]), size=(rooms, runs))
+        answered = rng.random((rooms, runs)) < riddle_success
+
+        for step in range(rooms):
+            below_cap = level < Character.MAX_LEVEL
+
+            fighting = room[step] == room_codes[RoomSampler.ENEMY_ROOM]
+            enemy_level = enemy["level"][which[step]]
+            won, _, fought_hp, _ = Simulator.resolve_fights(hp, damage, level, staff_rarity, enemy["hp"][which[step]],
+                                                            enemy_level)
+            won &= fighting
+            hp = np.where(fighting, fought_hp, hp)
+            xp += np.where(won & below_cap, Simulator.fight_xp(enemy_level, level), 0)
+            item_rarity = enemy["item_rarity"][which[step]]
+            upgrade = won & (enemy["item_type"][which[step]] == Simulator.STAFF) & (item_rarity > staff_rarity)
+            staff_rarity = np.where(upgrade, item_rarity, staff_rarity)
+
+            riddle = room[step] == room_codes[RoomSampler.RIDDLE_ROOM]
+            correct = riddle & answered[step]
+            xp += np.where(correct & below_cap, Riddle.SUCCESS_XP, 0)
+            if riddle_reward == "refill":
+                hp = np.where(correct, max_hp, hp)
+            wrong = riddle & ~answered[step]
+            hp = np.where(wrong, np.rint(hp - hp * Riddle.FAILURE_HP_LOSS).astype(np.int64), hp)
+
+            webbed = room[step] == room_codes[RoomSampler.SPIDER_WEB_ROOM]
+            xp += np.where(webbed & below_cap, GenericRooms.SPIDER_WEB_XP, 0)
+
+            leveled = (xp >= Character.LEVEL_UP_XP) & (level < Character.MAX_LEVEL)
+            level = np.where(leveled, level + 1, level)
+            xp = np.where(leveled, 0, xp)
+
+            died = hp <= 0
+            deaths += died
+            level = np.where(died, 1, level)
+            xp = np.where(died, 0, xp)
+            hp = np.where(died, max_hp, hp)
+
+            for name, values in (("level", level), ("xp", xp), ("hp", hp), ("deaths", deaths),
+                                 ("staff_rarity", staff_rarity)):
+                curves[name][step] = values.mean()
+
+        return RunSummary(runs, rooms, curves["level"], curves["xp"], curves["hp"], curves["deaths"],
+                          curves["staff_rarity"])
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the simulator.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Module containing the Supervisor and Worker classes, which spread the sessions of a game server over many processes.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import signal
+import socket
+from multiprocessing import reduction
+from server import GameServer, add_arguments, run_until_stopped, server_options
+
+
+class Worker:
+    """
+    A worker process that hosts a share of the sessions of a supervisor.
+
+    The supervisor counts the connections it hands to the worker, and the worker counts the sessions it has finished
+    in memory shared with the supervisor, so the load of the worker is always known without asking it.
+    """
+
+    def __init__(self, index: int, context, options: dict) -> None:
+        """
+        Start a worker process.
+
+        :param index: a non-negative integer identifying the worker within its supervisor
+        :param context: the multiprocessing context the worker is started in
+        :param options: a dictionary of keyword arguments for the GameServer of the worker
+        :precondition: options must be picklable and accepted by GameServer
+        :postcondition: starts a worker process that waits for connections
+        """
+        self.index = index
+        self.finished = context.Value("q", 0)
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=Supervisor.work, args=(child_connection, self.finished, options),
+                                       name=f"worker-{index}", daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.assigned = 0
+
+    def load(self) -> int:
+        """
+        Return the number of sessions the worker is hosting.
+
+        :postcondition: returns the connections handed to the worker that have not finished yet
+        :return: a non-negative integer
+        """
+        return self.assigned - self.finished.value
+
+    def assign(self, sock: socket.socket) -> None:
+        """
+        Hand a connection over to the worker.
+
+        :param sock: a connected socket.socket
+        :precondition: sock must be a connected stream socket
+        :postcondition: sends a duplicate of sock to the worker process and counts it in the load of the worker
+        :raise OSError: if the worker process cannot receive it
+        """
+        reduction.send_handle(self.connection, sock.fileno(), self.process.pid)
+        self.assigned += 1
+
+    def stop(self) -> None:
+        """
+        Ask the worker to shut down gracefully.
+
+        :postcondition: closes the connection to the worker, which makes it end its sessions and exit
+        """
+        self.connection.close()
+
+
+class Supervisor:
+    """
+    A server that accepts connections in one process and hands each of them to the least loaded of several workers.
+
+    A Python process can only run game logic on one core at a time, so every worker process runs its own GameServer,
+    and the supervisor passes the sockets it accepts to them. Workers that crash are restarted; the sessions they were
+    hosting end with them.
+    """
+
+    MONITOR_INTERVAL = 0.5
+
+    def __init__(self, workers: int = None, host: str = "127.0.0.1", port: int = 4000, **options) -> None:
+        """
+        Instantiate a supervisor that has not started any workers yet.
+
+        :param workers: the number of worker processes. Default is None, which starts one for every core
+        :param host: the host name or address to listen on. Default is "127.0.0.1"
+        :param port: the port to listen on, or 0 for any free port. Default is 4000
+        :param options: keyword arguments for the GameServer of every worker, whose max_sessions is per worker
+        :precondition: workers must be a positive integer or None
+        :precondition: options must be accepted by GameServer
+        :postcondition: instantiates a supervisor without workers
+        """
+        self.size = workers or os.cpu_count() or 1
+        self.host = host
+        self.port = port
+        self.options = options
+        self.context = multiprocessing.get_context("spawn")
+        self.listener = None
+        self.workers = []
+        self.restarts = 0
+
+    @staticmethod
+    def work(connection, finished, options: dict) -> None:
+        """
+        Run a worker process.
+
+        :param connection: the multiprocessing connection to the supervisor
+        :param finished: a shared multiprocessing value counting the sessions the worker has finished
+        :param options: a dictionary of keyword arguments for the GameServer of the worker
+        :precondition: work must be the target of a worker process
+        :postcondition: plays a game on every connection the supervisor hands over, until the supervisor goes away
+        """
+        # Ctrl+C reaches every process of the group, and the supervisor decides how the workers stop
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        asyncio.run(Supervisor.host_sessions(connection, finished, options))
+
+    @staticmethod
+    async def host_sessions(connection, finished, options: dict) -> None:
+        """
+        Play a game on every connection received from the supervisor.
+
+        :param connection: the multiprocessing connection to the supervisor
+        :param finished: a shared multiprocessing value counting the sessions the worker has finished
+        :param options: a dictionary of keyword arguments for a GameServer
+        :precondition: connection must be the end of the pipe that the supervisor sends sockets on
+        :postcondition: shuts the GameServer down gracefully once the supervisor closes the connection
+        """
+        server = GameServer(**options)
+        loop = asyncio.get_running_loop()
+        receiver = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="receiver")
+        sessions = set()
+
+        async def adopt(sock: socket.socket) -> None:
+            try:
+                await server.adopt(sock)
+            finally:
+                with finished.get_lock():
+                    finished.value += 1
+
+        while True:
+            try:
+                handle = await loop.run_in_executor(receiver, reduction.recv_handle, connection)
+            except (EOFError, OSError):
+                break
+
+            task = loop.create_task(adopt(socket.socket(fileno=handle)))
+            sessions.add(task)
+            task.add_done_callback(sessions.discard)
+
+        await server.shutdown()
+        await asyncio.gather(*sessions)
+        receiver.shutdown(wait=False)
+
+    def address(self) -> tuple:
+        """
+        Return the address the supervisor is listening on.
+
+        :precondition: the supervisor must have been started
+        :postcondition: returns the host and port of the listening socket, with the port picked if it was 0
+        :return: a tuple of a string and an integer
+        """
+        return self.listener.getsockname()[:2]
+
+    def stats(self) -> list:
+        """
+        Return the session counts of every worker.
+
+        :postcondition: returns the process id, current sessions and total sessions handed over of every worker
+        :return: a list of dictionaries, one for each worker in order
+        """
+        return [{"pid": worker.process.pid, "sessions": worker.load(), "served": worker.assigned}
+                for worker in self.workers]
+
+    def start(self) -> None:
+        """
+        Start listening and start the workers.
+
+        :precondition: the supervisor must not have been started before
+        :postcondition: accepts connections into the backlog of the listening socket, and starts every worker
+        """
+        self.listener = socket.create_server((self.host, self.port), backlog=4096)
+        self.listener.setblocking(False)
+        self.workers = [Worker(index, self.context, self.options) for index in range(self.size)]
+
+    def restart(self, worker: Worker) -> Worker:
+        """
+        Replace a worker that has stopped with a new one.
+
+        :param worker: a Worker object of the supervisor
+        :precondition: worker must belong to the supervisor
+        :postcondition: starts a new worker in the place of worker and counts the restart
+        :return: the new Worker object
+        """
+        worker.stop()
+        worker.process.join(0)
+        replacement = Worker(worker.index, self.context, self.options)
+        self.workers[worker.index] = replacement
+        self.restarts += 1
+
+        return replacement
+
+    def monitor(self) -> None:
+        """
+        Restart every worker whose process has exited.
+
+        :postcondition: every worker has a running process
+        """
+        for worker in list(self.workers):
+            if not worker.process.is_alive():
+                self.restart(worker)
+
+    def dispatch(self, sock: socket.socket) -> None:
+        """
+        Hand a connection to the worker with the fewest sessions.
+
+        :param sock: a connected socket.socket
+        :precondition: sock must be a connection accepted by the supervisor
+        :postcondition: passes sock to the least loaded worker that can receive it, restarting workers that cannot,
+                        and closes the copy of sock in the supervisor
+        """
+        try:
+            for _ in range(len(self.workers)):
+                worker = min(self.workers, key=Worker.load)
+                try:
+                    worker.assign(sock)
+                    return
+                except OSError:
+                    self.restart(worker)
+        finally:
+            sock.close()
+
+    async def serve(self) -> None:
+        """
+        Start the supervisor and hand out connections until the coroutine is cancelled.
+
+        :postcondition: shuts every worker down gracefully once the coroutine is cancelled
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        monitor = loop.create_task(self.watch())
+        try:
+            while True:
+                sock, address = await loop.sock_accept(self.listener)
+                self.dispatch(sock)
+        finally:
+            monitor.cancel()
+            await self.shutdown()
+
+    async def watch(self) -> None:
+        """
+        Check on the workers every MONITOR_INTERVAL seconds.
+
+        :postcondition: restarts crashed workers until the coroutine is cancelled
+        """
+        while True:
+            await asyncio.sleep(Supervisor.MONITOR_INTERVAL)
+            self.monitor()
+
+    async def shutdown(self, grace: float = 10.0) -> None:
+        """
+        Stop accepting connections and shut every worker down.
+
+        :param grace: the number of seconds the workers get to end their sessions before they are terminated.
+                      Default is 10.0
+        :precondition: grace must be a non-negative number
+        :postcondition: closes the listening socket and waits for every worker process to exit
+        """
+        if self.listener is not None:
+            self.listener.close()
+
+        for worker in self.workers:
+            worker.stop()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + grace
+        for worker in self.workers:
+            await loop.run_in_executor(None, worker.process.join, max(0.0, deadline - loop.time()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                await loop.run_in_executor(None, worker.process.join)
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    parser = argparse.ArgumentParser(description="Reign of Fire server with a process for every core")
+    add_arguments(parser)
+    parser.add_argument("--workers", type=int, help="the number of worker processes, one for every core by default")
+    arguments = parser.parse_args()
+
+    supervisor = Supervisor(arguments.workers, **server_options(arguments))
+    print(f"Serving Reign of Fire on {arguments.host}:{arguments.port} with {supervisor.size} workers, "
+          f"press Ctrl+C to stop")
+    run_until_stopped(supervisor.serve)
+
+    for index, worker in enumerate(supervisor.stats()):
+        print(f"Worker {index} served {worker['served']} sessions")
+    print(f"Workers restarted: {supervisor.restarts}")
+
+
+if __name__ == "__main__":
+    main()
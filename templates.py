@@ -0,0 +1,214 @@
+"""
+Module containing the BoardTemplates class.
+"""
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from content import ContentRegistry
+
+
+class BoardTemplates:
+    """
+    An on-disk cache of seeded board templates.
+
+    A template is the compact layout of a board: the raw contents of its starting chunk, which every new board
+    generates before the first move. Templates are keyed by the seed, the board size and boss placement, the room
+    distribution, and a hash of the content packs, so editing a json file never serves a stale board.
+
+    Only the most recently used templates are kept in memory, and only the most recently written files are kept on
+    disk, so a process that plays millions of seeds does not grow without end.
+    """
+
+    FORMAT = 2
+    CAPACITY = 256
+    MAX_FILES = 1024
+    DIRECTORY = os.path.join(ContentRegistry.CACHE_ROOT, "templates")
+
+    def __init__(self, directory: str = None, capacity: int = CAPACITY, max_files: int = MAX_FILES) -> None:
+        """
+        Instantiate a template cache that stores its files in directory.
+
+        :param directory: a path as a string, or None. Default is None, which only keeps templates in memory
+        :param capacity: a positive integer, the number of templates kept in memory. Default is CAPACITY
+        :param max_files: a positive integer, the number of template files kept in directory. Default is MAX_FILES
+        :precondition: directory must be a string or None
+        :precondition: capacity and max_files must be positive non-zero integers
+        :postcondition: instantiates an empty template cache
+        """
+        self.directory = directory
+        self.capacity = capacity
+        self.max_files = max_files
+        self.templates = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def content_hash() -> str:
+        """
+        Return a hash of the content packs that generic rooms are made from.
+
+        :postcondition: combines the fingerprints of the content packs of the shared registry
+        :return: a hexadecimal sha1 digest as a string
+        """
+        registry = ContentRegistry.shared()
+        fingerprints = ":".join(registry.fingerprint(name) for name in ContentRegistry.PACKS)
+
+        return hashlib.sha1(fingerprints.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def key(seed: int, columns: int, rows: int, special_rooms: dict, content_hash: str,
+            distribution: tuple = ()) -> str:
+        """
+        Return the key of the template of a board.
+
+        :param seed: an integer
+        :param columns: a positive integer
+        :param rows: a positive integer
+        :param special_rooms: a dictionary of room coordinates to room kinds
+        :param content_hash: a string returned by content_hash
+        :param distribution: a tuple describing how generic rooms are drawn. Default is an empty tuple
+        :precondition: the parameters must describe the board the template is for
+        :postcondition: returns the same key for boards that generate the same layout
+        :return: a hexadecimal sha1 digest as a string
+
+        >>> key = BoardTemplates.key(1, 10, 10, {(1, 1): 1}, "abc")
+        >>> key == BoardTemplates.key(1, 10, 10, {(1, 1): 1}, "abc"), key == BoardTemplates.key(2, 10, 10, {}, "abc")
+        (True, False)
+        """
+        layout = (BoardTemplates.FORMAT, sys.byteorder, seed, columns, rows, sorted(special_rooms.items()),
+                  content_hash, distribution)
+
+        return hashlib.sha1(repr(layout).encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        """
+        Return the path of the file holding the template with key.
+
+        :param key: a string returned by BoardTemplates.key
+        :precondition: self.directory must not be None
+        :postcondition: returns the path of the template file inside self.directory
+        :return: a path as a string
+        """
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def load(self, key: str):
+        """
+        Return the template with key, from memory or from disk.
+
+        Missing, unreadable or corrupt template files are treated as a cache miss.
+
+        :param key: a string returned by BoardTemplates.key
+        :precondition: key must be a string
+        :postcondition: returns the template stored under key, remembering it for later calls
+        :return: a template dictionary, or None if no usable template is stored under key
+        """
+        with self.lock:
+            template = self.templates.get(key)
+            if template is not None:
+                self.templates.move_to_end(key)
+        if template is not None or self.directory is None:
+            return template
+
+        try:
+            with open(self.path(key), "rb") as file_object:
+                template = marshal.loads(file_object.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if type(template) is not dict or template.get("format") != BoardTemplates.FORMAT:
+            return None
+
+        self.remember(key, template)
+        return template
+
+    def remember(self, key: str, template: dict) -> None:
+        """
+        Keep template in memory, forgetting the least recently used template if the cache is full.
+
+        :param key: a string returned by BoardTemplates.key
+        :param template: a template dictionary
+        :precondition: template must be a template dictionary
+        :postcondition: stores template under key in memory, keeping at most capacity templates
+
+        >>> templates = BoardTemplates(capacity=2)
+        >>> for key in ("a", "b", "c"):
+        ...     templates.remember(key, {})
+        >>> list(templates.templates)
+        ['b', 'c']
+        """
+        with self.lock:
+            self.templates[key] = template
+            self.templates.move_to_end(key)
+            while len(self.templates) > self.capacity:
+                self.templates.popitem(last=False)
+
+    def store(self, key: str, template: dict) -> None:
+        """
+        Store template under key, in memory and on disk.
+
+        The file is written to a temporary file of its own next to its final path and then renamed, so a reader never
+        sees half a template, even when several threads store the same template at once. Failing to write the file
+        only loses the cache entry on disk.
+
+        :param key: a string returned by BoardTemplates.key
+        :param template: a template dictionary
+        :precondition: template must only hold values that marshal can serialize
+        :postcondition: stores template under key, removing the oldest files if directory holds more than max_files
+        """
+        self.remember(key, template)
+        if self.directory is None:
+            return
+
+        temporary_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{key}.", dir=self.directory)
+            with open(descriptor, "wb") as file_object:
+                marshal.dump(template, file_object)
+            os.replace(temporary_path, self.path(key))
+        except OSError:
+            if temporary_path is not None:
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+            return
+
+        self.prune()
+
+    def prune(self) -> None:
+        """
+        Remove the oldest template files until directory holds at most max_files of them.
+
+        :precondition: self.directory must not be None
+        :postcondition: removes the least recently written template files beyond max_files, ignoring files that
+                        another process removes first
+        """
+        try:
+            files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".bin")]
+        except OSError:
+            return
+        if len(files) <= self.max_files:
+            return
+
+        files.sort(key=lambda entry: entry.stat().st_mtime if entry.is_file() else 0)
+        for entry in files[:len(files) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def main() -> None:
+    """
+    Drive the program.
+    """
+    print("You are attempting to execute the templates.py module.")
+    print("Executing this module does not do anything.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from board import Board
+
+
+class TestBoardGeometry(TestCase):
+    def test_rectangular_board_rooms(self):
+        board = Board(5, 8, (2, 2), (6, 4), seed=0)
+
+        self.assertIn((8, 5), board.get_board())
+        self.assertNotIn((5, 8), board.get_board())
+        self.assertEqual({"north": (8, 6), "east": None, "south": (8, 4), "west": (7, 5)},
+                         board.get_board()[(8, 5)]["directions"])
+
+    def test_default_final_boss_above_top_right_room(self):
+        board = Board(5, 8, (2, 2), (6, 4), seed=0)
+
+        self.assertEqual((8, 6), board.final_boss_coords)
+        self.assertEqual(board.final_boss.battle, board.get_board()[(8, 6)]["action"])
+
+    def test_final_boss_below_board(self):
+        board = Board(5, 8, (2, 2), (6, 4), final_boss_coords=(3, 0), seed=0)
+
+        self.assertEqual((3, 0), board.get_board()[(3, 1)]["directions"]["south"])
+        self.assertIs(Board.FINAL_BOSS_CELL, board.map_rows((1, 1))[-1][2])
+
+    def test_final_boss_inside_board(self):
+        board = Board(5, 8, (2, 2), (6, 4), final_boss_coords=(5, 3), seed=0)
+
+        self.assertEqual(40, len(board.get_board()))
+        self.assertEqual(board.final_boss.battle, board.get_board()[(5, 3)]["action"])
+
+    def test_boss_defeated_reads_final_boss_room(self):
+        board = Board(20, 30, (4, 4), (7, 7), seed=0)
+
+        self.assertFalse(board.boss_defeated())
+        board.get_board()[(30, 21)]["solved"] = True
+        self.assertTrue(board.boss_defeated())
+
+    def test_boss_outside_board(self):
+        with self.assertRaises(ValueError):
+            Board(5, 8, (9, 2), (6, 4))
+
+    def test_final_boss_too_far_from_board(self):
+        with self.assertRaises(ValueError):
+            Board(5, 8, (2, 2), (6, 4), final_boss_coords=(3, 7))
+
+    def test_bosses_in_same_room(self):
+        with self.assertRaises(ValueError):
+            Board(5, 8, (2, 2), (2, 2))
+
+    def test_default_bosses_fit_every_small_board(self):
+        for rows in range(1, 7):
+            for columns in range(1, 7):
+                if rows * columns < 3:
+                    continue
+                with self.subTest(rows=rows, columns=columns):
+                    board = Board(rows, columns, *Board.default_boss_coords(rows, columns), seed=0)
+
+                    self.assertNotIn((1, 1), (board.boss_1_coords, board.boss_2_coords))
+
+    def test_default_bosses_are_unchanged_on_large_boards(self):
+        self.assertEqual((Board.scaled_coords(25, 40, 0.4), Board.scaled_coords(25, 40, 0.7)),
+                         Board.default_boss_coords(25, 40))
+
+    def test_board_too_small_for_the_bosses(self):
+        with self.assertRaises(ValueError):
+            Board.default_boss_coords(1, 2)
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from board import Board
+from character import Character
+
+
+class TestBoardView(TestCase):
+    def setUp(self) -> None:
+        self.board = Board(10, 10, (4, 4), (7, 7))
+
+    def test_start_room(self):
+        start = self.board.get_board()[(1, 1)]
+
+        self.assertTrue(start["solved"])
+        self.assertIsNone(start["action"])
+        self.assertEqual({"north": (1, 2), "east": (2, 1), "south": None, "west": None}, start["directions"])
+
+    def test_corner_room_leads_to_final_boss(self):
+        corner = self.board.get_board()[(10, 10)]
+
+        self.assertEqual({"north": (10, 11), "east": None, "south": (10, 9), "west": (9, 10)}, corner["directions"])
+
+    def test_final_boss_room(self):
+        final_boss = self.board.get_board()[(10, 11)]
+
+        self.assertFalse(final_boss["solved"])
+        self.assertEqual({"north": None, "east": None, "south": (10, 10), "west": None}, final_boss["directions"])
+
+    def test_missing_room(self):
+        self.assertNotIn((11, 11), self.board.get_board())
+        with self.assertRaises(KeyError):
+            self.board.get_board()[(0, 1)]
+
+    def test_room_count(self):
+        self.assertEqual(101, len(self.board.get_board()))
+
+    def test_solved_assignment(self):
+        self.board.get_board()[(2, 1)]["solved"] = True
+
+        self.assertTrue(self.board.get_board()[(2, 1)]["solved"])
+
+    def test_character_moves_through_view(self):
+        character = Character("Test Character")
+
+        self.assertFalse(self.board.is_valid_move("west", character))
+        self.assertTrue(self.board.is_valid_move("east", character))
+
+        character.move("east", self.board)
+
+        self.assertEqual((2, 1), character.get_position())
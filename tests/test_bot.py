@@ -0,0 +1,111 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from bot import STRATEGIES, Bot, BossRush, GreedyExplorer, Menu, Strategy
+
+
+class Stubborn(Strategy):
+    name = "stubborn"
+
+    def move(self, menu):
+        return "x"
+
+
+class TestBot(TestCase):
+    def test_parse_menu_reads_the_last_menu(self):
+        text = "Command        Option\n1              north\n\nYou see an enemy\n\n" \
+               "Command        Choice\n1              Fight\n2              Flee\n\nPlease choose"
+
+        menu = Bot.parse_menu(text)
+
+        self.assertEqual("Choice", menu.title)
+        self.assertEqual([("1", "Fight"), ("2", "Flee")], menu.options)
+        self.assertIsNone(Bot.parse_menu("Please enter a name for your character.."))
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("time.sleep", side_effect=AssertionError("the bot slept"))
+    def test_every_strategy_plays_without_errors_or_output(self, _, stdout):
+        for name, strategy in STRATEGIES.items():
+            for seed in range(3):
+                with self.subTest(strategy=name, seed=seed):
+                    result = Bot(strategy(), max_turns=500).play(seed)
+
+                    self.assertEqual(name, result.strategy)
+                    self.assertIsNone(result.dead_end)
+                    self.assertTrue(result.turns == 500 or result.achieved_goal)
+                    self.assertEqual("Bot", result.stats["name"])
+
+        self.assertEqual("", stdout.getvalue())
+
+    def test_stronger_enemies_are_fled_from(self):
+        menu = Menu("Choice", [("1", "Fight"), ("2", "Flee"), ("3", "Auto-resolve")], GreedyExplorer.STRONGER)
+        strategy = GreedyExplorer()
+        strategy.reset(0)
+
+        self.assertEqual("2", strategy.encounter(menu))
+        self.assertEqual(GreedyExplorer.WANDER_STEPS, strategy.wander)
+        self.assertEqual("3", strategy.encounter(menu._replace(text="")))
+
+    def test_boss_rush_trains_after_fleeing_a_boss(self):
+        strategy = BossRush()
+        strategy.reset(0)
+        destinations = Menu("Destination", [("1", "Nearest unsolved room"), ("2", "Royal Mage Angelozzi")], "")
+
+        self.assertEqual("2", strategy.destination(destinations))
+        strategy.encounter(Menu("Choice", [("1", "Fight"), ("2", "Flee")], BossRush.STRONGER))
+        self.assertEqual("1", strategy.destination(destinations))
+
+    def test_bosses_are_fought_at_the_highest_level_with_all_hp(self):
+        boss = Menu("Choice", [("1", "Fight"), ("2", "Flee")], GreedyExplorer.STRONGER)
+        strategy = GreedyExplorer()
+        strategy.reset(0)
+
+        self.assertEqual("2", strategy.encounter(boss))
+        strategy.observe("Congrats you leveled up\n[Bot | hp: 90/100]\nCongrats you leveled up")
+        self.assertEqual("2", strategy.encounter(boss))
+        strategy.observe("[Bot | hp: +10]")
+        self.assertEqual("1", strategy.encounter(boss))
+        strategy.observe("Rip, you died")
+        self.assertEqual((1, 100), (strategy.level, strategy.hp))
+
+    def test_boss_rush_targets_the_next_boss_once_one_is_defeated(self):
+        strategy = BossRush()
+        strategy.reset(0)
+        destinations = Menu("Destination", [("1", "Nearest unsolved room"), ("2", "Royal Mage Angelozzi"),
+                                            ("3", "Lord-Commander Ymir")], "You have already completed your duties here")
+
+        strategy.move(Menu("Option", [("t", "travel")], "You have already completed your duties here"))
+        self.assertEqual("2", strategy.destination(destinations))
+        strategy.observe("Congratulations! You have defeated the Royal Battle-Mage Angelozzi")
+        self.assertEqual("3", strategy.destination(destinations))
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_boss_rush_wins_seeded_games(self, _):
+        bot = Bot(BossRush(), max_turns=3000)
+
+        results = [bot.play(seed) for seed in (1, 7, 8)]
+
+        self.assertTrue(all(result.achieved_goal for result in results))
+        self.assertTrue(all(result.turns < bot.max_turns and result.dead_end is None for result in results))
+
+    def test_rejected_answers_are_a_dead_end(self):
+        bot = Bot(Stubborn())
+
+        result = bot.play(0)
+
+        self.assertIn("stuck after", result.dead_end)
+        self.assertFalse(result.achieved_goal)
+
+    def test_repeating_answers_are_a_dead_end(self):
+        self.assertEqual(3, Bot.loop_period(["t", "1", "3"] * Bot.LOOP_WINDOW))
+        self.assertEqual(0, Bot.loop_period([str(turn % 13) for turn in range(Bot.LOOP_WINDOW)]))
+
+    def test_the_replay_of_a_game_ends_in_the_same_state(self):
+        bot = Bot(GreedyExplorer(), max_turns=300)
+        result = bot.play(4, rows=8, columns=12)
+
+        replay = bot.replay()
+
+        self.assertEqual((4, 8, 12), (replay.seed, replay.rows, replay.columns))
+        self.assertEqual(result.stats, replay.run().stats)
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from unittest import TestCase
+
+from console import Console, MemoryConsole, ScriptedConsole, SocketConsole
+from game import Game
+from helpers import Helpers
+from pacing import HeadlessPacer
+
+
+class TestConsole(TestCase):
+    def test_game_reads_and_writes_its_own_console(self):
+        console = MemoryConsole(["Hero", "s", "q"])
+
+        result = Game.play(seed=1, pacer=HeadlessPacer(), console=console)
+
+        self.assertEqual("Hero", result.character.get_name())
+        self.assertFalse(result.achieved_goal)
+        self.assertIn("Thanks for playing", console.output())
+        self.assertIn("Hero", console.output())
+
+    def test_running_out_of_input_ends_the_game(self):
+        console = MemoryConsole(["Hero", "1", "1"])
+
+        result = Game.play(seed=1, pacer=HeadlessPacer(), console=console)
+
+        self.assertFalse(result.achieved_goal)
+        self.assertTrue(console.output().endswith("Thanks for playing, we hope you play again sometime :)\033[0m\n"))
+
+    def test_silent_console_skips_output(self):
+        console = MemoryConsole(["Hero", "s", "q"], record=False)
+
+        result = Game.play(seed=1, pacer=HeadlessPacer(), console=console)
+
+        self.assertEqual("Hero", result.character.get_name())
+        self.assertEqual("", console.output())
+
+    def test_sessions_in_threads_stay_apart(self):
+        consoles = [MemoryConsole([f"Player{number}", "s", "q"]) for number in range(8)]
+        threads = [threading.Thread(target=Game.play, kwargs={"seed": 2, "pacer": HeadlessPacer(), "console": console})
+                   for console in consoles]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for number, console in enumerate(consoles):
+            names = {f"Player{other}" for other in range(8) if f"Player{other}" in console.output()}
+            self.assertEqual({f"Player{number}"}, names)
+
+    def test_scripted_console_sees_the_prompt(self):
+        prompts = []
+        console = ScriptedConsole(lambda prompt: prompts.append(prompt) or "Scripted")
+
+        with Console.use(console):
+            self.assertEqual("Scripted", Helpers.get_character_name())
+
+        self.assertIn("Please enter a name for your character..", prompts[0])
+
+    def test_consoles_must_write_and_read(self):
+        class WriteOnly(Console):
+            def write(self, text):
+                pass
+
+        with self.assertRaises(TypeError):
+            WriteOnly()
+
+    def test_socket_console_round_trip(self):
+        answers = []
+
+        def session(console):
+            console.write("Name?\n")
+            answers.append(console.read())
+            console.write("Bye\n")
+            console.flush()
+
+        async def handle(reader, writer):
+            console = SocketConsole(reader, writer, asyncio.get_running_loop(), timeout=5)
+            await asyncio.to_thread(session, console)
+            await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            prompt = await reader.readline()
+            writer.write(b"Hero\r\n")
+            farewell = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return prompt, farewell
+
+        prompt, farewell = asyncio.run(run())
+
+        self.assertEqual((b"Name?\r\n", b"Bye\r\n"), (prompt, farewell))
+        self.assertEqual(["Hero"], answers)
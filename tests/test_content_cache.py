@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from content import ContentRegistry
+
+
+class TestContentCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache_directory = os.path.join(self.directory.name, "cache")
+        self.write_riddles(["River"])
+
+    def write_riddles(self, answers):
+        path = os.path.join(self.directory.name, "riddles.json")
+        with open(path, "w") as file_object:
+            json.dump([{"question": "?", "options": [answer], "answer": answer, "ability": "Dark Aether"}
+                       for answer in answers], file_object)
+        return path
+
+    def load(self):
+        registry = ContentRegistry(self.directory.name, self.cache_directory)
+        registry.pack("riddles")
+        return registry
+
+    def test_first_load_compiles_pack(self):
+        self.assertEqual("json", self.load().sources["riddles"])
+        self.assertTrue(os.path.exists(os.path.join(self.cache_directory, "riddles.marshal")))
+
+    def test_second_load_reads_compiled_pack(self):
+        self.load()
+        registry = self.load()
+
+        self.assertEqual("compiled", registry.sources["riddles"])
+        self.assertEqual("River", registry.riddle(0)["answer"])
+
+    def test_stale_compiled_pack_is_rebuilt(self):
+        self.load()
+        path = self.write_riddles(["Lake", "Eye"])
+        os.utime(path, ns=(1, 1))
+
+        registry = self.load()
+        self.assertEqual("json", registry.sources["riddles"])
+        self.assertEqual(["Lake", "Eye"], [riddle["answer"] for riddle in registry.pack("riddles")])
+        self.assertEqual("compiled", self.load().sources["riddles"])
+
+    def test_corrupt_compiled_pack_falls_back_to_json(self):
+        self.load()
+        with open(os.path.join(self.cache_directory, "riddles.marshal"), "wb") as file_object:
+            file_object.write(b"\x00garbage")
+
+        registry = self.load()
+        self.assertEqual("json", registry.sources["riddles"])
+        self.assertEqual("River", registry.riddle(0)["answer"])
+
+    def test_no_cache_directory_never_compiles(self):
+        registry = ContentRegistry(self.directory.name)
+        registry.pack("riddles")
+
+        self.assertEqual("json", registry.sources["riddles"])
+        self.assertFalse(os.path.exists(self.cache_directory))
+
+    def test_slices_are_read_only(self):
+        (riddle,) = self.load().pack("riddles")[:5]
+
+        with self.assertRaises(TypeError):
+            riddle["answer"] = "Lake"
+
+    def test_writable_creates_missing_cache_directory(self):
+        self.assertEqual(self.cache_directory, ContentRegistry.writable(self.cache_directory))
+        self.assertTrue(os.path.isdir(self.cache_directory))
+
+    def test_cache_directory_that_cannot_be_created_is_not_writable(self):
+        self.assertIsNone(ContentRegistry.writable(os.path.join(self.directory.name, "riddles.json", "cache")))
+
+    def test_default_cache_directory_is_outside_the_package(self):
+        package = os.path.dirname(os.path.abspath(ContentRegistry.DIRECTORY))
+
+        self.assertFalse(ContentRegistry.CACHE_DIRECTORY.startswith(package + os.sep))
+        self.assertTrue(ContentRegistry.CACHE_DIRECTORY.startswith(ContentRegistry.CACHE_ROOT))
@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from content import ContentRegistry
+from enemies import Enemy
+
+
+class TestContentRegistry(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        with open(os.path.join(self.directory.name, "enemies.json"), "w") as file_object:
+            json.dump([{"name": "Rat", "max_hp": 10, "current_hp": 10, "level": 1,
+                        "item": {"type": "armour", "name": "Fur", "rarity": 1}}], file_object)
+        self.registry = ContentRegistry(self.directory.name)
+
+    def test_pack_is_parsed_once(self):
+        records = self.registry.pack("enemies")
+        os.remove(os.path.join(self.directory.name, "enemies.json"))
+
+        self.assertIs(records, self.registry.pack("enemies"))
+
+    def test_records_are_read_only(self):
+        record = self.registry.enemy(0)
+
+        with self.assertRaises(TypeError):
+            record["level"] = 3
+        with self.assertRaises(TypeError):
+            record["item"]["rarity"] = 3
+
+    def test_enemy_accepts_record(self):
+        self.assertIsInstance(Enemy(self.registry.enemy(0)), Enemy)
+
+    def test_enemy_template_is_created_once(self):
+        template = self.registry.enemy_template(0)
+
+        self.assertIs(template, self.registry.enemy_template(0))
+        self.assertEqual(("Rat", 10, 1), (template.name, template.starting_hp, template.level))
+
+    def test_report(self):
+        self.assertEqual([], self.registry.report())
+        self.registry.pack("enemies")
+
+        ((name, count, parse_time),) = self.registry.report()
+        self.assertEqual(("enemies", 1), (name, count))
+        self.assertGreaterEqual(parse_time, 0)
+
+    def test_unknown_pack(self):
+        with self.assertRaises(KeyError):
+            self.registry.pack("dragons")
+
+    def test_shared_registry_resolves_package_paths(self):
+        registry = ContentRegistry.shared()
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        try:
+            self.assertIs(registry, ContentRegistry.shared())
+            self.assertEqual(26, len(registry.pack("riddles")))
+        finally:
+            os.chdir(cwd)
+
+    def test_thaw_restores_plain_data(self):
+        self.assertEqual({"options": ["a"], "item": {"rarity": 1}},
+                         ContentRegistry.thaw(ContentRegistry.freeze({"options": ["a"], "item": {"rarity": 1}})))
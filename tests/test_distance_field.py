@@ -0,0 +1,67 @@
+import random
+from unittest import TestCase
+
+from board import Board
+from grid import Grid
+from pathfinding import DistanceField
+
+
+class TestDistanceField(TestCase):
+    def test_single_target_distances(self):
+        field = DistanceField(Grid(10, 10, ((10, 11),)), [(10, 11)])
+
+        self.assertEqual(0, field.distance((10, 11)))
+        self.assertEqual(1, field.distance((10, 10)))
+        self.assertEqual(19, field.distance((1, 1)))
+
+    def test_route_reaches_target(self):
+        grid = Grid(10, 10, ((10, 11),))
+        field = DistanceField(grid, [(10, 11)])
+        route = field.route((1, 1))
+        position = (1, 1)
+
+        for direction in route:
+            position = grid.directions(position)[direction]
+
+        self.assertEqual(19, len(route))
+        self.assertEqual((10, 11), position)
+
+    def test_no_targets(self):
+        field = DistanceField(Grid(5, 5), [])
+
+        self.assertIsNone(field.distance((3, 3)))
+        self.assertEqual([], field.route((3, 3)))
+
+    def test_incremental_updates_match_fresh_field(self):
+        grid = Grid(12, 9, ((12, 10),))
+        targets = set(grid)
+        field = DistanceField(grid, targets)
+        rng = random.Random(3)
+
+        for _ in range(150):
+            coords = rng.choice(sorted(grid))
+            if coords in targets:
+                targets.remove(coords)
+                field.remove_target(coords)
+            else:
+                targets.add(coords)
+                field.add_targets([coords])
+
+            fresh = DistanceField(grid, targets)
+            self.assertEqual(list(fresh.distances), list(field.distances))
+
+    def test_board_keeps_unsolved_field_up_to_date(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=0)
+
+        self.assertEqual(["north"], board.travel_route((1, 1), "unsolved"))
+
+        board.get_board()[(1, 2)]["solved"] = True
+        board.get_board()[(2, 1)]["solved"] = True
+
+        self.assertEqual(2, len(board.travel_route((1, 1), "unsolved")))
+
+    def test_board_travel_to_boss(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=0)
+
+        self.assertEqual(6, len(board.travel_route((1, 1), "boss_1")))
+        self.assertEqual(19, len(board.travel_route((1, 1), "final_boss")))
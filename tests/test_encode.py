@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from renderer import Renderer
+
+
+class TestEncode(TestCase):
+    def test_encode_merges_same_color_cells(self):
+        frame = Renderer.encode([[(("|?|", "green"),), (("|?|", "green"),), (("---", "green"),)]])
+
+        self.assertEqual("\033[92m|?||?|---\033[0m\n", frame)
+
+    def test_encode_switches_color_only_when_needed(self):
+        frame = Renderer.encode([[(("|", "green"), ("X", "red"), ("|", "green"))], [(("|?|", "green"),)]])
+
+        self.assertEqual("\033[92m|\033[91mX\033[92m|\n|?|\033[0m\n", frame)
+
+    def test_encode_empty_frame(self):
+        self.assertEqual("", Renderer.encode([]))
+
+    def test_write_frame_single_call(self):
+        class Stream:
+            def __init__(self):
+                self.calls = []
+
+            def write(self, text):
+                self.calls.append(text)
+
+        stream = Stream()
+        Renderer.write_frame([[(("| |", "green"),)]], stream)
+
+        self.assertEqual(["\n\033[92m| |\033[0m\n"], stream.calls)
@@ -0,0 +1,52 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import Board
+from character import Character
+from enemies import Encounter, Enemy, EnemyTemplate
+from sampler import RoomSampler
+
+RAT = {"name": "Rat", "max_hp": 30, "current_hp": 30, "level": 1,
+       "item": {"type": "armour", "name": "Fur", "rarity": 1}}
+
+
+class TestEnemyTemplate(TestCase):
+    def test_template_is_immutable(self):
+        template = EnemyTemplate(RAT)
+
+        with self.assertRaises(AttributeError):
+            template.max_hp = 1
+        with self.assertRaises(AttributeError):
+            template.current_hp = 1
+        with self.assertRaises(TypeError):
+            template.item["rarity"] = 9
+
+    def test_template_has_no_dict(self):
+        self.assertFalse(hasattr(EnemyTemplate(RAT), "__dict__"))
+        self.assertFalse(hasattr(Enemy(RAT), "__dict__"))
+
+    def test_encounters_are_independent(self):
+        template = EnemyTemplate(RAT)
+        first, second = Encounter(template), Encounter(template)
+        first.current_hp = 0
+
+        self.assertEqual(30, second.current_hp)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", return_value="1")
+    def test_every_fight_starts_from_the_template(self, _, __):
+        enemy = Enemy(RAT)
+        first, second = Character("First"), Character("Second")
+
+        self.assertTrue(enemy.fight(first))
+        self.assertTrue(enemy.fight(second))
+        self.assertEqual(first.get_current_hp(), second.get_current_hp())
+        self.assertEqual(30, enemy.get_template().starting_hp)
+
+    def test_rooms_share_one_template(self):
+        board = Board(20, 20, (15, 15), (18, 18), seed=3, room_sampler=RoomSampler({"enemy": 1}, ()))
+        templates = {board.get_board()[(x, 2)]["action"].__self__.get_template() for x in range(1, 21)}
+
+        self.assertLessEqual(len(templates), 12)
+        self.assertEqual(len(templates), len({template.name for template in templates}))
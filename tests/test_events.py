@@ -0,0 +1,101 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from character import Character
+from enemies import Enemy, RoyalMageAngelozzi
+from events import EventAggregator, EventBus, EventRing, FightEnded, FightStarted, Fled, LootDropped, RoundFought, \
+    XpGained
+from pacing import HeadlessPacer, Pacer
+from riddle import Riddle
+
+
+class TestEvents(TestCase):
+    def setUp(self):
+        self.bus = EventBus.shared()
+        self.ring = EventRing(64)
+        self.bus.subscribe(self.ring)
+
+    def tearDown(self):
+        self.bus.unsubscribe(self.ring)
+
+    def test_bus_is_active_only_with_subscribers(self):
+        bus = EventBus()
+        ring = EventRing()
+
+        self.assertFalse(bus.active)
+        bus.subscribe(ring)
+        self.assertTrue(bus.active)
+        bus.unsubscribe(ring)
+        self.assertFalse(bus.active)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", return_value="1")
+    def test_fight_emits_every_round(self, _, __):
+        enemy = Enemy({"name": "Rat", "max_hp": 100, "current_hp": 100, "level": 1,
+                       "item": {"type": "armour", "name": "Fur", "rarity": 1}})
+
+        self.assertTrue(enemy.fight(Character("Fought")))
+
+        events = self.ring.events()
+        self.assertEqual(FightStarted("Rat", 1, 1, False), events[0])
+        self.assertEqual([RoundFought("Rat", number, 20, 12, 100 - 12 * number, 100 - 20 * number)
+                          for number in range(1, 6)], events[1:6])
+        self.assertEqual(("Rat", True, 5), events[6][:3])
+        self.assertIsInstance(events[6], FightEnded)
+        self.assertEqual([XpGained("fight", 15, 1), LootDropped("Rat", "armour", "Fur", 1)], events[7:])
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_subscribing_during_a_fight_skips_the_rest_of_it(self, _):
+        enemy = Enemy({"name": "Rat", "max_hp": 100, "current_hp": 100, "level": 1, "item": None})
+        self.bus.unsubscribe(self.ring)
+
+        def subscribe_and_answer(prompt=""):
+            if not self.bus.active:
+                self.bus.subscribe(self.ring)
+            return "1"
+
+        with patch("builtins.input", side_effect=subscribe_and_answer):
+            self.assertTrue(enemy.fight(Character("Fought")))
+
+        self.assertEqual([XpGained("fight", 15, 1)], self.ring.events())
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", return_value="1")
+    def test_auto_resolve_emits_the_same_rounds(self, _, __):
+        record = {"name": "Knight", "max_hp": 125, "current_hp": 125, "level": 2, "item": None}
+
+        Enemy(record).fight(Character("Fought"))
+        fought = [event for event in self.ring.events() if type(event) is RoundFought]
+        self.ring.buffer.clear()
+        Enemy(record).auto_resolve(Character("Resolved"))
+        resolved = [event for event in self.ring.events() if type(event) is RoundFought]
+
+        self.assertEqual(fought, resolved)
+        self.assertTrue(self.ring.events()[0].resolved)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", return_value="2")
+    def test_fleeing_is_emitted(self, _, __):
+        RoyalMageAngelozzi().battle(Character("Coward"))
+
+        self.assertEqual([Fled("Royal Battle-Mage Angelozzi", 7, 1)], self.ring.events())
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", side_effect=["2", "1", "2"])
+    def test_riddles_are_aggregated(self, *_):
+        aggregator = EventAggregator()
+        self.bus.subscribe(aggregator)
+        riddle = Riddle({"question": "?", "options": ["yes", "no"], "answer": "yes", "ability": None})
+        character = Character("Riddled")
+
+        try:
+            with Pacer.use(HeadlessPacer()):
+                riddle.tell(character)
+                riddle.tell(character)
+        finally:
+            self.bus.unsubscribe(aggregator)
+
+        summary = aggregator.summary()
+        self.assertEqual((2, 1), (summary["riddles"], summary["riddles_correct"]))
+        self.assertEqual({"riddle": 15}, summary["xp"])
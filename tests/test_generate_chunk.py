@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from board import Board
+from grid import Grid
+
+
+class TestGenerateChunk(TestCase):
+    def test_new_board_only_materializes_start_chunk(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=1)
+
+        self.assertEqual([(0, 0)], list(board.grid.chunks))
+
+    def test_touching_a_room_materializes_its_chunk(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=1)
+        board.get_board()[(500, 500)]["description"]
+
+        self.assertTrue(board.grid.is_materialized((500, 500)))
+        self.assertFalse(board.grid.is_materialized((900, 900)))
+
+    def test_solved_query_does_not_materialize(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=1)
+
+        self.assertFalse(board.get_board()[(900, 900)]["solved"])
+        self.assertFalse(board.grid.is_materialized((900, 900)))
+
+    def test_same_seed_same_rooms_in_any_order(self):
+        board = Board(100, 100, (4, 4), (7, 7), seed=42)
+        other_board = Board(100, 100, (4, 4), (7, 7), seed=42)
+        other_board.get_board()[(90, 90)]["description"]
+
+        for coords in ((90, 90), (50, 2), (3, 3)):
+            chunk = board.grid.chunk(coords)
+            other_chunk = other_board.grid.chunk(coords)
+            offset = Grid.chunk_offset(coords)
+
+            self.assertEqual(chunk.descriptions[offset], other_chunk.descriptions[offset])
+            self.assertEqual(chunk.actions[offset], other_chunk.actions[offset])
+
+    def test_special_rooms(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=1)
+
+        self.assertEqual(board.boss_1.battle, board.get_board()[(4, 4)]["action"])
+        self.assertEqual(board.boss_2.battle, board.get_board()[(7, 7)]["action"])
+        self.assertEqual(board.final_boss.battle, board.get_board()[(10, 11)]["action"])
+        self.assertIsNone(board.get_board()[(1, 1)]["action"])
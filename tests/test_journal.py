@@ -0,0 +1,108 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from board import Board
+from bot import Bot, GreedyExplorer
+from character import Character
+from console import MemoryConsole
+from game import Game
+from journal import Journal
+from pacing import HeadlessPacer
+from replay import Replay
+
+
+class TurnMarkingExplorer(GreedyExplorer):
+    def __init__(self, bot_inputs):
+        super().__init__()
+        self.bot_inputs = bot_inputs
+        self.turns = []
+
+    def move(self, menu):
+        self.turns.append(len(self.bot_inputs()))
+        return super().move(menu)
+
+
+class CrashingJournal(Journal):
+    def close(self, delete=False):
+        self.file.flush()
+
+
+def bot_game(seed, turns=300):
+    bot = Bot(GreedyExplorer(), max_turns=turns)
+    strategy = bot.strategy = TurnMarkingExplorer(lambda: bot.inputs)
+    bot.play(seed)
+    return bot.inputs, strategy.turns
+
+
+def play(inputs, seed=None, journal=None):
+    return Game.play(seed=seed, pacer=HeadlessPacer(), console=MemoryConsole(inputs, record=False), journal=journal)
+
+
+class TestJournal(TestCase):
+    def setUp(self):
+        self.path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "save")
+
+    def test_resumed_games_end_like_uninterrupted_games(self):
+        for seed in range(3):
+            inputs, turns = bot_game(seed)
+            expected = Replay.final_stats(play(inputs, seed))
+
+            for turn in turns[1::20]:
+                with self.subTest(seed=seed, turn=turn):
+                    path = f"{self.path}_{seed}_{turn}"
+                    play(inputs[:turn], seed, Journal(path, snapshot_every=8))
+                    result = play(inputs[turn:], journal=Journal(path, snapshot_every=8))
+
+                    self.assertEqual(expected, Replay.final_stats(result))
+
+    def test_a_crash_loses_nothing_but_the_turn_in_progress(self):
+        inputs, turns = bot_game(1)
+        crashed = CrashingJournal(self.path, snapshot_every=16)
+
+        result = play(inputs[:turns[-1]], 1, crashed)
+        board, character = Journal(self.path).resume()
+
+        self.assertEqual(result.character.get_state(), character.get_state())
+        self.assertEqual(result.board.grid.dump_progress(), board.grid.dump_progress())
+        self.assertEqual(result.board.progress(), board.progress())
+
+    def test_the_journal_starts_over_after_every_snapshot(self):
+        inputs, turns = bot_game(2, turns=1000)
+        crashed = CrashingJournal(self.path, snapshot_every=16)
+
+        play(inputs, 2, crashed)
+        tail = list(Journal(self.path).tail())
+
+        self.assertGreater(crashed.snapshots, crashed.sequence // 64)
+        self.assertEqual(crashed.since_snapshot, len(tail))
+        self.assertEqual(list(range(crashed.sequence - len(tail) + 1, crashed.sequence + 1)),
+                         [entry[0] for entry in tail])
+
+    def test_an_entry_cut_short_by_a_crash_is_ignored(self):
+        board, character = Board(5, 5, (2, 2), (4, 4)), Character("Hero")
+        journal = Journal(self.path)
+        journal.start(board, character)
+        character.move("north", board)
+        journal.moved(character.get_position())
+        journal.commit()
+        with open(journal.journal_path, "a", encoding="utf-8") as file:
+            file.write('[2,"m",1,')
+
+        board, character = Journal(self.path).resume()
+
+        self.assertEqual((1, 2), character.get_position())
+        self.assertTrue(board.grid.visited[board.grid.index((1, 2))])
+
+    def test_closing_a_completed_game_deletes_the_save(self):
+        journal = Journal(self.path)
+        journal.start(Board(5, 5, (2, 2), (4, 4)), Character("Hero"))
+
+        journal.close(delete=True)
+
+        self.assertFalse(journal.exists())
+        self.assertFalse(os.path.exists(journal.journal_path))
+
+    def test_a_missing_save_cannot_be_resumed(self):
+        with self.assertRaises(ValueError):
+            Journal(self.path).resume()
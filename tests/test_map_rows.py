@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from board import Board
+
+
+class TestMapRows(TestCase):
+    def test_whole_map(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=0)
+        rows = board.map_rows((1, 1))
+
+        self.assertEqual(12, len(rows))
+        self.assertTrue(all(len(row) == 10 for row in rows))
+
+    def test_viewport_size_does_not_depend_on_board_size(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=0)
+        rows = board.map_rows((500, 500), (21, 11))
+
+        self.assertEqual(11, len(rows))
+        self.assertTrue(all(len(row) == 21 for row in rows))
+
+    def test_viewport_centered_on_player(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=0)
+        rows = board.map_rows((500, 500), (21, 11))
+
+        self.assertIs(Board.PLAYER_CELL, rows[5][10])
+
+    def test_viewport_shifts_to_stay_on_map(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=0)
+        rows = board.map_rows((1, 1), (5, 5))
+
+        self.assertIs(Board.PLAYER_CELL, rows[3][0])
+        self.assertIs(Board.VISITED_CELL, rows[4][0])
+        self.assertIs(Board.BORDER_CELL, rows[4][1])
+
+    def test_viewport_larger_than_board(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=0)
+
+        self.assertEqual(board.map_rows((1, 1)), board.map_rows((1, 1), (50, 50)))
+
+    def test_minimap(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=0)
+        rows = board.minimap_rows((500, 500), (20, 10))
+
+        self.assertEqual(12, len(rows))
+        self.assertTrue(all(len(row) == 22 for row in rows))
+        self.assertIs(Board.MINIMAP_PLAYER_CELL, rows[6][10])
+        self.assertIs(Board.MINIMAP_FINAL_BOSS_CELL, rows[1][20])
+        self.assertIs(Board.MINIMAP_BOSS_CELL, rows[10][1])
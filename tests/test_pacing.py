@@ -0,0 +1,152 @@
+import asyncio
+import io
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from character import Character
+from pacing import Beat, ClientPacer, HeadlessPacer, Pacer, RealTimePacer
+from riddle import Riddle
+from story import Story
+
+
+class TestPacing(TestCase):
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("time.sleep", side_effect=AssertionError("the story slept"))
+    def test_headless_story_never_sleeps(self, _, stdout):
+        with Pacer.use(HeadlessPacer()):
+            Story.opening_dialogue()
+            Story.cell_description()
+            Story.game_completed()
+
+        self.assertIn("You won the game!", stdout.getvalue())
+
+    @patch("threading.Event.wait")
+    def test_real_time_pauses_are_scaled(self, wait):
+        RealTimePacer(0.5).play((Beat("a", None, 4), Beat("b", None, 0)), lambda beat: None)
+
+        wait.assert_called_once_with(2.0)
+
+    def test_interrupted_pacers_stop_pausing(self):
+        pacer = RealTimePacer()
+        threading.Timer(0.1, pacer.interrupt).start()
+
+        start = time.perf_counter()
+        pacer.play((Beat("a", None, 30), Beat("b", None, 30)), lambda beat: None)
+
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_use_restores_previous_pacer(self):
+        outer, inner = HeadlessPacer(), HeadlessPacer()
+
+        with Pacer.use(outer):
+            with Pacer.use(inner):
+                self.assertIs(inner, Pacer.current())
+            self.assertIs(outer, Pacer.current())
+        self.assertIsInstance(Pacer.current(), RealTimePacer)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", side_effect=["1", "2"])
+    def test_riddle_pauses_with_current_pacer(self, _, __):
+        pauses = []
+        pacer = ClientPacer(pauses.append)
+        riddle = Riddle({"question": "?", "options": ["yes", "no"], "answer": "yes", "ability": None})
+
+        with Pacer.use(pacer):
+            self.assertTrue(riddle.tell(Character("Paced")))
+
+        self.assertEqual([3, 1], pauses)
+
+    def test_client_pacer_waits_for_advance(self):
+        pacer = ClientPacer(timeout=5)
+        shown = []
+        session = threading.Thread(target=pacer.play, args=((Beat("a", None, 9), Beat("b", None, 0)), shown.append))
+
+        session.start()
+        time.sleep(0.05)
+        self.assertEqual(["a"], [beat.text for beat in shown])
+        pacer.advance()
+        session.join(5)
+
+        self.assertEqual(["a", "b"], [beat.text for beat in shown])
+
+    def test_client_pacer_times_out(self):
+        start = time.perf_counter()
+
+        ClientPacer(timeout=0.01).pause(9)
+
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_sessions_pause_at_the_same_time(self):
+        pacer = RealTimePacer(0.001)
+        story_seconds = sum(beat.delay for beat in Story.OPENING) * pacer.scale
+        sessions = [threading.Thread(target=pacer.play, args=(Story.OPENING, lambda beat: None)) for _ in range(100)]
+
+        start = time.perf_counter()
+        for session in sessions:
+            session.start()
+        for session in sessions:
+            session.join()
+
+        self.assertLess(time.perf_counter() - start, story_seconds * 50)
+
+    def test_client_pacer_advance_ends_an_awaited_pause(self):
+        pacer = ClientPacer(timeout=5)
+        shown = []
+
+        async def play():
+            task = asyncio.create_task(pacer.perform((Beat("a", None, 9), Beat("b", None, 0)), shown.append))
+            await asyncio.sleep(0.01)
+            self.assertEqual(["a"], [beat.text for beat in shown])
+            threading.Thread(target=pacer.advance).start()
+            await task
+
+        asyncio.run(play())
+        self.assertEqual(["a", "b"], [beat.text for beat in shown])
+
+    def test_client_pacer_awaited_pause_times_out(self):
+        start = time.perf_counter()
+
+        asyncio.run(ClientPacer(timeout=0.01).wait(9))
+
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_interrupt_ends_awaited_pauses(self):
+        pacer = ClientPacer()
+
+        async def play():
+            task = asyncio.create_task(pacer.wait(9))
+            await asyncio.sleep(0.01)
+            pacer.interrupt()
+            await asyncio.wait_for(task, 5)
+
+        asyncio.run(play())
+        self.assertEqual([], pacer.waiters)
+
+    def test_client_pacer_awaits_its_request_in_an_executor(self):
+        requests = []
+
+        asyncio.run(ClientPacer(requests.append).wait(3))
+
+        self.assertEqual([3], requests)
+
+    def test_sessions_share_one_event_loop(self):
+        pacer = RealTimePacer(0.001)
+        story_seconds = sum(beat.delay for beat in Story.OPENING) * pacer.scale
+
+        async def play(sessions):
+            await asyncio.gather(*(pacer.perform(Story.OPENING, lambda beat: None) for _ in range(sessions)))
+
+        start = time.perf_counter()
+        asyncio.run(play(500))
+
+        self.assertLess(time.perf_counter() - start, story_seconds * 50)
+
+    def test_pacers_must_pause_and_wait(self):
+        class Blocking(Pacer):
+            def pause(self, seconds):
+                pass
+
+        with self.assertRaises(TypeError):
+            Blocking()
@@ -0,0 +1,74 @@
+import io
+import os
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import Board
+from console import Console, MemoryConsole, TerminalConsole
+from helpers import Helpers
+from renderer import Renderer
+
+
+class TtyStringIO(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestPlainOutput(TestCase):
+    def test_map_rows_match_map_cell(self):
+        board = Board(40, 70, (13, 21), (50, 33), seed=3)
+        rng = random.Random(0)
+        for _ in range(400):
+            board.get_board()[(rng.randint(1, 70), rng.randint(1, 40))]["solved"] = True
+        board.get_board()[board.boss_1_coords]["solved"] = True
+
+        for player_coords in ((1, 1), (13, 21), (70, 40), (35, 20)):
+            for viewport in (None, (21, 11), (5, 50), (100, 3)):
+                rows = board.map_rows(player_coords, viewport)
+                expected = [[board.map_cell((x_coord, y_coord), player_coords) for x_coord in range(1, 71)]
+                            for y_coord in range(41, -1, -1)]
+                height, width = len(rows), len(rows[0])
+                windows = [[row[left:left + width] for row in expected[top:top + height]]
+                           for top in range(len(expected) - height + 1) for left in range(70 - width + 1)]
+
+                self.assertIn(rows, windows)
+                self.assertIn(Board.PLAYER_CELL, [cell for row in rows for cell in row])
+
+    def test_plain_console_drops_escapes(self):
+        console = MemoryConsole(color=False)
+
+        with Console.use(console):
+            Helpers.print_in_color("Hello", "cyan")
+            Renderer.write_frame([[(("|", "green"), ("#", "purple"))]])
+
+        self.assertEqual("Hello\n\n|#\n", console.output())
+
+    def test_colors_are_unchanged(self):
+        console = MemoryConsole()
+
+        with Console.use(console):
+            Helpers.print_in_color("Hello", "Cyan", end="")
+
+        self.assertEqual("\033[96mHello\033[0m", console.output())
+
+    def test_terminal_is_plain_when_not_a_tty(self):
+        with patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(TerminalConsole().color)
+
+    def test_terminal_honors_no_color(self):
+        with patch("sys.stdout", new_callable=TtyStringIO):
+            with patch.dict(os.environ, {"NO_COLOR": "1"}):
+                self.assertFalse(TerminalConsole().color)
+            with patch.dict(os.environ, {"NO_COLOR": ""}):
+                self.assertTrue(TerminalConsole().color)
+
+    @patch("builtins.input", return_value="north")
+    def test_terminal_output_is_written_at_prompts(self, _):
+        console = TerminalConsole()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, Console.use(console):
+            Helpers.print_plain("Where to?")
+            self.assertEqual("", stdout.getvalue())
+            self.assertEqual("north", Helpers.read_line("> "))
+            self.assertEqual("Where to?\n> ", stdout.getvalue())
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from board import Board
+from grid import Bitset
+
+
+class TestProgress(TestCase):
+    def test_bitset_keeps_running_count(self):
+        bits = Bitset(100)
+        bits[3] = True
+        bits[64] = True
+        bits[3] = True
+        bits[99] = True
+        bits[64] = False
+
+        self.assertEqual(2, bits.count)
+        self.assertEqual([3, 99], list(bits.indices()))
+
+    def test_bitset_count_range(self):
+        bits = Bitset(200)
+        for index in range(0, 200, 3):
+            bits[index] = True
+
+        self.assertEqual(sum(1 for index in range(7, 150) if index % 3 == 0), bits.count_range(7, 150))
+
+    def test_new_board_progress(self):
+        board = Board(1000, 1000, (4, 4), (7, 7), seed=1)
+
+        self.assertEqual((1, 1000 * 1000 + 1), board.progress())
+
+    def test_progress_follows_solved_rooms(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=1)
+        board.get_board()[(2, 1)]["solved"] = True
+        board.get_board()[(10, 10)]["solved"] = True
+        board.get_board()[(10, 10)]["solved"] = True
+        board.get_board()[(2, 1)]["solved"] = False
+
+        self.assertEqual((2, 101), board.progress())
+
+    def test_region_progress(self):
+        board = Board(100, 100, (4, 4), (7, 7), seed=1)
+        for coords in ((5, 5), (6, 7), (40, 40), (6, 8)):
+            board.set_solved(coords, True)
+
+        self.assertEqual((3, 16), board.region_progress((3, 5), (6, 8)))
+        self.assertEqual((5, 10000), board.region_progress((0, 0), (200, 200)))
+
+    def test_chunk_progress(self):
+        board = Board(100, 100, (4, 4), (7, 7), seed=1)
+        board.set_solved((33, 1), True)
+        board.set_solved((40, 20), True)
+
+        self.assertEqual((2, 1024), board.grid.chunk_progress((1, 0)))
+        self.assertEqual((0, 4 * 32), board.grid.chunk_progress((3, 0)))
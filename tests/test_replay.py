@@ -0,0 +1,48 @@
+import glob
+import io
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from replay import Replay
+
+REPLAYS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.dirname(__file__)), "replays", "*.json")))
+
+
+class TestReplay(TestCase):
+    def test_replays_end_in_their_expected_state(self):
+        self.assertTrue(REPLAYS)
+        for path in REPLAYS:
+            with self.subTest(path=os.path.basename(path)):
+                replay = Replay.load(path)
+                result = replay.run()
+
+                self.assertEqual(replay.expected, result.stats)
+                self.assertEqual(len(replay.inputs), result.turns)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("time.sleep", side_effect=AssertionError("the replay slept"))
+    def test_replays_never_sleep_or_print(self, _, stdout):
+        for path in REPLAYS:
+            Replay.load(path).run()
+
+        self.assertEqual("", stdout.getvalue())
+
+    def test_show_stats_is_plain_text(self):
+        stats = Replay(["Hero", "q"], seed=1).show_stats()
+
+        self.assertIn("Hero", stats)
+        self.assertIn("Rooms Cleared", stats)
+        self.assertNotIn("\033[", stats)
+
+    def test_replays_survive_a_round_trip(self):
+        replay = Replay(["Hero", "2", "s", "q"], seed=3, rows=12, columns=8)
+        replay.expected = replay.run().stats
+        path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "replay.json")
+
+        replay.save(path)
+        loaded = Replay.load(path)
+
+        self.assertEqual((replay.inputs, 3, 12, 8), (loaded.inputs, loaded.seed, loaded.rows, loaded.columns))
+        self.assertEqual(replay.expected, loaded.run().stats)
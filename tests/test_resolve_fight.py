@@ -0,0 +1,67 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from character import Character
+from combat import CharacterStats, Combat, EnemyStats
+from enemies import Enemy
+
+
+def fight_round_by_round(character_stats, enemy_stats):
+    character_hp, enemy_hp, rounds = character_stats.hp, enemy_stats.hp, 0
+    given = round(character_stats.damage * character_stats.level * (1 + (0.2 * character_stats.staff_rarity)))
+    taken = 10 * (1 + (0.2 * enemy_stats.level))
+
+    while character_hp > 0 and enemy_hp > 0:
+        enemy_hp = max(0, enemy_hp - given)
+        character_hp = max(0, round(character_hp - taken))
+        rounds += 1
+
+    return enemy_hp <= 0 < character_hp, rounds, character_hp, enemy_hp
+
+
+class TestResolveFight(TestCase):
+    def test_matches_round_by_round_fight(self):
+        for hp in (1, 12, 13, 50, 100, 175):
+            for damage in (0, 7, 20):
+                for level in (1, 2, 3):
+                    for rarity in (0, 1, 5):
+                        for enemy_hp in (0, 1, 100, 450):
+                            for enemy_level in (1, 4, 7):
+                                character_stats = CharacterStats(hp, damage, level, rarity)
+                                enemy_stats = EnemyStats(enemy_hp, enemy_level)
+                                outcome = Combat.resolve_fight(character_stats, enemy_stats)
+
+                                self.assertEqual(fight_round_by_round(character_stats, enemy_stats),
+                                                 (outcome.won, outcome.rounds, outcome.character_hp,
+                                                  outcome.enemy_hp))
+
+    def test_dead_character_loses_without_fighting(self):
+        outcome = Combat.resolve_fight(CharacterStats(0, 20, 1, 0), EnemyStats(100, 1))
+
+        self.assertEqual((False, 0), (outcome.won, outcome.rounds))
+
+    def test_endless_fight_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Combat.resolve_fight(CharacterStats(100, 0, 1, 0), EnemyStats(100, -5))
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", side_effect=["3"])
+    def test_auto_resolve_battle_option(self, _, __):
+        character = Character("Auto")
+        enemy = Enemy({"name": "Rat", "max_hp": 100, "current_hp": 100, "level": 1,
+                       "item": {"type": "armour", "name": "Fur", "rarity": 1}})
+
+        self.assertTrue(enemy.battle(character))
+        self.assertEqual(40, character.get_current_hp())
+        self.assertEqual(15, character.get_xp())
+        self.assertEqual({"name": "Fur", "rarity": 1}, character.get_armour())
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    @patch("builtins.input", return_value="1")
+    def test_interactive_fight_matches_auto_resolve(self, _, __):
+        record = {"name": "Knight", "max_hp": 125, "current_hp": 125, "level": 2, "item": None}
+        fought, resolved = Character("Fought"), Character("Resolved")
+
+        self.assertEqual(Enemy(record).fight(fought), Enemy(record).auto_resolve(resolved))
+        self.assertEqual(fought.get_current_hp(), resolved.get_current_hp())
@@ -0,0 +1,66 @@
+import random
+from unittest import TestCase
+
+from board import Board
+from grid import Grid
+from sampler import AliasSampler, RoomSampler
+
+
+class TestRoomSampler(TestCase):
+    def test_alias_sampler_follows_weights(self):
+        sampler = AliasSampler([1, 0, 2, 1])
+        rng = random.Random(1)
+        draws = [sampler.sample(rng) for _ in range(40000)]
+
+        self.assertEqual(0, draws.count(1))
+        self.assertAlmostEqual(0.5, draws.count(2) / len(draws), delta=0.02)
+        self.assertAlmostEqual(0.25, draws.count(3) / len(draws), delta=0.02)
+
+    def test_alias_sampler_rejects_bad_weights(self):
+        for weights in ([], [0, 0], [1, -1]):
+            with self.assertRaises(ValueError):
+                AliasSampler(weights)
+
+    def test_room_sampler_rejects_unknown_room_type(self):
+        with self.assertRaises(ValueError):
+            RoomSampler({"dragon": 1})
+
+    def test_regions_near_bosses(self):
+        sampler = RoomSampler({"empty": 1}, ((3, {"riddle": 1}), (1, {"enemy": 1})))
+        rng = random.Random(0)
+
+        self.assertEqual(["enemy", "enemy", "riddle", "riddle", "empty"],
+                         [sampler.sample(rng, distance) for distance in (0, 1, 2, 3, 4)])
+
+    def test_board_uses_sampler_weights(self):
+        board = Board(60, 60, (50, 50), (55, 55), seed=2, room_sampler=RoomSampler({"riddle": 1}, ()))
+
+        self.assertEqual("Riddle.tell", board.get_board()[(20, 30)]["action"].__qualname__)
+
+    def test_board_mix_does_not_repeat(self):
+        board = Board(200, 200, (150, 150), (190, 190), seed=2, room_sampler=RoomSampler(regions=()))
+        column = [board.grid.chunk((1, y)).actions[Grid.chunk_offset((1, y))] for y in range(2, 200)]
+
+        self.assertNotEqual(column[:97], column[97:194])
+
+    def test_harder_rooms_near_bosses(self):
+        sampler = RoomSampler({"empty": 1}, ((2, {"enemy": 1}),))
+        board = Board(100, 100, (50, 50), (80, 80), seed=2, room_sampler=sampler)
+
+        self.assertEqual("Enemy.battle", board.get_board()[(51, 51)]["action"].__qualname__)
+        self.assertEqual("GenericRooms.empty_room", board.get_board()[(50, 53)]["action"].__qualname__)
+
+    def test_actions_are_created_once(self):
+        board = Board(10, 10, (4, 4), (7, 7), seed=2)
+
+        self.assertEqual(board.get_board()[(5, 5)]["action"], board.get_board()[(5, 5)]["action"])
+        self.assertLessEqual(len(board.generic_actions), 1)
+
+    def test_boards_share_enemy_templates(self):
+        sampler = RoomSampler({"enemy": 1}, ())
+        first = Board(10, 10, (4, 4), (7, 7), seed=2, room_sampler=sampler)
+        second = Board(10, 10, (4, 4), (7, 7), seed=2, room_sampler=sampler)
+
+        self.assertIsNot(first.get_board()[(5, 5)]["action"], second.get_board()[(5, 5)]["action"])
+        self.assertIs(first.get_board()[(5, 5)]["action"].__self__.get_template(),
+                      second.get_board()[(5, 5)]["action"].__self__.get_template())
@@ -0,0 +1,73 @@
+from io import StringIO
+from unittest import TestCase
+
+from board import Board
+from console import MemoryConsole
+from renderer import Renderer, Screen
+
+
+class TestScreenDraw(TestCase):
+    def setUp(self) -> None:
+        self.board = Board(100, 100, (4, 4), (7, 7), seed=0)
+        self.stream = StringIO()
+        self.screen = Screen(self.stream, terminal_lines=200)
+
+    def test_first_draw_is_full_paint(self):
+        self.screen.draw(self.board.map_rows((1, 1)))
+
+        self.assertIn(Screen.CLEAR_SCREEN, self.stream.getvalue())
+        self.assertIn("\033[104;200r", self.stream.getvalue())
+
+    def test_unchanged_frame_writes_nothing(self):
+        self.screen.draw(self.board.map_rows((1, 1)))
+        written = len(self.stream.getvalue())
+        self.screen.draw(self.board.map_rows((1, 1)))
+
+        self.assertEqual(written, len(self.stream.getvalue()))
+
+    def test_move_rewrites_only_changed_cells(self):
+        self.screen.draw(self.board.map_rows((1, 1)))
+        written = len(self.stream.getvalue())
+        self.screen.draw(self.board.map_rows((2, 1)))
+        update = self.stream.getvalue()[written:]
+
+        self.assertLess(len(update), 80)
+        self.assertEqual(1, update.count("H"))
+        self.assertIn("\033[101;1H", update)
+
+    def test_separate_changes_each_get_a_cursor_move(self):
+        self.screen.draw(self.board.map_rows((1, 1)))
+        self.board.get_board()[(50, 50)]["solved"] = True
+        written = len(self.stream.getvalue())
+        self.screen.draw(self.board.map_rows((1, 1)))
+        update = self.stream.getvalue()[written:]
+
+        self.assertEqual("\0337\033[52;148H\033[92m| |\033[0m\0338", update)
+
+    def test_cell_widths(self):
+        self.assertEqual(4, self.screen.cell_width(Board.FINAL_BOSS_CELL))
+        self.assertEqual(3, self.screen.cell_width(Board.BORDER_CELL))
+
+    def test_short_terminal_falls_back_to_plain_frames(self):
+        screen = Screen(self.stream, terminal_lines=20)
+        screen.draw(self.board.map_rows((1, 1)))
+
+        self.assertIsNone(screen.last_frame)
+        self.assertNotIn(Screen.CLEAR_SCREEN, self.stream.getvalue())
+
+    def test_console_without_color_gets_no_color(self):
+        console = MemoryConsole(color=False)
+        screen = Screen(console, terminal_lines=200)
+        screen.draw(self.board.map_rows((1, 1)))
+        self.board.get_board()[(50, 50)]["solved"] = True
+        screen.draw(self.board.map_rows((1, 1)))
+        update = console.chunks[-1]
+
+        self.assertEqual("\0337\033[52;148H| |\0338", update)
+        self.assertFalse(any(code in console.output() for code in [*Renderer.COLORS.values(), Renderer.END_COLOR]))
+
+    def test_short_terminal_without_color_gets_plain_text(self):
+        console = MemoryConsole(color=False)
+        Screen(console, terminal_lines=20).draw(self.board.map_rows((1, 1)))
+
+        self.assertNotIn("\033", console.output())
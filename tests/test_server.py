@@ -0,0 +1,139 @@
+import asyncio
+import time
+from unittest import TestCase
+
+from console import SocketConsole
+from server import GameServer
+
+
+async def connect(server):
+    host, port = server.address()
+    return await asyncio.open_connection(host, port)
+
+
+async def play(server, lines):
+    reader, writer = await connect(server)
+    for line in lines:
+        writer.write(line + b"\r\n")
+    output = await asyncio.wait_for(reader.read(), 10)
+    writer.close()
+    return output
+
+
+class TestServer(TestCase):
+    def test_game_over_tcp(self):
+        async def run():
+            server = GameServer(port=0, pacing="headless", color=False, seed=1)
+            await server.start()
+            output = await play(server, [b"Hero", b"s", b"q"])
+            await server.shutdown()
+            return server, output
+
+        server, output = asyncio.run(run())
+
+        self.assertIn(b"Please enter a name for your character..\r\n", output)
+        self.assertIn(b"Hero", output)
+        self.assertTrue(output.endswith(b"Thanks for playing, we hope you play again sometime :)\r\n"))
+        self.assertNotIn(b"\033[", output)
+        self.assertEqual({"sessions": 0, "peak": 1, "served": 1, "rejected": 0, "timeouts": 0, "errors": 0},
+                         server.stats())
+
+    def test_telnet_commands_are_ignored(self):
+        async def run():
+            server = GameServer(port=0, pacing="headless", color=False, seed=1)
+            await server.start()
+            output = await play(server, [b"\xff\xfd\x03Hero\xff\xf1", b"s", b"q"])
+            await server.shutdown()
+            return output
+
+        output = asyncio.run(run())
+
+        self.assertIn(b"Hero", output)
+        self.assertNotIn("\ufffd".encode(), output)
+
+    def test_sessions_over_the_limit_are_turned_away(self):
+        async def run():
+            server = GameServer(port=0, max_sessions=1, pacing="headless", color=False)
+            await server.start()
+            reader, writer = await connect(server)
+            await reader.readuntil(b"character..\r\n")
+            turned_away = await play(server, [])
+            writer.close()
+            await server.shutdown()
+            return server, turned_away
+
+        server, turned_away = asyncio.run(run())
+
+        self.assertEqual(GameServer.encode(GameServer.FULL_MESSAGE), turned_away)
+        self.assertEqual((1, 1), (server.served, server.rejected))
+
+    def test_idle_players_are_disconnected(self):
+        async def run():
+            server = GameServer(port=0, idle_timeout=0.2, pacing="headless", color=False)
+            await server.start()
+            output = await play(server, [])
+            await server.shutdown()
+            return server, output
+
+        server, output = asyncio.run(run())
+
+        self.assertTrue(output.endswith(GameServer.encode(GameServer.IDLE_MESSAGE)))
+        self.assertEqual(1, server.timeouts)
+
+    def test_shutdown_ends_every_session(self):
+        async def run():
+            server = GameServer(port=0, pacing="real-time")
+            await server.start()
+            clients = [await connect(server) for _ in range(5)]
+            for reader, writer in clients:
+                await reader.readuntil(b"character..")
+            # the first player is in the middle of the long pauses of the opening story
+            clients[0][1].write(b"Hero\r\n")
+            await asyncio.sleep(0.2)
+
+            start = time.perf_counter()
+            await server.shutdown()
+            elapsed = time.perf_counter() - start
+            outputs = [await asyncio.wait_for(reader.read(), 5) for reader, writer in clients]
+            return server, elapsed, outputs
+
+        server, elapsed, outputs = asyncio.run(run())
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(0, len(server.sessions))
+        for output in outputs:
+            self.assertTrue(output.endswith(GameServer.encode(GameServer.SHUTDOWN_MESSAGE)))
+
+    def test_slow_clients_hold_up_their_own_game(self):
+        lines = 10000
+
+        def flood(console):
+            written = 0
+            while written < lines and not console.writer.is_closing():
+                console.write("x" * 1000 + "\n")
+                written += 1
+            return written
+
+        async def run():
+            results = []
+
+            async def handle(reader, writer):
+                writer.transport.set_write_buffer_limits(high=GameServer.WRITE_LIMIT)
+                console = SocketConsole(reader, writer, asyncio.get_running_loop(), timeout=0.3)
+                results.append((console, await asyncio.to_thread(flood, console)))
+                writer.close()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            # the client never reads, so the game thread has to wait for the connection to drain
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            while not results:
+                await asyncio.sleep(0.1)
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return results[0]
+
+        console, written = asyncio.run(run())
+
+        self.assertTrue(console.timed_out)
+        self.assertLess(written, lines)
@@ -0,0 +1,69 @@
+import random
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from combat import CharacterStats, Combat, EnemyStats
+from content import ContentRegistry
+from simulator import Simulator, np
+
+
+@skipIf(np is None, "numpy is not installed")
+class TestSimulator(TestCase):
+    def test_resolve_fights_matches_combat(self):
+        rng = random.Random(4)
+        stats = [(rng.randrange(0, 200), rng.choice((0, 5, 20)), rng.randrange(1, 4), rng.randrange(0, 8),
+                  rng.randrange(0, 500), rng.randrange(1, 8)) for _ in range(2000)]
+        columns = [np.array(column) for column in zip(*stats)]
+
+        won, rounds, character_hp, enemy_hp = Simulator.resolve_fights(*columns)
+
+        for index, (hp, damage, level, rarity, e_hp, e_level) in enumerate(stats):
+            outcome = Combat.resolve_fight(CharacterStats(hp, damage, level, rarity), EnemyStats(e_hp, e_level))
+            self.assertEqual((outcome.won, outcome.rounds, outcome.character_hp, outcome.enemy_hp),
+                             (won[index], rounds[index], character_hp[index], enemy_hp[index]))
+
+    def test_fight_xp_matches_combat(self):
+        enemy_levels, levels = np.meshgrid(np.arange(1, 8), np.arange(1, 4))
+
+        for enemy_level, level, xp in zip(enemy_levels.ravel(), levels.ravel(),
+                                          Simulator.fight_xp(enemy_levels, levels).ravel()):
+            self.assertEqual(Combat.fight_xp(int(enemy_level), int(level)), xp)
+
+    def test_formulas_come_from_combat(self):
+        with patch.object(Combat, "damage_taken", lambda enemy_level: 50 * enemy_level), \
+                patch.object(Combat, "fight_xp", lambda enemy_level, level: 7):
+            won, rounds, character_hp, _ = Simulator.resolve_fights(np.array([100]), 20, 1, 0, np.array([100]), 1)
+            xp = Simulator.fight_xp(np.array([3]), np.array([1]))
+
+        self.assertEqual(([False], [2], [0], [7]), (won.tolist(), rounds.tolist(), character_hp.tolist(),
+                                                    xp.tolist()))
+
+    def test_fight_table(self):
+        enemies = ContentRegistry.shared().pack("enemies")
+        table = Simulator.fight_table(enemies, levels={1: 1}, fights=100, seed=1)
+
+        self.assertEqual(sorted({enemy["level"] for enemy in enemies}), [row.enemy_level for row in table])
+        self.assertEqual(len(enemies) * 100, sum(row.fights for row in table))
+        for row in table:
+            outcomes = [Combat.resolve_fight(CharacterStats(100, 20, 1, 0), EnemyStats(enemy["current_hp"],
+                                                                                        enemy["level"]))
+                        for enemy in enemies if enemy["level"] == row.enemy_level]
+            self.assertAlmostEqual(sum(outcome.won for outcome in outcomes) / len(outcomes), row.win_rate)
+            self.assertAlmostEqual(sum(100 - outcome.character_hp for outcome in outcomes) / len(outcomes),
+                                   row.hp_loss)
+
+    def test_progression_is_seeded(self):
+        enemies = ContentRegistry.shared().pack("enemies")
+        first = Simulator.progression(enemies, runs=200, rooms=30, seed=5)
+        second = Simulator.progression(enemies, runs=200, rooms=30, seed=5)
+
+        self.assertTrue((first.level == second.level).all())
+        self.assertEqual(30, len(first.xp))
+        self.assertTrue(((first.level >= 1) & (first.level <= 3)).all())
+
+    def test_only_empty_rooms_change_nothing(self):
+        run = Simulator.progression(ContentRegistry.shared().pack("enemies"), runs=10, rooms=5,
+                                    room_weights={"empty": 1}, seed=0)
+
+        self.assertEqual([1] * 5, list(run.level))
+        self.assertEqual([100] * 5, list(run.hp))
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from content import ContentRegistry, StreamingPack
+
+
+class TestStreamingPack(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache_directory = os.path.join(self.directory.name, "cache")
+
+        riddles = [{"question": f"Question {index}?", "options": ["Lake", "River"], "answer": "River",
+                    "ability": "Dark Aether"} for index in range(100)]
+        self.json_path = os.path.join(self.directory.name, "riddles.json")
+        self.lines_path = os.path.join(self.directory.name, "riddles.jsonl")
+        with open(self.json_path, "w") as file_object:
+            json.dump(riddles, file_object)
+
+    def open_pack(self):
+        registry = ContentRegistry(self.directory.name, self.cache_directory)
+        pack = registry.pack("riddles")
+        self.addCleanup(pack.close)
+        return registry, pack
+
+    def test_convert_writes_one_record_per_line(self):
+        self.assertEqual(100, StreamingPack.convert(self.json_path, self.lines_path))
+
+        with open(self.lines_path) as file_object:
+            self.assertEqual(100, len(file_object.readlines()))
+
+    def test_registry_prefers_line_delimited_pack(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        registry, pack = self.open_pack()
+
+        self.assertEqual("jsonl", registry.sources["riddles"])
+        self.assertEqual(100, len(pack))
+        self.assertEqual("Question 42?", pack[42]["question"])
+        self.assertEqual(("Lake", "River"), pack[-1]["options"])
+
+    def test_only_read_records_are_parsed(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        _, pack = self.open_pack()
+        pack[:3]
+
+        self.assertEqual(3, len(pack.frozen))
+        self.assertIs(pack[1], pack[1])
+
+    def test_index_is_reused_until_pack_changes(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        self.open_pack()
+        index_path = os.path.join(self.cache_directory, "riddles.jsonl.idx")
+        self.assertTrue(os.path.exists(index_path))
+
+        with open(self.lines_path, "a") as file_object:
+            file_object.write('\n{"question": "Last?", "options": [], "answer": "", "ability": ""}\n')
+        _, pack = self.open_pack()
+
+        self.assertEqual(101, len(pack))
+        self.assertEqual("Last?", pack[100]["question"])
+
+    def test_records_are_read_only(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        _, pack = self.open_pack()
+
+        with self.assertRaises(TypeError):
+            pack[0]["answer"] = "Lake"
+
+    def test_pack_is_converted_again_when_the_json_file_is_newer(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        os.utime(self.lines_path, ns=(1, 1))
+        with open(self.json_path, "w") as file_object:
+            json.dump([{"question": "Newer?", "options": [], "answer": "", "ability": ""}], file_object)
+
+        registry, pack = self.open_pack()
+
+        self.assertEqual("jsonl", registry.sources["riddles"])
+        self.assertEqual(["Newer?"], [riddle["question"] for riddle in pack])
+        with open(self.lines_path) as file_object:
+            self.assertEqual(1, len(file_object.readlines()))
+
+    def test_pack_edited_after_conversion_is_kept(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        os.utime(self.json_path, ns=(1, 1))
+        with open(self.lines_path, "a") as file_object:
+            file_object.write('{"question": "Edited?", "options": [], "answer": "", "ability": ""}\n')
+
+        _, pack = self.open_pack()
+
+        self.assertEqual("Edited?", pack[100]["question"])
+
+    def test_convert_leaves_no_temporary_files(self):
+        StreamingPack.convert(self.json_path, self.lines_path)
+        StreamingPack.convert(self.json_path, self.lines_path)
+
+        self.assertEqual(["riddles.json", "riddles.jsonl"], sorted(os.listdir(self.directory.name)))
@@ -0,0 +1,90 @@
+import asyncio
+from unittest import TestCase
+
+from server import GameServer
+from supervisor import Supervisor
+
+
+async def supervise(test, workers=2):
+    supervisor = Supervisor(workers, port=0, pacing="headless", color=False, seed=1)
+    task = asyncio.create_task(supervisor.serve())
+    while supervisor.listener is None:
+        await asyncio.sleep(0.01)
+
+    try:
+        return await test(supervisor)
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def play(supervisor):
+    reader, writer = await asyncio.open_connection(*supervisor.address())
+    writer.write(b"Hero\r\ns\r\nq\r\n")
+    output = await asyncio.wait_for(reader.read(), 30)
+    writer.close()
+    return output
+
+
+async def idle(supervisor):
+    reader, writer = await asyncio.open_connection(*supervisor.address())
+    await asyncio.wait_for(reader.readuntil(b"character..\r\n"), 30)
+    return reader, writer
+
+
+class TestSupervisor(TestCase):
+    def test_games_are_played_by_the_workers(self):
+        async def test(supervisor):
+            return await asyncio.gather(*(play(supervisor) for _ in range(4))), supervisor.stats()
+
+        outputs, stats = asyncio.run(supervise(test))
+
+        for output in outputs:
+            self.assertTrue(output.endswith(b"Thanks for playing, we hope you play again sometime :)\r\n"))
+        self.assertEqual(4, sum(worker["served"] for worker in stats))
+
+    def test_connections_go_to_the_least_loaded_worker(self):
+        async def test(supervisor):
+            clients = [await idle(supervisor) for _ in range(4)]
+            stats = supervisor.stats()
+            for reader, writer in clients:
+                writer.close()
+            return stats
+
+        stats = asyncio.run(supervise(test))
+
+        self.assertEqual([2, 2], [worker["sessions"] for worker in stats])
+
+    def test_crashed_workers_are_restarted(self):
+        async def test(supervisor):
+            crashed = supervisor.workers[0].process
+            crashed.kill()
+            while supervisor.restarts == 0:
+                await asyncio.sleep(0.05)
+            return crashed.pid, supervisor.stats(), await play(supervisor)
+
+        crashed, stats, output = asyncio.run(supervise(test))
+
+        self.assertNotIn(crashed, [worker["pid"] for worker in stats])
+        self.assertTrue(output.endswith(b"Thanks for playing, we hope you play again sometime :)\r\n"))
+
+    def test_shutdown_ends_the_sessions_and_the_workers(self):
+        async def run():
+            clients = []
+
+            async def test(supervisor):
+                clients.extend([await idle(supervisor) for _ in range(2)])
+                return supervisor
+
+            supervisor = await supervise(test)
+            outputs = [await asyncio.wait_for(reader.read(), 30) for reader, writer in clients]
+            return supervisor, outputs
+
+        supervisor, outputs = asyncio.run(run())
+
+        self.assertEqual([0, 0], [worker.process.exitcode for worker in supervisor.workers])
+        for output in outputs:
+            self.assertTrue(output.endswith(GameServer.encode(GameServer.SHUTDOWN_MESSAGE)))
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from board import Board
+from grid import Grid
+from templates import BoardTemplates
+
+
+class TestTemplates(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_seeded_board_stores_template(self):
+        Board(100, 100, (4, 4), (7, 7), seed=3, templates=BoardTemplates(self.directory.name))
+
+        self.assertEqual(1, len(os.listdir(self.directory.name)))
+
+    def test_cached_board_matches_generated_board(self):
+        Board(100, 100, (4, 4), (7, 7), seed=3, templates=BoardTemplates(self.directory.name))
+        cached = Board(100, 100, (4, 4), (7, 7), seed=3, templates=BoardTemplates(self.directory.name))
+        generated = Board(100, 100, (4, 4), (7, 7), seed=3, templates=BoardTemplates())
+
+        self.assertEqual(generated.grid.chunk((1, 1)).dump(), cached.grid.chunk((1, 1)).dump())
+        for coords in ((2, 1), (50, 50), (100, 100)):
+            self.assertEqual(generated.get_board()[coords]["description"], cached.get_board()[coords]["description"])
+            self.assertEqual(generated.get_board()[coords]["action"].__qualname__,
+                             cached.get_board()[coords]["action"].__qualname__)
+
+    def test_different_layouts_use_different_templates(self):
+        templates = BoardTemplates(self.directory.name)
+        Board(100, 100, (4, 4), (7, 7), seed=3, templates=templates)
+        Board(100, 100, (4, 4), (7, 7), seed=4, templates=templates)
+        Board(50, 100, (4, 4), (7, 7), seed=3, templates=templates)
+
+        self.assertEqual(3, len(os.listdir(self.directory.name)))
+
+    def test_corrupt_template_is_regenerated(self):
+        Board(10, 10, (4, 4), (7, 7), seed=3, templates=BoardTemplates(self.directory.name))
+        (name,) = os.listdir(self.directory.name)
+        with open(os.path.join(self.directory.name, name), "wb") as file_object:
+            file_object.write(b"not a template")
+
+        board = Board(10, 10, (4, 4), (7, 7), seed=3, templates=BoardTemplates(self.directory.name))
+
+        self.assertEqual(Grid.BOSS_1, board.grid.chunk((4, 4)).kinds[Grid.chunk_offset((4, 4))])
+        self.assertEqual(Board(10, 10, (4, 4), (7, 7), seed=3, templates=BoardTemplates()).grid.chunk((1, 1)).dump(),
+                         board.grid.chunk((1, 1)).dump())
+
+    def test_only_the_most_recent_templates_are_kept(self):
+        templates = BoardTemplates(self.directory.name, capacity=2, max_files=3)
+        for seed in range(5):
+            Board(10, 10, (4, 4), (7, 7), seed=seed, templates=templates)
+
+        self.assertEqual(2, len(templates.templates))
+        self.assertEqual(3, len(os.listdir(self.directory.name)))
+
+    def test_threads_storing_the_same_template_do_not_collide(self):
+        templates = BoardTemplates(self.directory.name)
+        start_chunk = Board(10, 10, (4, 4), (7, 7)).grid.chunk((1, 1)).dump()
+        template = {"format": BoardTemplates.FORMAT, "start_chunk": start_chunk}
+        threads = [threading.Thread(target=templates.store, args=("same", template)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["same.bin"], os.listdir(self.directory.name))
+        self.assertEqual(template, BoardTemplates(self.directory.name).load("same"))
+
+    def test_the_default_cache_stays_in_memory(self):
+        self.assertIsNone(Board.TEMPLATES.directory)